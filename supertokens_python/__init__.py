@@ -19,13 +19,21 @@ from typing_extensions import Literal
 from supertokens_python.framework.request import BaseRequest
 from supertokens_python.types import RecipeUserId
 
-from . import supertokens
+from . import core_call_cache, core_call_tracing, http_client, supertokens
 from .recipe_module import RecipeModule
 
 InputAppInfo = supertokens.InputAppInfo
 Supertokens = supertokens.Supertokens
 SupertokensConfig = supertokens.SupertokensConfig
 AppInfo = supertokens.AppInfo
+HttpClientConfig = http_client.HttpClientConfig
+SharedCoreCallCacheConfig = core_call_cache.SharedCoreCallCacheConfig
+CoreCallCachePathConfig = core_call_cache.CoreCallCachePathConfig
+CoreCallCacheBackend = core_call_cache.CoreCallCacheBackend
+CoreCallTracingConfig = core_call_tracing.CoreCallTracingConfig
+CoreCallRecord = core_call_tracing.CoreCallRecord
+CoreCallTrace = core_call_tracing.CoreCallTrace
+CoreCallBudgetExceededError = core_call_tracing.CoreCallBudgetExceededError
 
 
 def init(
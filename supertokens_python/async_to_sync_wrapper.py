@@ -13,7 +13,9 @@
 # under the License.
 
 import asyncio
-from typing import Any, Coroutine, TypeVar
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Coroutine, Optional, TypeVar
 from os import getenv
 
 _T = TypeVar("_T")
@@ -40,6 +42,105 @@ def create_or_get_event_loop() -> asyncio.AbstractEventLoop:
         raise ex
 
 
+class BackgroundEventLoop:
+    """
+    A single event loop running on a daemon thread, used by sync() instead of the
+    per thread loops when enabled. Every worker thread then shares the same pooled
+    HTTP clients, JWKS fetches and caches (which are all per event loop).
+    """
+
+    def __init__(self, max_in_flight: int, timeout_sec: Optional[float]):
+        self.timeout_sec = timeout_sec
+        self.loop = asyncio.new_event_loop()
+        self.__in_flight = threading.BoundedSemaphore(max_in_flight)
+        self.thread = threading.Thread(
+            target=self.loop.run_forever,
+            name="supertokens-event-loop",
+            daemon=True,
+        )
+        self.thread.start()
+
+    def run(self, co: Coroutine[Any, Any, _T]) -> _T:
+        if not self.__in_flight.acquire(timeout=self.timeout_sec):
+            co.close()
+            raise TimeoutError(
+                "Timed out waiting for the SuperTokens event loop, too many requests are in progress"
+            )
+        try:
+            future = asyncio.run_coroutine_threadsafe(co, self.loop)
+            try:
+                return future.result(self.timeout_sec)
+            except FutureTimeoutError:
+                future.cancel()
+                raise TimeoutError(
+                    "Timed out waiting for the SuperTokens event loop to run the request"
+                )
+        finally:
+            self.__in_flight.release()
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+background_event_loop: Optional[BackgroundEventLoop] = None
+background_event_loop_lock = threading.Lock()
+
+
+def use_background_event_loop(
+    max_in_flight: int = 100, timeout_sec: Optional[float] = None
+):
+    """
+    Makes the sync wrappers (syncio functions, Flask and sync Django middlewares)
+    run all coroutines on one event loop thread per process instead of a loop per
+    thread. This can also be enabled with the SUPERTOKENS_BACKGROUND_EVENT_LOOP=1
+    environment variable.
+
+    max_in_flight bounds how many coroutines can be submitted at once, and
+    timeout_sec bounds how long a caller waits for a slot and then for the result.
+    """
+    global background_event_loop
+    with background_event_loop_lock:
+        if background_event_loop is not None:
+            background_event_loop.stop()
+        background_event_loop = BackgroundEventLoop(max_in_flight, timeout_sec)
+
+
+def get_background_event_loop() -> Optional[BackgroundEventLoop]:
+    global background_event_loop
+    if background_event_loop is None and background_event_loop_enabled():
+        with background_event_loop_lock:
+            if background_event_loop is None:
+                background_event_loop = BackgroundEventLoop(100, None)
+    return background_event_loop
+
+
+def background_event_loop_enabled():
+    return getenv("SUPERTOKENS_BACKGROUND_EVENT_LOOP", "") == "1"
+
+
+def is_in_background_event_loop() -> bool:
+    return (
+        background_event_loop is not None
+        and threading.current_thread() is background_event_loop.thread
+    )
+
+
+# only for testing purposes
+def reset_background_event_loop():
+    global background_event_loop
+    with background_event_loop_lock:
+        if background_event_loop is not None:
+            background_event_loop.stop()
+        background_event_loop = None
+
+
 def sync(co: Coroutine[Any, Any, _T]) -> _T:
+    bridge = get_background_event_loop()
+    # Submitting from the loop's own thread would wait on itself forever
+    if bridge is not None and not is_in_background_event_loop():
+        return bridge.run(co)
+
     loop = create_or_get_event_loop()
     return loop.run_until_complete(co)
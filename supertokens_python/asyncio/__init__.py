@@ -24,6 +24,7 @@ from supertokens_python.interfaces import (
     UserIdMappingAlreadyExistsError,
     UserIDTypes,
 )
+from supertokens_python.querier import Querier
 from supertokens_python.recipe.accountlinking.recipe import AccountLinkingRecipe
 from supertokens_python.recipe.accountlinking.interfaces import GetUsersResult
 from supertokens_python.types import AccountInfo, User
@@ -171,3 +172,9 @@ async def list_users_by_account_info(
         do_union_of_account_info,
         user_context,
     )
+
+
+async def close_core_connections() -> None:
+    # Closes the pooled connections to the core that were opened on the
+    # current event loop. Call this from your app's shutdown hook.
+    await Querier.close_http_client()
@@ -0,0 +1,447 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from hashlib import sha256
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from httpx import Response
+
+from supertokens_python.utils import get_timestamp_ms
+
+# Path prefixes (without the app / tenant id prefix) of the core APIs whose GET
+# responses are tagged, and the family they belong to. Longer prefixes come first.
+CORE_CALL_CACHE_FAMILIES: List[Tuple[str, str]] = [
+    ("/recipe/user/metadata", "usermetadata"),
+    ("/recipe/user/email/verify", "emailverification"),
+    ("/recipe/user/roles", "userroles"),
+    ("/recipe/user/role", "userroles"),
+    ("/recipe/multitenancy", "multitenancy"),
+    ("/recipe/accountlinking", "users"),
+    ("/recipe/permission", "userroles"),
+    ("/recipe/signinup", "users"),
+    ("/recipe/session", "session"),
+    ("/recipe/signup", "users"),
+    ("/recipe/roles", "userroles"),
+    ("/recipe/role", "userroles"),
+    ("/recipe/totp", "totp"),
+    ("/recipe/user", "users"),
+    ("/users", "users"),
+    ("/user", "users"),
+]
+
+# The kinds of resources a write of each family is scoped to. A write that has
+# none of these ids in its body invalidates its whole family. Writes to paths
+# that don't belong to a family here invalidate every cached response.
+CORE_CALL_CACHE_WRITE_SCOPES: Dict[str, Tuple[str, ...]] = {
+    "users": ("user",),
+    "userroles": ("user",),
+    "usermetadata": ("user",),
+    "emailverification": ("user",),
+    "totp": ("user",),
+    "session": ("session", "user"),
+    "multitenancy": ("tenant", "user"),
+}
+
+# Families (other than their own) whose cached responses about the same
+# resources are affected by a scoped write. Deleting or updating a user changes
+# what every family returns for that user.
+CORE_CALL_CACHE_WRITE_AFFECTS: Dict[str, Tuple[str, ...]] = {
+    "users": tuple(CORE_CALL_CACHE_WRITE_SCOPES.keys()),
+    "multitenancy": ("users",),
+    # the login methods of a user say whether they are verified
+    "emailverification": ("users",),
+}
+
+# POST requests that don't change anything in the core.
+CORE_CALL_CACHE_READ_ONLY_WRITES: Set[str] = {
+    "/recipe/signin",
+    "/recipe/session/verify",
+    "/recipe/signinup/code/check",
+    "/recipe/accountlinking/user/link/check",
+    "/recipe/accountlinking/user/primary/check",
+    "/recipe/dashboard/session/verify",
+}
+
+RESOURCE_KEYS: Dict[str, Tuple[str, ...]] = {
+    "user": ("userId", "recipeUserId", "primaryUserId"),
+    "session": ("sessionHandle", "sessionHandles"),
+    "tenant": ("tenantId",),
+}
+
+CORE_PATH_ROOTS = {"recipe", "user", "users", ".well-known", "api", "telemetry"}
+
+# Tag versions are only kept for tags that have been invalidated. Past this many,
+# everything is invalidated at once and the versions start over.
+MAX_TAG_VERSIONS = 10000
+
+
+def split_core_path(path: str) -> Tuple[Optional[str], str]:
+    """
+    Returns the tenant id prefix (if any) and the rest of a core API path.
+    """
+    segments = path.strip("/").split("/")
+    if len(segments) > 0 and segments[0].startswith("appid-"):
+        segments = segments[1:]
+    tenant_id: Optional[str] = None
+    if len(segments) > 1 and segments[0] not in CORE_PATH_ROOTS:
+        tenant_id = segments[0]
+        segments = segments[1:]
+    return tenant_id, "/" + "/".join(segments)
+
+
+def get_core_call_family(path: str) -> Optional[str]:
+    for prefix, family in CORE_CALL_CACHE_FAMILIES:
+        if path == prefix or path.startswith(prefix + "/"):
+            return family
+    return None
+
+
+def get_resource_ids(
+    tenant_id: Optional[str], data: Optional[Dict[str, Any]]
+) -> Dict[str, Set[str]]:
+    result: Dict[str, Set[str]] = {kind: set() for kind in RESOURCE_KEYS}
+    if tenant_id is not None:
+        result["tenant"].add(tenant_id)
+    if data is None:
+        return result
+    for kind, keys in RESOURCE_KEYS.items():
+        for key in keys:
+            value = data.get(key)
+            if isinstance(value, str):
+                result[kind].add(value)
+            elif isinstance(value, list):
+                result[kind].update(v for v in value if isinstance(v, str))  # type: ignore
+    return result
+
+
+def get_read_tags(path: str, params: Optional[Dict[str, Any]]) -> Set[str]:
+    """
+    Tags of a cached GET response: its family, and for each kind of resource
+    either the ids it is about or a wildcard (for listings like GET /users).
+    """
+    tenant_id, path = split_core_path(path)
+    family = get_core_call_family(path)
+    if family is None:
+        return set()
+
+    tags = {family}
+    for kind, ids in get_resource_ids(tenant_id, params).items():
+        if len(ids) == 0:
+            tags.add(f"{family}|{kind}:*")
+        for resource_id in ids:
+            tags.add(f"{family}|{kind}:{resource_id}")
+    return tags
+
+
+def get_response_tags(path: str, body: str) -> Set[str]:
+    """
+    Tags for the users a response about one user also depends on: the recipe
+    users linked to it, which writes can name instead of the primary user id.
+    """
+    _, path = split_core_path(path)
+    if get_core_call_family(path) != "users":
+        return set()
+    try:
+        user = json.loads(body).get("user")
+    except (ValueError, AttributeError):
+        return set()
+    if not isinstance(user, dict):
+        return set()
+    user_ids = {user.get("id")} | {  # type: ignore
+        login_method.get("recipeUserId")  # type: ignore
+        for login_method in user.get("loginMethods", [])  # type: ignore
+        if isinstance(login_method, dict)
+    }
+    return {f"users|user:{user_id}" for user_id in user_ids if isinstance(user_id, str)}
+
+
+def get_write_tags(path: str, body: Optional[Dict[str, Any]]) -> Optional[Set[str]]:
+    """
+    Tags invalidated by a POST / PUT / DELETE request. None means that every
+    cached response has to be invalidated.
+    """
+    tenant_id, path = split_core_path(path)
+    if path in CORE_CALL_CACHE_READ_ONLY_WRITES:
+        return set()
+
+    family = get_core_call_family(path)
+    if family is None or family not in CORE_CALL_CACHE_WRITE_SCOPES:
+        return None
+
+    resource_ids = get_resource_ids(tenant_id, body)
+    scoped_ids = {
+        kind: resource_ids[kind]
+        for kind in CORE_CALL_CACHE_WRITE_SCOPES[family]
+        if len(resource_ids[kind]) > 0
+    }
+    if len(scoped_ids) == 0:
+        return {family}
+
+    tags: Set[str] = set()
+    for affected in (family,) + CORE_CALL_CACHE_WRITE_AFFECTS.get(family, ()):
+        for kind, ids in scoped_ids.items():
+            tags.add(f"{affected}|{kind}:*")
+            for resource_id in ids:
+                tags.add(f"{affected}|{kind}:{resource_id}")
+    return tags
+
+
+class CoreCallCacheTagVersions:
+    """
+    Process wide versions of the tags of cached core responses. A cached response
+    is only used while none of its tags (nor the global version) have changed
+    since it was fetched, so a write only throws away the responses it affects.
+    """
+
+    def __init__(self):
+        self.__global_version = 0
+        self.__versions: Dict[str, int] = {}
+        # Versions can't be compared across processes, so responses in the shared
+        # cache are checked against the time their tags were last invalidated.
+        self.__global_invalidated_at = 0
+        self.__invalidated_at: Dict[str, int] = {}
+        self.__lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def snapshot(self, tags: Iterable[str]) -> Tuple[int, Dict[str, int]]:
+        with self.__lock:
+            return self.__global_version, {
+                tag: self.__versions.get(tag, 0) for tag in tags
+            }
+
+    def is_valid(self, snapshot: Tuple[int, Dict[str, int]]) -> bool:
+        global_version, versions = snapshot
+        if global_version != self.__global_version:
+            return False
+        return all(self.__versions.get(tag, 0) == v for tag, v in versions.items())
+
+    def is_fetched_after_invalidation(
+        self, tags: Iterable[str], fetched_at: int
+    ) -> bool:
+        if fetched_at <= self.__global_invalidated_at:
+            return False
+        return all(fetched_at > self.__invalidated_at.get(tag, 0) for tag in tags)
+
+    def invalidate(self, tags: Optional[Set[str]]):
+        with self.__lock:
+            self.invalidations += 1
+            now = get_timestamp_ms()
+            if tags is None or len(self.__versions) + len(tags) > MAX_TAG_VERSIONS:
+                self.__global_version += 1
+                self.__versions.clear()
+                self.__global_invalidated_at = now
+                self.__invalidated_at.clear()
+                return
+            for tag in tags:
+                self.__versions[tag] = self.__versions.get(tag, 0) + 1
+                self.__invalidated_at[tag] = now
+
+    def get_metrics(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+    def reset(self):
+        with self.__lock:
+            self.__global_version += 1
+            self.__versions.clear()
+            self.__global_invalidated_at = 0
+            self.__invalidated_at.clear()
+            self.hits = 0
+            self.misses = 0
+            self.invalidations = 0
+
+
+class CoreCallCachePathConfig:
+    def __init__(self, ttl_sec: int, max_size: int = 1000):
+        self.ttl_sec = ttl_sec
+        self.max_size = max_size
+
+
+class CoreCallCacheBackend(ABC):
+    """
+    Storage of the shared core call cache. Values are JSON serialisable dicts, so
+    that they can be stored outside of the process (for example in Redis).
+    """
+
+    @abstractmethod
+    async def get(self, path: str, key: str) -> Optional[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def set(
+        self,
+        path: str,
+        key: str,
+        value: Dict[str, Any],
+        ttl_sec: int,
+        max_size: int,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        pass
+
+
+class InMemoryCoreCallCacheBackend(CoreCallCacheBackend):
+    """
+    Per process LRU cache, with a separate size limit for each path.
+    """
+
+    def __init__(self):
+        self.__entries: Dict[str, OrderedDict[str, Tuple[Dict[str, Any], int]]] = {}
+        self.__lock = threading.Lock()
+
+    async def get(self, path: str, key: str) -> Optional[Dict[str, Any]]:
+        with self.__lock:
+            entries = self.__entries.get(path)
+            if entries is None:
+                return None
+            entry = entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= get_timestamp_ms():
+                del entries[key]
+                return None
+            entries.move_to_end(key)
+            return entry[0]
+
+    async def set(
+        self,
+        path: str,
+        key: str,
+        value: Dict[str, Any],
+        ttl_sec: int,
+        max_size: int,
+    ) -> None:
+        with self.__lock:
+            entries = self.__entries.setdefault(path, OrderedDict())
+            entries[key] = (value, get_timestamp_ms() + ttl_sec * 1000)
+            entries.move_to_end(key)
+            while len(entries) > max_size:
+                entries.popitem(last=False)
+
+    async def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+
+class SharedCoreCallCacheConfig:
+    def __init__(
+        self,
+        paths: Dict[str, CoreCallCachePathConfig],
+        backend: Optional[CoreCallCacheBackend] = None,
+    ):
+        # paths are core API paths without the tenant id prefix, for example
+        # "/recipe/user/roles" also applies to "/<tenant_id>/recipe/user/roles"
+        for path, path_config in paths.items():
+            if path_config.ttl_sec <= 0:
+                raise ValueError(f"ttl_sec for {path} must be a positive integer")
+            if path_config.max_size <= 0:
+                raise ValueError(f"max_size for {path} must be a positive integer")
+        self.paths = paths
+        self.backend = backend
+
+
+# The cached body is the decoded text of the response, so these headers would
+# no longer describe it.
+UNCACHED_RESPONSE_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class SharedCoreCallCache:
+    """
+    Cache of GET responses from the core that is shared by all requests (the per
+    request cache lives in the user_context). Only the paths in the config are
+    cached, each for its own TTL. Responses are dropped when a write made by this
+    process invalidates one of their tags.
+    """
+
+    def __init__(self, config: SharedCoreCallCacheConfig):
+        self.paths = config.paths
+        self.backend = (
+            config.backend
+            if config.backend is not None
+            else InMemoryCoreCallCacheBackend()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def get_path_config(self, path: str) -> Optional[CoreCallCachePathConfig]:
+        return self.paths.get(split_core_path(path)[1])
+
+    @staticmethod
+    def get_key(unique_key: str) -> str:
+        # The unique key includes the request headers (and so the API key)
+        return sha256(unique_key.encode()).hexdigest()
+
+    async def get(
+        self,
+        path: str,
+        unique_key: str,
+        tags: Set[str],
+        tag_versions: CoreCallCacheTagVersions,
+    ) -> Optional[Response]:
+        path_config = self.get_path_config(path)
+        if path_config is None:
+            return None
+
+        value = await self.backend.get(path, SharedCoreCallCache.get_key(unique_key))
+        if value is not None:
+            tags = tags | get_response_tags(path, value["body"])
+        if value is None or not tag_versions.is_fetched_after_invalidation(
+            tags, value["fetchedAt"]
+        ):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return Response(
+            value["statusCode"],
+            headers=value["headers"],
+            content=value["body"].encode(),
+        )
+
+    async def set(
+        self, path: str, unique_key: str, response: Response, fetched_at: int
+    ) -> None:
+        path_config = self.get_path_config(path)
+        if path_config is None:
+            return
+
+        await self.backend.set(
+            path,
+            SharedCoreCallCache.get_key(unique_key),
+            {
+                "statusCode": response.status_code,
+                "headers": {
+                    name: value
+                    for name, value in response.headers.items()
+                    if name.lower() not in UNCACHED_RESPONSE_HEADERS
+                },
+                "body": response.text,
+                "fetchedAt": fetched_at,
+            },
+            path_config.ttl_sec,
+            path_config.max_size,
+        )
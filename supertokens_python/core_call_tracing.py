@@ -0,0 +1,174 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from contextvars import ContextVar, Token
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from supertokens_python.logger import log_debug_message
+
+# The trace of the SDK API being handled. A context variable rather than the
+# user_context, so that core calls made without a user_context are counted too.
+_current_trace: ContextVar[Optional[CoreCallTrace]] = ContextVar(
+    "supertokens_core_call_trace", default=None
+)
+
+
+class CoreCallRecord:
+    """
+    One call made to the core. cache is "hit" or "shared_hit" if a GET request
+    was answered from the core call cache, "miss" if it went to the core, and
+    None for other methods. retries counts the rate limited attempts and the
+    attempts on other hosts after a network error.
+    """
+
+    def __init__(self, path: str, method: str):
+        self.path = path
+        self.method = method
+        self.status_code: Optional[int] = None
+        self.duration_ms = 0.0
+        self.retries = 0
+        self.cache: Optional[str] = None
+        self.recipe_id: Optional[str] = None
+        self.api_id: Optional[str] = None
+        self.started_at = perf_counter()
+
+    def is_cache_hit(self) -> bool:
+        return self.cache in ("hit", "shared_hit")
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "method": self.method,
+            "statusCode": self.status_code,
+            "durationMs": self.duration_ms,
+            "retries": self.retries,
+            "cache": self.cache,
+            "recipeId": self.recipe_id,
+            "apiId": self.api_id,
+        }
+
+
+class CoreCallTrace:
+    """
+    The core calls made while one SDK API (like signin) handled a request.
+    """
+
+    def __init__(self, recipe_id: str, api_id: str):
+        self.recipe_id = recipe_id
+        self.api_id = api_id
+        self.records: List[CoreCallRecord] = []
+
+    @property
+    def core_call_count(self) -> int:
+        """Calls that reached the core, so excluding cache hits."""
+        return len([r for r in self.records if not r.is_cache_hit()])
+
+
+class CoreCallBudgetExceededError(Exception):
+    def __init__(self, trace: CoreCallTrace, budget: int):
+        super().__init__(
+            f"The {trace.api_id} API of the {trace.recipe_id} recipe made "
+            f"{trace.core_call_count} core calls, more than its budget of {budget}: "
+            + ", ".join(f"{r.method} {r.path}" for r in trace.records)
+        )
+        self.trace = trace
+        self.budget = budget
+
+
+class CoreCallTracingConfig:
+    """
+    on_core_call is called after each call to the core, and on_api_end after an
+    SDK API has handled a request, with the calls it made.
+
+    core_call_budgets maps API ids (or "<recipe id>.<api id>") to the number of
+    core calls they may make. An API that makes more raises
+    CoreCallBudgetExceededError, which is meant for tests.
+    """
+
+    def __init__(
+        self,
+        on_core_call: Optional[
+            Callable[[CoreCallRecord, Optional[Dict[str, Any]]], None]
+        ] = None,
+        on_api_end: Optional[Callable[[CoreCallTrace, Dict[str, Any]], None]] = None,
+        core_call_budgets: Optional[Dict[str, int]] = None,
+    ):
+        if core_call_budgets is not None:
+            for key, budget in core_call_budgets.items():
+                if budget < 0:
+                    raise ValueError(
+                        f"core_call_budgets[{key}] must be a non negative integer"
+                    )
+        self.on_core_call = on_core_call
+        self.on_api_end = on_api_end
+        self.core_call_budgets = core_call_budgets or {}
+
+
+class CoreCallTracer:
+    def __init__(self, config: CoreCallTracingConfig):
+        self.config = config
+
+    def end_record(
+        self, record: CoreCallRecord, user_context: Union[Dict[str, Any], None]
+    ):
+        record.duration_ms = (perf_counter() - record.started_at) * 1000
+        trace = _current_trace.get()
+        if trace is not None:
+            record.recipe_id = trace.recipe_id
+            record.api_id = trace.api_id
+            trace.records.append(record)
+        if self.config.on_core_call is not None:
+            try:
+                self.config.on_core_call(record, user_context)
+            except Exception as e:
+                log_debug_message("on_core_call threw an error: %s", e)
+
+    def start_trace(
+        self, recipe_id: str, api_id: str
+    ) -> Token[Optional[CoreCallTrace]]:
+        return _current_trace.set(CoreCallTrace(recipe_id, api_id))
+
+    def end_trace(
+        self,
+        token: Token[Optional[CoreCallTrace]],
+        user_context: Dict[str, Any],
+        check_budget: bool,
+    ):
+        trace = _current_trace.get()
+        _current_trace.reset(token)
+        if trace is None:
+            return
+        log_debug_message(
+            "core call trace: %s.%s made %s core calls (%s in total)",
+            trace.recipe_id,
+            trace.api_id,
+            trace.core_call_count,
+            len(trace.records),
+        )
+        if self.config.on_api_end is not None:
+            try:
+                self.config.on_api_end(trace, user_context)
+            except Exception as e:
+                log_debug_message("on_api_end threw an error: %s", e)
+
+        if not check_budget:
+            return
+        budget = self.config.core_call_budgets.get(
+            f"{trace.recipe_id}.{trace.api_id}",
+            self.config.core_call_budgets.get(trace.api_id),
+        )
+        if budget is not None and trace.core_call_count > budget:
+            raise CoreCallBudgetExceededError(trace, budget)
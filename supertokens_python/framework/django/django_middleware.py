@@ -14,12 +14,23 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Optional, Union
+from typing import Any, Awaitable, Callable, Optional, TypeVar, Union
 
 from asgiref.sync import async_to_sync
 
+from supertokens_python.async_to_sync_wrapper import get_background_event_loop, sync
 from supertokens_python.framework import BaseResponse
 
+_T = TypeVar("_T")
+
+
+def run_sync(func: Callable[..., Awaitable[_T]], *args: Any) -> _T:
+    # When the background event loop is enabled, the SDK's coroutines run on it
+    # (like in Flask) so that its connections and caches are shared by all threads.
+    if get_background_event_loop() is not None:
+        return sync(func(*args))  # type: ignore
+    return async_to_sync(func)(*args)
+
 
 def middleware(get_response: Any):
     from supertokens_python import Supertokens
@@ -76,8 +87,8 @@ def middleware(get_response: Any):
         user_context = default_user_context(custom_request)
 
         try:
-            result: Union[BaseResponse, None] = async_to_sync(st.middleware)(
-                custom_request, response, user_context
+            result: Union[BaseResponse, None] = run_sync(
+                st.middleware, custom_request, response, user_context
             )
 
             if result is None:
@@ -97,8 +108,12 @@ def middleware(get_response: Any):
 
         except SuperTokensError as e:
             response = DjangoResponse(HttpResponse())
-            result: Optional[BaseResponse] = async_to_sync(st.handle_supertokens_error)(
-                DjangoRequest(request), e, response, user_context
+            result: Optional[BaseResponse] = run_sync(
+                st.handle_supertokens_error,
+                DjangoRequest(request),
+                e,
+                response,
+                user_context,
             )
 
             if result is not None:
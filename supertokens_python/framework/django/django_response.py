@@ -88,3 +88,9 @@ class DjangoResponse(BaseResponse):
                 separators=(",", ":"),
             ).encode("utf-8")
             self.response_sent = True
+
+    def set_json_bytes_content(self, content: bytes):
+        if not self.response_sent:
+            self.set_header("Content-Type", "application/json; charset=utf-8")
+            self.response.content = content
+            self.response_sent = True
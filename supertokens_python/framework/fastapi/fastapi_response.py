@@ -94,3 +94,10 @@ class FastApiResponse(BaseResponse):
             self.set_header("Content-Length", str(len(body)))
             self.response.body = body
             self.response_sent = True
+
+    def set_json_bytes_content(self, content: bytes):
+        if not self.response_sent:
+            self.set_header("Content-Type", "application/json; charset=utf-8")
+            self.set_header("Content-Length", str(len(content)))
+            self.response.body = content
+            self.response_sent = True
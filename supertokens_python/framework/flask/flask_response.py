@@ -85,3 +85,9 @@ class FlaskResponse(BaseResponse):
                 separators=(",", ":"),
             ).encode("utf-8")
             self.response_sent = True
+
+    def set_json_bytes_content(self, content: bytes):
+        if not self.response_sent:
+            self.set_header("Content-Type", "application/json; charset=utf-8")
+            self.response.data = content
+            self.response_sent = True
@@ -12,6 +12,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import json
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Literal, Optional
 
@@ -61,3 +62,10 @@ class BaseResponse(ABC):
     @abstractmethod
     def set_html_content(self, content: str):
         pass
+
+    def set_json_bytes_content(self, content: bytes):
+        """
+        Sends JSON that was already serialised (and is reused across requests).
+        Frameworks set the bytes as the body, this default parses them again.
+        """
+        self.set_json_content(json.loads(content))
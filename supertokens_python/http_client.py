@@ -0,0 +1,108 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Optional
+from weakref import WeakKeyDictionary
+
+from httpx import AsyncClient, Limits, Timeout
+from sniffio import AsyncLibraryNotFoundError
+
+
+class HttpClientConfig:
+    def __init__(
+        self,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keep_alive_expiry_sec: Optional[float] = 5.0,
+        http2: bool = False,
+        connect_timeout_sec: Optional[float] = 30.0,
+        read_timeout_sec: Optional[float] = 30.0,
+        write_timeout_sec: Optional[float] = 30.0,
+        pool_timeout_sec: Optional[float] = 30.0,
+    ):
+        # http2 requires the optional `h2` package (pip install httpx[http2])
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keep_alive_expiry_sec = keep_alive_expiry_sec
+        self.http2 = http2
+        self.connect_timeout_sec = connect_timeout_sec
+        self.read_timeout_sec = read_timeout_sec
+        self.write_timeout_sec = write_timeout_sec
+        self.pool_timeout_sec = pool_timeout_sec
+
+    def create_client(self) -> AsyncClient:
+        return AsyncClient(
+            http2=self.http2,
+            limits=Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keep_alive_expiry_sec,
+            ),
+            timeout=Timeout(
+                connect=self.connect_timeout_sec,
+                read=self.read_timeout_sec,
+                write=self.write_timeout_sec,
+                pool=self.pool_timeout_sec,
+            ),
+        )
+
+
+class HttpClientPool:
+    """
+    Keeps one long lived `AsyncClient` (and hence one connection pool) per
+    event loop. An httpx client must only be used from the loop it was created
+    on, so the syncio wrappers (which run a loop per thread) each get their
+    own client, while ASGI apps share one client across all requests.
+    """
+
+    def __init__(self, config: Optional[HttpClientConfig] = None):
+        self.config = config if config is not None else HttpClientConfig()
+        self.__clients: WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncClient] = (
+            WeakKeyDictionary()
+        )
+        self.__lock = threading.Lock()
+
+    def get_client(self) -> AsyncClient:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # This is the same error httpx raises when it's used outside of a
+            # running loop, so callers can keep a single retry path for it.
+            raise AsyncLibraryNotFoundError("no running event loop")
+
+        with self.__lock:
+            client = self.__clients.get(loop)
+            if client is None or client.is_closed:
+                client = self.config.create_client()
+                self.__clients[loop] = client
+            return client
+
+    async def aclose(self):
+        """
+        Closes the client that belongs to the currently running event loop.
+        Clients bound to other loops are released when those loops are
+        garbage collected, or when `reset` is called.
+        """
+        loop = asyncio.get_running_loop()
+        with self.__lock:
+            client = self.__clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+    def reset(self):
+        with self.__lock:
+            self.__clients = WeakKeyDictionary()
@@ -0,0 +1,351 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+from abc import ABC, abstractmethod
+from time import monotonic
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from supertokens_python.logger import log_debug_message
+
+DeliverFunction = Callable[[Any, Dict[str, Any]], Awaitable[None]]
+
+
+class DeliveryJob:
+    """
+    An email or SMS waiting to be sent. provider_id identifies what sends it (for
+    example "passwordless.sms"), so that a persistent store can hand the job back
+    to the right ingredient after a restart.
+    """
+
+    def __init__(
+        self, provider_id: str, template_vars: Any, user_context: Dict[str, Any]
+    ):
+        self.provider_id = provider_id
+        self.template_vars = template_vars
+        self.user_context = user_context
+        self.attempts = 0
+
+
+class DeliveryQueueStore(ABC):
+    """
+    Holds the queued jobs. Its methods are only called from the queue's event loop.
+    Stores that persist jobs need to serialise template_vars and user_context
+    themselves; the user_context may contain values that can't be serialised.
+    """
+
+    @abstractmethod
+    async def put(self, job: DeliveryJob) -> bool:
+        """Adds the job, returning False if the store is full."""
+
+    @abstractmethod
+    async def get(self) -> DeliveryJob:
+        """Waits for the next job."""
+
+    @abstractmethod
+    async def ack(self, job: DeliveryJob) -> None:
+        """Called once the job was delivered or given up on."""
+
+    @abstractmethod
+    async def size(self) -> int:
+        """The number of jobs that haven't been acked."""
+
+
+class InMemoryDeliveryQueueStore(DeliveryQueueStore):
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.__queue: Optional[asyncio.Queue[DeliveryJob]] = None
+        self.__unacked = 0
+
+    def __get_queue(self) -> asyncio.Queue[DeliveryJob]:
+        # created lazily so that it belongs to the queue's event loop
+        if self.__queue is None:
+            self.__queue = asyncio.Queue()
+        return self.__queue
+
+    async def put(self, job: DeliveryJob) -> bool:
+        if self.__unacked >= self.max_size:
+            return False
+        self.__unacked += 1
+        self.__get_queue().put_nowait(job)
+        return True
+
+    async def get(self) -> DeliveryJob:
+        return await self.__get_queue().get()
+
+    async def ack(self, job: DeliveryJob) -> None:
+        self.__unacked -= 1
+
+    async def size(self) -> int:
+        return self.__unacked
+
+
+class DeliveryProviderLimits:
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        max_per_sec: Optional[float] = None,
+    ):
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError("max_concurrency must be a positive integer or None")
+        if max_per_sec is not None and max_per_sec <= 0:
+            raise ValueError("max_per_sec must be a positive number or None")
+        self.max_concurrency = max_concurrency
+        self.max_per_sec = max_per_sec
+
+
+class DeliveryQueueConfig:
+    """
+    workers bounds how many jobs are handled at once, including jobs waiting to
+    be retried. provider_limits bounds the concurrency and rate of each provider
+    id, falling back to default_provider_limits.
+
+    A job that still fails after max_retries retries is passed to on_dead_letter.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        workers: int = 4,
+        max_retries: int = 3,
+        retry_base_delay_sec: float = 0.5,
+        retry_max_delay_sec: float = 30.0,
+        default_provider_limits: Optional[DeliveryProviderLimits] = None,
+        provider_limits: Optional[Dict[str, DeliveryProviderLimits]] = None,
+        on_dead_letter: Optional[
+            Callable[[DeliveryJob, Exception], Awaitable[None]]
+        ] = None,
+        store: Optional[DeliveryQueueStore] = None,
+    ):
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer")
+        if workers <= 0:
+            raise ValueError("workers must be a positive integer")
+        if max_retries < 0:
+            raise ValueError("max_retries must be a non negative integer")
+        if retry_base_delay_sec < 0 or retry_max_delay_sec < retry_base_delay_sec:
+            raise ValueError(
+                "retry_base_delay_sec must be non negative and at most retry_max_delay_sec"
+            )
+        self.max_size = max_size
+        self.workers = workers
+        self.max_retries = max_retries
+        self.retry_base_delay_sec = retry_base_delay_sec
+        self.retry_max_delay_sec = retry_max_delay_sec
+        self.default_provider_limits = (
+            default_provider_limits or DeliveryProviderLimits()
+        )
+        self.provider_limits = provider_limits or {}
+        self.on_dead_letter = on_dead_letter
+        self.store = store
+
+
+class _Provider:
+    def __init__(self, deliver: DeliverFunction, limits: DeliveryProviderLimits):
+        self.deliver = deliver
+        self.limits = limits
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        self.next_slot = 0.0
+
+    async def wait_for_rate_limit(self):
+        if self.limits.max_per_sec is None:
+            return
+        now = monotonic()
+        wait = self.next_slot - now
+        self.next_slot = max(now, self.next_slot) + 1 / self.limits.max_per_sec
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def send(self, job: DeliveryJob):
+        if self.limits.max_concurrency is None:
+            await self.wait_for_rate_limit()
+            await self.deliver(job.template_vars, job.user_context)
+            return
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.limits.max_concurrency)
+        async with self.semaphore:
+            await self.wait_for_rate_limit()
+            await self.deliver(job.template_vars, job.user_context)
+
+
+class DeliveryQueue:
+    """
+    Sends emails and SMS in the background, so that APIs return as soon as the
+    message is queued. Pass it to EmailDeliveryConfig / SMSDeliveryConfig; one
+    queue can be shared by several recipes.
+
+    The jobs are sent from an event loop on a daemon thread started on the first
+    enqueue, which works the same for ASGI and WSGI apps. If the queue is full or
+    closed, messages are sent inline as if there were no queue.
+    """
+
+    def __init__(self, config: Optional[DeliveryQueueConfig] = None):
+        self.config = config or DeliveryQueueConfig()
+        self.store = self.config.store or InMemoryDeliveryQueueStore(
+            self.config.max_size
+        )
+        self.__providers: Dict[str, _Provider] = {}
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+        self.__thread: Optional[threading.Thread] = None
+        self.__workers: List[asyncio.Task[None]] = []
+        self.__closed = False
+        self.__lock = threading.Lock()
+
+    def register_provider(self, provider_id: str, deliver: DeliverFunction):
+        limits = self.config.provider_limits.get(
+            provider_id, self.config.default_provider_limits
+        )
+        with self.__lock:
+            self.__providers[provider_id] = _Provider(deliver, limits)
+
+    def __start(self) -> asyncio.AbstractEventLoop:
+        with self.__lock:
+            if self.__loop is None:
+                loop = asyncio.new_event_loop()
+                self.__thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="supertokens-delivery-queue",
+                    daemon=True,
+                )
+                self.__thread.start()
+                loop.call_soon_threadsafe(self.__start_workers, loop)
+                self.__loop = loop
+            return self.__loop
+
+    def __start_workers(self, loop: asyncio.AbstractEventLoop):
+        self.__workers = [
+            loop.create_task(self.__work()) for _ in range(self.config.workers)
+        ]
+
+    async def enqueue(
+        self, provider_id: str, template_vars: Any, user_context: Dict[str, Any]
+    ):
+        provider = self.__providers[provider_id]
+        job = DeliveryJob(provider_id, template_vars, copy_user_context(user_context))
+        accepted = False
+        if not self.__closed:
+            loop = self.__start()
+            accepted = await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(self.store.put(job), loop)
+            )
+        if not accepted:
+            log_debug_message(
+                "Delivery queue is full or closed, sending %s inline", provider_id
+            )
+            await provider.deliver(template_vars, user_context)
+
+    async def __work(self):
+        while True:
+            job = await self.store.get()
+            try:
+                await self.__process(job)
+            except Exception as e:
+                log_debug_message("Delivery queue worker error: %s", e)
+            # Not acked if the worker was cancelled by close(), so that a
+            # persistent store can hand the job out again.
+            await self.store.ack(job)
+
+    async def __process(self, job: DeliveryJob):
+        provider = self.__providers.get(job.provider_id)
+        if provider is None:
+            raise Exception(f"No delivery provider registered for {job.provider_id}")
+        while True:
+            try:
+                await provider.send(job)
+                return
+            except Exception as e:
+                if job.attempts >= self.config.max_retries:
+                    await self.__dead_letter(job, e)
+                    return
+                delay = min(
+                    self.config.retry_max_delay_sec,
+                    self.config.retry_base_delay_sec * (2**job.attempts),
+                )
+                # "equal jitter", so that failed jobs don't all retry at once
+                delay = delay / 2 + random.uniform(0, delay / 2)
+                job.attempts += 1
+                log_debug_message(
+                    "Retrying %s delivery in %s seconds after: %s",
+                    job.provider_id,
+                    delay,
+                    e,
+                )
+                await asyncio.sleep(delay)
+
+    async def __dead_letter(self, job: DeliveryJob, error: Exception):
+        log_debug_message(
+            "Giving up on %s delivery after %s attempts: %s",
+            job.provider_id,
+            job.attempts + 1,
+            error,
+        )
+        if self.config.on_dead_letter is not None:
+            await self.config.on_dead_letter(job, error)
+
+    async def __drain(self, timeout_sec: Optional[float]) -> bool:
+        deadline = None if timeout_sec is None else monotonic() + timeout_sec
+        while await self.store.size() > 0:
+            if deadline is not None and monotonic() >= deadline:
+                break
+            await asyncio.sleep(0.01)
+        drained = await self.store.size() == 0
+        for worker in self.__workers:
+            worker.cancel()
+        await asyncio.gather(*self.__workers, return_exceptions=True)
+        return drained
+
+    async def pending(self) -> int:
+        """The number of queued jobs, including the ones being sent."""
+        loop = self.__loop
+        if loop is None:
+            return 0
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(self.store.size(), loop)
+        )
+
+    async def close(self, timeout_sec: Optional[float] = None) -> bool:
+        """
+        Stops accepting jobs and waits for the queued ones to be sent, for at most
+        timeout_sec. Returns False if some jobs were still queued.
+        """
+        with self.__lock:
+            self.__closed = True
+            loop = self.__loop
+            thread = self.__thread
+            self.__loop = None
+            self.__thread = None
+        if loop is None or thread is None:
+            return True
+        drained = await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(self.__drain(timeout_sec), loop)
+        )
+        loop.call_soon_threadsafe(loop.stop)
+        await asyncio.get_running_loop().run_in_executor(None, thread.join)
+        loop.close()
+        return drained
+
+
+def copy_user_context(user_context: Dict[str, Any]) -> Dict[str, Any]:
+    # The request's core call cache and other per request state are left out, as
+    # the job is sent after (and concurrently with) the rest of the request.
+    copied = dict(user_context)
+    default: Union[Dict[str, Any], None] = user_context.get("_default")
+    if default is not None:
+        copied["_default"] = (
+            {"request": default["request"]} if "request" in default else {}
+        )
+    return copied
@@ -12,8 +12,9 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from typing import Generic, TypeVar
+from typing import Any, Dict, Generic, TypeVar
 
+from supertokens_python.ingredients.delivery_queue import DeliveryQueue
 from supertokens_python.ingredients.emaildelivery.types import (
     EmailDeliveryConfigWithService,
     EmailDeliveryInterface,
@@ -22,12 +23,39 @@ from supertokens_python.ingredients.emaildelivery.types import (
 _T = TypeVar("_T")
 
 
+class QueuedEmailDelivery(EmailDeliveryInterface[_T]):
+    """
+    Returns as soon as the email is queued, the wrapped service sends it from the queue.
+    """
+
+    def __init__(
+        self,
+        service: EmailDeliveryInterface[_T],
+        queue: DeliveryQueue,
+        provider_id: str,
+    ) -> None:
+        self.service = service
+        self.queue = queue
+        self.provider_id = provider_id
+        queue.register_provider(provider_id, service.send_email)
+
+    async def send_email(self, template_vars: _T, user_context: Dict[str, Any]) -> None:
+        await self.queue.enqueue(self.provider_id, template_vars, user_context)
+
+
 class EmailDeliveryIngredient(Generic[_T]):
     ingredient_interface_impl: EmailDeliveryInterface[_T]
 
-    def __init__(self, config: EmailDeliveryConfigWithService[_T]) -> None:
-        self.ingredient_interface_impl = (
+    def __init__(
+        self, config: EmailDeliveryConfigWithService[_T], provider_id: str = "email"
+    ) -> None:
+        service = (
             config.service
             if config.override is None
             else config.override(config.service)
         )
+        self.ingredient_interface_impl = (
+            service
+            if config.queue is None
+            else QueuedEmailDelivery(service, config.queue, provider_id)
+        )
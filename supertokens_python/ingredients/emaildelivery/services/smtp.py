@@ -12,10 +12,14 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from __future__ import annotations
 
+import asyncio
 import ssl
+import time
 from email.mime.text import MIMEText
-from typing import Any, Dict, TypeVar
+from typing import Any, Awaitable, Callable, Dict, List, Tuple, TypeVar
+from weakref import WeakKeyDictionary
 
 import aiosmtplib
 from supertokens_python.ingredients.emaildelivery.types import (
@@ -27,6 +31,106 @@ from supertokens_python.logger import log_debug_message
 _T = TypeVar("_T")
 
 
+class SMTPConnectionPool:
+    """
+    Bounded pool of connected (and logged in) SMTP connections. Connections are
+    checked with a NOOP before being reused and are closed once they've been idle
+    for longer than idle_timeout_sec.
+
+    aiosmtplib connections belong to the event loop they were opened on, so there
+    is one pool per loop (see get_smtp_connection_pool).
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[aiosmtplib.SMTP]],
+        max_connections: int,
+        idle_timeout_sec: float,
+    ):
+        self.connect = connect
+        self.idle_timeout_sec = idle_timeout_sec
+        self.__idle: List[Tuple[aiosmtplib.SMTP, float]] = []
+        self.__semaphore = asyncio.Semaphore(max_connections)
+
+    def __close_expired(self):
+        now = time.monotonic()
+        still_idle: List[Tuple[aiosmtplib.SMTP, float]] = []
+        for connection, last_used in self.__idle:
+            if now - last_used > self.idle_timeout_sec:
+                connection.close()
+            else:
+                still_idle.append((connection, last_used))
+        self.__idle = still_idle
+
+    async def acquire(self) -> Tuple[aiosmtplib.SMTP, bool]:
+        """
+        Returns a connection and whether it was reused from the pool. Every acquired
+        connection must be given back with release.
+        """
+        await self.__semaphore.acquire()
+        try:
+            self.__close_expired()
+            while len(self.__idle) > 0:
+                connection, _ = self.__idle.pop()
+                if not connection.is_connected:
+                    continue
+                try:
+                    await connection.noop()
+                    return connection, True
+                except Exception as e:
+                    log_debug_message("Discarding pooled SMTP connection: %s", e)
+                    connection.close()
+
+            return await self.connect(), False
+        except Exception:
+            self.__semaphore.release()
+            raise
+
+    def release(self, connection: aiosmtplib.SMTP, reusable: bool):
+        if reusable and connection.is_connected:
+            self.__idle.append((connection, time.monotonic()))
+        else:
+            connection.close()
+        self.__close_expired()
+        self.__semaphore.release()
+
+    def close(self):
+        for connection, _ in self.__idle:
+            connection.close()
+        self.__idle = []
+
+
+# event loop -> connection settings -> pool. The settings are part of the key so that
+# the SMTP services of different recipes that use the same server share connections.
+smtp_connection_pools: WeakKeyDictionary[
+    asyncio.AbstractEventLoop, Dict[Tuple[Any, ...], SMTPConnectionPool]
+] = WeakKeyDictionary()
+
+
+def get_smtp_connection_pool(
+    smtp_settings: SMTPSettings, connect: Callable[[], Awaitable[aiosmtplib.SMTP]]
+) -> SMTPConnectionPool:
+    key = (
+        smtp_settings.host,
+        smtp_settings.port,
+        smtp_settings.secure,
+        smtp_settings.username or smtp_settings.from_.email,
+        smtp_settings.password,
+        smtp_settings.max_pooled_connections,
+        smtp_settings.pooled_connection_idle_timeout_sec,
+    )
+    pools = smtp_connection_pools.setdefault(asyncio.get_running_loop(), {})
+    pool = pools.get(key)
+    if pool is None:
+        pool = SMTPConnectionPool(
+            connect,
+            smtp_settings.max_pooled_connections,
+            smtp_settings.pooled_connection_idle_timeout_sec,
+        )
+        pools[key] = pool
+    return pool
+
+
 class Transporter:
     def __init__(self, smtp_settings: SMTPSettings) -> None:
         self.smtp_settings = smtp_settings
@@ -72,24 +176,50 @@ class Transporter:
             log_debug_message("Couldn't connect to the SMTP server: %s", e)
             raise e
 
+    async def _send(self, connection: aiosmtplib.SMTP, input_: EmailContent) -> None:
+        from_ = self.smtp_settings.from_
+        from_addr = f"{from_.name} <{from_.email}>"
+        if input_.is_html:
+            email_content = MIMEText(input_.body, "html")
+            email_content["From"] = from_addr
+            email_content["To"] = input_.to_email
+            email_content["Subject"] = input_.subject
+            await connection.sendmail(
+                from_.email, input_.to_email, email_content.as_string()
+            )
+        else:
+            await connection.sendmail(from_addr, input_.to_email, input_.body)
+
     async def send_email(self, input_: EmailContent, _: Dict[str, Any]) -> None:
-        connection = await self._connect()
+        if self.smtp_settings.max_pooled_connections <= 0:
+            connection = await self._connect()
+            try:
+                await self._send(connection, input_)
+            except Exception as e:
+                log_debug_message("Error in sending email: %s", e)
+                raise e
+            finally:
+                await connection.quit()
+            return
 
-        from_ = self.smtp_settings.from_
+        pool = get_smtp_connection_pool(self.smtp_settings, self._connect)
+        connection, reused = await pool.acquire()
+        reusable = False
         try:
-            from_addr = f"{from_.name} <{from_.email}>"
-            if input_.is_html:
-                email_content = MIMEText(input_.body, "html")
-                email_content["From"] = from_addr
-                email_content["To"] = input_.to_email
-                email_content["Subject"] = input_.subject
-                await connection.sendmail(
-                    from_.email, input_.to_email, email_content.as_string()
-                )
-            else:
-                await connection.sendmail(from_addr, input_.to_email, input_.body)
+            try:
+                await self._send(connection, input_)
+            except aiosmtplib.SMTPServerDisconnected as e:
+                if not reused:
+                    raise e
+                # The server dropped the pooled connection after the health check,
+                # so try once more on a new one.
+                log_debug_message("Pooled SMTP connection was closed, reconnecting")
+                connection.close()
+                connection = await self._connect()
+                await self._send(connection, input_)
+            reusable = True
         except Exception as e:
             log_debug_message("Error in sending email: %s", e)
             raise e
         finally:
-            await connection.quit()
+            pool.release(connection, reusable)
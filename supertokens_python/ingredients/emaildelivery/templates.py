@@ -0,0 +1,144 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import threading
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from string import Template
+from typing import Any, Dict, List, Optional, Tuple
+
+# Pre-rendered variants (for example one per app name and code lifetime) kept
+# per template.
+MAX_CACHED_TEMPLATE_VARIANTS = 32
+
+
+class CompiledTemplate:
+    """
+    A string.Template split into its literal text and placeholders, so that
+    rendering it is a join instead of a regex substitution over the whole text.
+
+    literals has one more item than names: the text before each placeholder and
+    the text after the last one.
+    """
+
+    def __init__(self, literals: List[str], names: List[str]):
+        if len(literals) != len(names) + 1:
+            raise ValueError("literals must have one more item than names")
+        self.literals = literals
+        self.names = names
+        self.__variants: Dict[Tuple[Tuple[str, str], ...], CompiledTemplate] = {}
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def compile(template: str) -> CompiledTemplate:
+        literals: List[str] = []
+        names: List[str] = []
+        current: List[str] = []
+        position = 0
+        for match in Template.pattern.finditer(template):
+            current.append(template[position : match.start()])
+            position = match.end()
+            if match.group("escaped") is not None:
+                current.append("$")
+                continue
+            name = match.group("named") or match.group("braced")
+            if name is None:
+                raise ValueError(
+                    f"Invalid placeholder in email template at index {match.start()}"
+                )
+            literals.append("".join(current))
+            names.append(name)
+            current = []
+        current.append(template[position:])
+        literals.append("".join(current))
+        return CompiledTemplate(literals, names)
+
+    def render(self, **values: Any) -> str:
+        # Same as Template.substitute: missing values raise a KeyError
+        parts = [self.literals[0]]
+        for name, literal in zip(self.names, self.literals[1:]):
+            parts.append(str(values[name]))
+            parts.append(literal)
+        return "".join(parts)
+
+    def partial(self, **values: Any) -> CompiledTemplate:
+        """
+        The template with the given placeholders rendered. The result is cached,
+        so values that are the same for many emails (like the app name) are only
+        rendered once.
+        """
+        key = tuple(sorted((name, str(value)) for name, value in values.items()))
+        with self.__lock:
+            variant = self.__variants.get(key)
+        if variant is not None:
+            return variant
+
+        literals = [self.literals[0]]
+        names: List[str] = []
+        for name, literal in zip(self.names, self.literals[1:]):
+            if name in values:
+                literals[-1] += str(values[name]) + literal
+            else:
+                names.append(name)
+                literals.append(literal)
+        variant = CompiledTemplate(literals, names)
+
+        with self.__lock:
+            if len(self.__variants) >= MAX_CACHED_TEMPLATE_VARIANTS:
+                self.__variants.clear()
+            self.__variants[key] = variant
+        return variant
+
+
+@lru_cache(maxsize=64)
+def compile_template(template: str) -> CompiledTemplate:
+    return CompiledTemplate.compile(template)
+
+
+class EmailTemplateLoader(ABC):
+    """
+    Supplies the templates used by the SMTP services instead of the built in
+    ones. The ids are "passwordless.otp", "passwordless.magic_link",
+    "passwordless.otp_and_magic_link", "emailpassword.password_reset" and
+    "emailverification.email_verify". Templates use the placeholders of the
+    built in ones.
+    """
+
+    @abstractmethod
+    def get_template(self, template_id: str) -> Optional[CompiledTemplate]:
+        """Returns None to use the built in template."""
+
+
+class PrecompiledEmailTemplateLoader(EmailTemplateLoader):
+    def __init__(self, templates: Dict[str, str]):
+        self.templates = {
+            template_id: CompiledTemplate.compile(template)
+            for template_id, template in templates.items()
+        }
+
+    def get_template(self, template_id: str) -> Optional[CompiledTemplate]:
+        return self.templates.get(template_id)
+
+
+def load_email_template(
+    template_id: str,
+    built_in_template: str,
+    template_loader: Optional[EmailTemplateLoader],
+) -> CompiledTemplate:
+    if template_loader is not None:
+        template = template_loader.get_template(template_id)
+        if template is not None:
+            return template
+    return compile_template(built_in_template)
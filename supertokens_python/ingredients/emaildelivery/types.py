@@ -17,7 +17,11 @@ from abc import ABC, abstractmethod
 from typing import Any, Callable, Dict, Generic, TypeVar, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from supertokens_python.ingredients.delivery_queue import DeliveryQueue
     from supertokens_python.ingredients.emaildelivery.services.smtp import Transporter
+    from supertokens_python.ingredients.emaildelivery.templates import (
+        EmailTemplateLoader,
+    )
 
 _T = TypeVar("_T")
 
@@ -35,9 +39,11 @@ class EmailDeliveryConfig(ABC, Generic[_T]):
         override: Union[
             Callable[[EmailDeliveryInterface[_T]], EmailDeliveryInterface[_T]], None
         ] = None,
+        queue: Union[DeliveryQueue, None] = None,
     ) -> None:
         self.service = service
         self.override = override
+        self.queue = queue
 
 
 class EmailDeliveryConfigWithService(ABC, Generic[_T]):
@@ -47,9 +53,11 @@ class EmailDeliveryConfigWithService(ABC, Generic[_T]):
         override: Union[
             Callable[[EmailDeliveryInterface[_T]], EmailDeliveryInterface[_T]], None
         ] = None,
+        queue: Union[DeliveryQueue, None] = None,
     ) -> None:
         self.service = service
         self.override = override
+        self.queue = queue
 
 
 class SMTPSettingsFrom:
@@ -67,6 +75,8 @@ class SMTPSettings:
         password: Union[str, None] = None,
         secure: Union[bool, None] = None,
         username: Union[str, None] = None,
+        max_pooled_connections: int = 5,
+        pooled_connection_idle_timeout_sec: float = 30.0,
     ) -> None:
         self.host = host
         self.from_ = from_
@@ -74,6 +84,10 @@ class SMTPSettings:
         self.port = port
         self.secure = secure
         self.username = username
+        # Authenticated connections are kept open and reused for up to this many
+        # concurrent emails. Set to 0 to connect (and quit) for every email.
+        self.max_pooled_connections = max_pooled_connections
+        self.pooled_connection_idle_timeout_sec = pooled_connection_idle_timeout_sec
 
 
 class EmailContent:
@@ -85,8 +99,13 @@ class EmailContent:
 
 
 class SMTPServiceInterface(ABC, Generic[_T]):
-    def __init__(self, transporter: Transporter) -> None:
+    def __init__(
+        self,
+        transporter: Transporter,
+        template_loader: Union[EmailTemplateLoader, None] = None,
+    ) -> None:
         self.transporter = transporter
+        self.template_loader = template_loader
 
     @abstractmethod
     async def send_raw_email(
@@ -12,8 +12,9 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from typing import Generic, TypeVar
+from typing import Any, Dict, Generic, TypeVar
 
+from supertokens_python.ingredients.delivery_queue import DeliveryQueue
 from supertokens_python.ingredients.smsdelivery.types import (
     SMSDeliveryConfigWithService,
     SMSDeliveryInterface,
@@ -22,12 +23,39 @@ from supertokens_python.ingredients.smsdelivery.types import (
 _T = TypeVar("_T")
 
 
+class QueuedSMSDelivery(SMSDeliveryInterface[_T]):
+    """
+    Returns as soon as the SMS is queued, the wrapped service sends it from the queue.
+    """
+
+    def __init__(
+        self,
+        service: SMSDeliveryInterface[_T],
+        queue: DeliveryQueue,
+        provider_id: str,
+    ) -> None:
+        self.service = service
+        self.queue = queue
+        self.provider_id = provider_id
+        queue.register_provider(provider_id, service.send_sms)
+
+    async def send_sms(self, template_vars: _T, user_context: Dict[str, Any]) -> None:
+        await self.queue.enqueue(self.provider_id, template_vars, user_context)
+
+
 class SMSDeliveryIngredient(Generic[_T]):
     ingredient_interface_impl: SMSDeliveryInterface[_T]
 
-    def __init__(self, config: SMSDeliveryConfigWithService[_T]) -> None:
-        self.ingredient_interface_impl = (
+    def __init__(
+        self, config: SMSDeliveryConfigWithService[_T], provider_id: str = "sms"
+    ) -> None:
+        service = (
             config.service
             if config.override is None
             else config.override(config.service)
         )
+        self.ingredient_interface_impl = (
+            service
+            if config.queue is None
+            else QueuedSMSDelivery(service, config.queue, provider_id)
+        )
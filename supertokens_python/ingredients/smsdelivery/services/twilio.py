@@ -11,12 +11,89 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
-from typing import TypeVar
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Optional, TypeVar
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import ConnectTimeout
+from urllib3.exceptions import NewConnectionError
+from twilio.base.exceptions import TwilioRestException  # type: ignore
+from twilio.rest import Client  # type: ignore
 
 from supertokens_python.ingredients.smsdelivery.types import TwilioSettings
+from supertokens_python.logger import log_debug_message
 
 _T = TypeVar("_T")
 
+TWILIO_RETRY_BASE_DELAY_SEC = 0.25
+
+
+def is_retryable_twilio_error(e: Exception) -> bool:
+    if isinstance(e, TwilioRestException):
+        return e.status == 429  # type: ignore
+    if isinstance(e, ConnectTimeout):
+        return True
+    # Other connection errors (e.g. "connection aborted") may happen after the
+    # request reached twilio, so only retry the ones where we never connected
+    reason = getattr(e.args[0], "reason", None) if e.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+class TwilioMessageSender:
+    """
+    The twilio client is blocking, so its requests are made on a thread pool of
+    max_concurrent_requests threads instead of on the event loop. Requests over
+    that limit wait for a free thread.
+
+    Requests that twilio rate limited (429), or that couldn't connect, are retried
+    up to max_retries times with exponential backoff. Other errors aren't
+    retried since the message may have been sent.
+    """
+
+    def __init__(self, max_concurrent_requests: int = 10, max_retries: int = 2):
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_retries = max_retries
+        self.__executor: Optional[ThreadPoolExecutor] = None
+        self.__lock = Lock()
+
+    def __get_executor(self) -> ThreadPoolExecutor:
+        with self.__lock:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrent_requests,
+                    thread_name_prefix="supertokens-twilio",
+                )
+            return self.__executor
+
+    async def create_message(self, twilio_client: Client, **kwargs: Any) -> Any:  # type: ignore
+        loop = asyncio.get_running_loop()
+        attempt = 0
+        while True:
+            try:
+                return await loop.run_in_executor(
+                    self.__get_executor(),
+                    # .messages is resolved lazily (importing twilio's API modules on
+                    # first use), so it's read on the executor thread as well
+                    lambda: twilio_client.messages.create(**kwargs),  # type: ignore
+                )
+            except (TwilioRestException, RequestsConnectionError) as e:
+                if not is_retryable_twilio_error(e) or attempt >= self.max_retries:
+                    raise
+                delay = TWILIO_RETRY_BASE_DELAY_SEC * (2**attempt)
+                attempt += 1
+                log_debug_message(
+                    "Retrying twilio request in %s seconds after: %s", delay, e
+                )
+                await asyncio.sleep(delay)
+
+    def close(self):
+        with self.__lock:
+            if self.__executor is not None:
+                self.__executor.shutdown(wait=False)
+                self.__executor = None
+
 
 def normalize_twilio_settings(twilio_settings: TwilioSettings) -> TwilioSettings:
     from_ = twilio_settings.from_
@@ -27,4 +104,11 @@ def normalize_twilio_settings(twilio_settings: TwilioSettings) -> TwilioSettings
             'Please pass exactly one of "from" and "messaging_service_sid" config for twilio_settings.'
         )
 
+    if twilio_settings.max_concurrent_requests <= 0:
+        raise Exception(
+            "twilio_settings.max_concurrent_requests must be a positive integer"
+        )
+    if twilio_settings.max_retries < 0:
+        raise Exception("twilio_settings.max_retries must be a non negative integer")
+
     return twilio_settings
@@ -12,11 +12,18 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, Generic, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, TypeVar, Union
 
 from twilio.rest import Client  # type: ignore
 
+if TYPE_CHECKING:
+    from supertokens_python.ingredients.delivery_queue import DeliveryQueue
+
+    from .services.twilio import TwilioMessageSender
+
 _T = TypeVar("_T")
 
 
@@ -33,9 +40,11 @@ class SMSDeliveryConfig(ABC, Generic[_T]):
         override: Union[
             Callable[[SMSDeliveryInterface[_T]], SMSDeliveryInterface[_T]], None
         ] = None,
+        queue: Union[DeliveryQueue, None] = None,
     ) -> None:
         self.service = service
         self.override = override
+        self.queue = queue
 
 
 class SMSDeliveryConfigWithService(ABC, Generic[_T]):
@@ -45,9 +54,11 @@ class SMSDeliveryConfigWithService(ABC, Generic[_T]):
         override: Union[
             Callable[[SMSDeliveryInterface[_T]], SMSDeliveryInterface[_T]], None
         ] = None,
+        queue: Union[DeliveryQueue, None] = None,
     ) -> None:
         self.service = service
         self.override = override
+        self.queue = queue
 
 
 class TwilioSettings:
@@ -58,6 +69,8 @@ class TwilioSettings:
         from_: Union[str, None] = None,
         messaging_service_sid: Union[str, None] = None,
         opts: Union[Dict[str, Any], None] = None,
+        max_concurrent_requests: int = 10,
+        max_retries: int = 2,
     ) -> None:
         """
         Note: `self.otps` can be used to override values passed to the Twilio Client.
@@ -70,6 +83,11 @@ class TwilioSettings:
         self.from_ = from_
         self.messaging_service_sid = messaging_service_sid
         self.opts = opts
+        # The twilio client blocks, so messages are sent from a pool of this many
+        # threads rather than from the event loop.
+        self.max_concurrent_requests = max_concurrent_requests
+        # Rate limited (429) and failed to connect requests are retried this many times.
+        self.max_retries = max_retries
 
 
 class SMSContent:
@@ -79,8 +97,17 @@ class SMSContent:
 
 
 class TwilioServiceInterface(ABC, Generic[_T]):
-    def __init__(self, twilio_client: Client) -> None:  # type: ignore
+    def __init__(
+        self,
+        twilio_client: Client,  # type: ignore
+        message_sender: Union[TwilioMessageSender, None] = None,
+    ) -> None:
+        from .services.twilio import TwilioMessageSender
+
         self.twilio_client = twilio_client  # type: ignore
+        self.message_sender = (
+            message_sender if message_sender is not None else TwilioMessageSender()
+        )
 
     @abstractmethod
     async def send_raw_sms(
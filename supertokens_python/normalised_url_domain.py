@@ -13,8 +13,10 @@
 # under the License.
 
 from __future__ import annotations
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
+from .normalised_url_path import NORMALISED_URL_CACHE_SIZE
 from .utils import is_an_ip_address
 from .exceptions import raise_general_exception
 
@@ -30,6 +32,7 @@ class NormalisedURLDomain:
         return self.__value
 
 
+@lru_cache(maxsize=NORMALISED_URL_CACHE_SIZE)
 def normalise_url_domain_or_throw_error(
     input_str: str, ignore_protocol: bool = False
 ) -> str:
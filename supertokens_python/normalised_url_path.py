@@ -13,6 +13,7 @@
 # under the License.
 
 from __future__ import annotations
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 from .exceptions import raise_general_exception
@@ -20,6 +21,11 @@ from .exceptions import raise_general_exception
 if TYPE_CHECKING:
     pass
 
+# The same few paths and domains are normalised on every request (querier calls,
+# middleware, append), so the results are memoised. Inputs that fail to
+# normalise raise and are not cached.
+NORMALISED_URL_CACHE_SIZE = 1024
+
 
 class NormalisedURLPath:
     def __init__(self, url: str):
@@ -42,6 +48,7 @@ class NormalisedURLPath:
         return parts[1] == "recipe" or (len(parts) > 2 and parts[2] == "recipe")
 
 
+@lru_cache(maxsize=NORMALISED_URL_CACHE_SIZE)
 def normalise_url_path_or_throw_error(input_str: str) -> str:
     input_str = input_str.strip().lower()
     try:
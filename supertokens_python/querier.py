@@ -16,10 +16,28 @@ from __future__ import annotations
 import asyncio
 from json import JSONDecodeError
 from os import environ
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+)
 
 from httpx import AsyncClient, ConnectTimeout, NetworkError, Response
 
+from .core_call_cache import (
+    CoreCallCacheTagVersions,
+    SharedCoreCallCache,
+    SharedCoreCallCacheConfig,
+    get_read_tags,
+    get_response_tags,
+    get_write_tags,
+)
+from .core_call_tracing import CoreCallRecord, CoreCallTracer, CoreCallTracingConfig
 from .constants import (
     API_KEY_HEADER,
     API_VERSION,
@@ -28,10 +46,17 @@ from .constants import (
     SUPPORTED_CDI_VERSIONS,
     RATE_LIMIT_STATUS_CODE,
 )
+from .http_client import HttpClientConfig, HttpClientPool
 from .normalised_url_path import NormalisedURLPath
+from .user_identity_map import (
+    add_to_user_identity_map,
+    get_from_user_identity_map,
+    get_user_tags,
+)
 
 if TYPE_CHECKING:
     from .supertokens import Host
+    from .types import User
 
 from typing import List, Set, Union
 
@@ -42,6 +67,34 @@ from supertokens_python.async_to_sync_wrapper import create_or_get_event_loop
 from supertokens_python.utils import get_timestamp_ms
 
 
+def add_to_core_call_cache(
+    user_context: Union[Dict[str, Any], None],
+    unique_key: str,
+    path: str,
+    response: Response,
+    tag_versions: CoreCallCacheTagVersions,
+    snapshot: Tuple[int, Dict[str, int]],
+    tags: Set[str],
+):
+    if user_context is None:
+        return
+    response_tags = get_response_tags(path, response.text) - tags
+    if len(response_tags) > 0:
+        # These are only known once the response is back, so their versions
+        # are taken now. The ones taken before the request take precedence.
+        snapshot = (
+            snapshot[0],
+            {**tag_versions.snapshot(response_tags)[1], **snapshot[1]},
+        )
+        tags = tags | response_tags
+    default_context = user_context.setdefault("_default", {})
+    default_context.setdefault("core_call_cache", {})[unique_key] = {
+        "response": response,
+        "snapshot": snapshot,
+        "tags": tags,
+    }
+
+
 class Querier:
     __init_called = False
     __hosts: List[Host] = []
@@ -68,8 +121,11 @@ class Querier:
             ],
         ]
     ] = None
-    __global_cache_tag = get_timestamp_ms()
+    __core_call_cache_tag_versions = CoreCallCacheTagVersions()
+    __shared_core_call_cache: Optional[SharedCoreCallCache] = None
+    __core_call_tracer: Optional[CoreCallTracer] = None
     __disable_cache = False
+    __http_client_pool = HttpClientPool()
 
     def __init__(self, hosts: List[Host], rid_to_core: Union[None, str] = None):
         self.__hosts = hosts
@@ -84,6 +140,21 @@ class Querier:
         ):
             raise Exception("calling testing function in non testing env")
         Querier.__init_called = False
+        Querier.__http_client_pool.reset()
+        Querier.__core_call_cache_tag_versions.reset()
+        Querier.__shared_core_call_cache = None
+        Querier.__core_call_tracer = None
+
+    @staticmethod
+    def get_http_client() -> AsyncClient:
+        # The pooled client for the current event loop. Other SDK code that
+        # talks to the core (outside of the send_*_request helpers) should use
+        # this so that it reuses the same connections.
+        return Querier.__http_client_pool.get_client()
+
+    @staticmethod
+    async def close_http_client():
+        await Querier.__http_client_pool.aclose()
 
     @staticmethod
     def get_hosts_alive_for_testing():
@@ -105,16 +176,16 @@ class Querier:
             raise Exception("Retry request failed")
 
         try:
-            async with AsyncClient(timeout=30.0) as client:
-                if method == "GET":
-                    return await client.get(url, *args, **kwargs)  # type: ignore
-                if method == "POST":
-                    return await client.post(url, *args, **kwargs)  # type: ignore
-                if method == "PUT":
-                    return await client.put(url, *args, **kwargs)  # type: ignore
-                if method == "DELETE":
-                    return await client.delete(url, *args, **kwargs)  # type: ignore
-                raise Exception("Shouldn't come here")
+            client = Querier.__http_client_pool.get_client()
+            if method == "GET":
+                return await client.get(url, *args, **kwargs)  # type: ignore
+            if method == "POST":
+                return await client.post(url, *args, **kwargs)  # type: ignore
+            if method == "PUT":
+                return await client.put(url, *args, **kwargs)  # type: ignore
+            if method == "DELETE":
+                return await client.delete(url, *args, **kwargs)  # type: ignore
+            raise Exception("Shouldn't come here")
         except AsyncLibraryNotFoundError:
             # Retry
             loop = create_or_get_event_loop()
@@ -169,8 +240,13 @@ class Querier:
                 url, method, 2, headers=headers, params=query_params
             )
 
-        response = await self.__send_request_helper(
-            NormalisedURLPath(API_VERSION), "GET", f, len(self.__hosts)
+        api_version_path = NormalisedURLPath(API_VERSION)
+        response = await self.__send_traced_request(
+            api_version_path,
+            "GET",
+            f,
+            user_context,
+            Querier.__start_core_call_record(api_version_path, "GET"),
         )
         cdi_supported_by_server = response["versions"]
         api_version = find_max_version(cdi_supported_by_server, SUPPORTED_CDI_VERSIONS)
@@ -217,6 +293,9 @@ class Querier:
             ]
         ] = None,
         disable_cache: bool = False,
+        http_client_config: Optional[HttpClientConfig] = None,
+        shared_core_call_cache: Optional[SharedCoreCallCacheConfig] = None,
+        core_call_tracing: Optional[CoreCallTracingConfig] = None,
     ):
         if not Querier.__init_called:
             Querier.__init_called = True
@@ -227,6 +306,45 @@ class Querier:
             Querier.__hosts_alive_for_testing = set()
             Querier.network_interceptor = network_interceptor
             Querier.__disable_cache = disable_cache
+            Querier.__http_client_pool = HttpClientPool(http_client_config)
+            Querier.__shared_core_call_cache = (
+                SharedCoreCallCache(shared_core_call_cache)
+                if shared_core_call_cache is not None
+                else None
+            )
+            Querier.__core_call_tracer = (
+                CoreCallTracer(core_call_tracing)
+                if core_call_tracing is not None
+                else None
+            )
+
+    @staticmethod
+    def get_core_call_tracer() -> Optional[CoreCallTracer]:
+        return Querier.__core_call_tracer
+
+    @staticmethod
+    def __start_core_call_record(
+        path: NormalisedURLPath, method: str
+    ) -> Optional[CoreCallRecord]:
+        if Querier.__core_call_tracer is None:
+            return None
+        return CoreCallRecord(path.get_as_string_dangerous(), method)
+
+    async def __send_traced_request(
+        self,
+        path: NormalisedURLPath,
+        method: str,
+        http_function: Callable[[str, str], Awaitable[Response]],
+        user_context: Union[Dict[str, Any], None],
+        record: Optional[CoreCallRecord],
+    ) -> Dict[str, Any]:
+        try:
+            return await self.__send_request_helper(
+                path, method, http_function, len(self.__hosts), record=record
+            )
+        finally:
+            if record is not None and Querier.__core_call_tracer is not None:
+                Querier.__core_call_tracer.end_record(record, user_context)
 
     async def __get_headers_with_api_version(
         self, path: NormalisedURLPath, user_context: Union[Dict[str, Any], None]
@@ -246,6 +364,7 @@ class Querier:
     ) -> Dict[str, Any]:
         if params is None:
             params = {}
+        record = Querier.__start_core_call_record(path, "GET")
 
         async def f(url: str, method: str) -> Response:
             headers = await self.__get_headers_with_api_version(path, user_context)
@@ -273,17 +392,47 @@ class Querier:
                 value = headers[key]
                 unique_key += f";{key}={value}"
 
-            if user_context is not None:
-                if (
-                    user_context.get("_default", {}).get("global_cache_tag", -1)
-                    != Querier.__global_cache_tag
-                ):
-                    self.invalidate_core_call_cache(user_context, False)
-
-                if not Querier.__disable_cache and unique_key in user_context.get(
-                    "_default", {}
-                ).get("core_call_cache", {}):
-                    return user_context["_default"]["core_call_cache"][unique_key]
+            tag_versions = Querier.__core_call_cache_tag_versions
+            shared_cache = Querier.__shared_core_call_cache
+            tags = get_read_tags(path.get_as_string_dangerous(), params)
+            # Taken before the request so that a write that happens while it's
+            # in flight makes the response stale.
+            snapshot = tag_versions.snapshot(tags)
+            fetched_at = get_timestamp_ms()
+
+            if not Querier.__disable_cache:
+                if user_context is not None:
+                    core_call_cache = user_context.get("_default", {}).get(
+                        "core_call_cache", {}
+                    )
+                    entry = core_call_cache.get(unique_key)
+                    if entry is not None and tag_versions.is_valid(entry["snapshot"]):
+                        tag_versions.hits += 1
+                        if record is not None:
+                            record.cache = "hit"
+                        return entry["response"]
+                    tag_versions.misses += 1
+
+                if shared_cache is not None:
+                    shared_response = await shared_cache.get(
+                        path.get_as_string_dangerous(), unique_key, tags, tag_versions
+                    )
+                    if shared_response is not None:
+                        if record is not None:
+                            record.cache = "shared_hit"
+                        add_to_core_call_cache(
+                            user_context,
+                            unique_key,
+                            path.get_as_string_dangerous(),
+                            shared_response,
+                            tag_versions,
+                            snapshot,
+                            tags,
+                        )
+                        return shared_response
+
+            if record is not None:
+                record.cache = "miss"
 
             if Querier.network_interceptor is not None:
                 (
@@ -304,23 +453,24 @@ class Querier:
                 params=params,
             )
 
-            if (
-                response.status_code == 200
-                and not Querier.__disable_cache
-                and user_context is not None
-            ):
-                user_context["_default"] = {
-                    **user_context.get("_default", {}),
-                    "core_call_cache": {
-                        **user_context.get("_default", {}).get("core_call_cache", {}),
-                        unique_key: response,
-                    },
-                    "global_cache_tag": Querier.__global_cache_tag,
-                }
+            if response.status_code == 200 and not Querier.__disable_cache:
+                add_to_core_call_cache(
+                    user_context,
+                    unique_key,
+                    path.get_as_string_dangerous(),
+                    response,
+                    tag_versions,
+                    snapshot,
+                    tags,
+                )
+                if shared_cache is not None:
+                    await shared_cache.set(
+                        path.get_as_string_dangerous(), unique_key, response, fetched_at
+                    )
 
             return response
 
-        return await self.__send_request_helper(path, "GET", f, len(self.__hosts))
+        return await self.__send_traced_request(path, "GET", f, user_context, record)
 
     async def send_post_request(
         self,
@@ -329,7 +479,10 @@ class Querier:
         user_context: Union[Dict[str, Any], None],
         test: bool = False,
     ) -> Dict[str, Any]:
-        self.invalidate_core_call_cache(user_context)
+        self.invalidate_core_call_cache(
+            user_context,
+            tags=get_write_tags(path.get_as_string_dangerous(), data),
+        )
         if data is None:
             data = {}
 
@@ -363,7 +516,13 @@ class Querier:
                 json=data,
             )
 
-        return await self.__send_request_helper(path, "POST", f, len(self.__hosts))
+        return await self.__send_traced_request(
+            path,
+            "POST",
+            f,
+            user_context,
+            Querier.__start_core_call_record(path, "POST"),
+        )
 
     async def send_delete_request(
         self,
@@ -371,7 +530,10 @@ class Querier:
         params: Union[Dict[str, Any], None],
         user_context: Union[Dict[str, Any], None],
     ) -> Dict[str, Any]:
-        self.invalidate_core_call_cache(user_context)
+        self.invalidate_core_call_cache(
+            user_context,
+            tags=get_write_tags(path.get_as_string_dangerous(), params),
+        )
         if params is None:
             params = {}
 
@@ -396,7 +558,13 @@ class Querier:
                 params=params,
             )
 
-        return await self.__send_request_helper(path, "DELETE", f, len(self.__hosts))
+        return await self.__send_traced_request(
+            path,
+            "DELETE",
+            f,
+            user_context,
+            Querier.__start_core_call_record(path, "DELETE"),
+        )
 
     async def send_put_request(
         self,
@@ -404,7 +572,10 @@ class Querier:
         data: Union[Dict[str, Any], None],
         user_context: Union[Dict[str, Any], None],
     ) -> Dict[str, Any]:
-        self.invalidate_core_call_cache(user_context)
+        self.invalidate_core_call_cache(
+            user_context,
+            tags=get_write_tags(path.get_as_string_dangerous(), data),
+        )
         if data is None:
             data = {}
 
@@ -425,30 +596,105 @@ class Querier:
                 )
             return await self.api_request(url, method, 2, headers=headers, json=data)
 
-        return await self.__send_request_helper(path, "PUT", f, len(self.__hosts))
+        return await self.__send_traced_request(
+            path, "PUT", f, user_context, Querier.__start_core_call_record(path, "PUT")
+        )
 
     def invalidate_core_call_cache(
         self,
         user_context: Union[Dict[str, Any], None],
         upd_global_cache_tag_if_necessary: bool = True,
+        tags: Optional[Set[str]] = None,
     ):
+        """
+        Invalidates the cached GET responses that have any of the given tags (or
+        all of them if tags is None). Unless keep_cache_alive is set in the
+        user_context, this applies to the responses cached by every request.
+        """
+        if tags is not None and len(tags) == 0:
+            return
+
         if user_context is None:
             # this is done so that the code below runs as expected.
-            # It will reset the __global_cache_tag if needed, and the
-            # stuff we assign to the user_context will just be ignored (as expected)
+            # It will invalidate the tags in the process wide versions if needed,
+            # and the stuff we assign to the user_context will just be ignored (as expected)
             user_context = {}
 
         if upd_global_cache_tag_if_necessary and (
             user_context.get("_default", {}).get("keep_cache_alive", False) is not True
         ):
-            # there can be race conditions here, but i think we can ignore them.
-            Querier.__global_cache_tag = get_timestamp_ms()
+            Querier.__core_call_cache_tag_versions.invalidate(tags)
 
+        core_call_cache: Dict[str, Any] = user_context.get("_default", {}).get(
+            "core_call_cache", {}
+        )
+        user_identity_map: Dict[str, Any] = user_context.get("_default", {}).get(
+            "user_identity_map", {}
+        )
         user_context["_default"] = {
             **user_context.get("_default", {}),
-            "core_call_cache": {},
+            "core_call_cache": (
+                {}
+                if tags is None
+                else {
+                    k: v
+                    for k, v in core_call_cache.items()
+                    if tags.isdisjoint(v["tags"])
+                }
+            ),
+            "user_identity_map": (
+                {}
+                if tags is None
+                else {
+                    k: v
+                    for k, v in user_identity_map.items()
+                    if tags.isdisjoint(v["tags"])
+                }
+            ),
         }
 
+    def get_user_identity_snapshot(
+        self, user_ids: Iterable[str]
+    ) -> Tuple[int, Dict[str, int]]:
+        """
+        To be taken before fetching a user that is then added to the user
+        identity map, so that writes made while it was fetched make it stale.
+        """
+        return Querier.__core_call_cache_tag_versions.snapshot(get_user_tags(user_ids))
+
+    def get_user_from_identity_map(
+        self, user_id: str, user_context: Union[Dict[str, Any], None]
+    ) -> Optional[User]:
+        if Querier.__disable_cache:
+            return None
+        return get_from_user_identity_map(
+            user_context, user_id, Querier.__core_call_cache_tag_versions
+        )
+
+    def add_user_to_identity_map(
+        self,
+        user: User,
+        user_context: Union[Dict[str, Any], None],
+        snapshot: Optional[Tuple[int, Dict[str, int]]] = None,
+    ):
+        if Querier.__disable_cache:
+            return
+        add_to_user_identity_map(
+            user_context, user, Querier.__core_call_cache_tag_versions, snapshot
+        )
+
+    @staticmethod
+    def get_core_call_cache_metrics() -> Dict[str, int]:
+        """
+        Number of GET requests answered from (hits) or not found in (misses) the
+        core call cache, and the number of writes that invalidated it.
+        """
+        metrics = Querier.__core_call_cache_tag_versions.get_metrics()
+        if Querier.__shared_core_call_cache is not None:
+            metrics["shared_hits"] = Querier.__shared_core_call_cache.hits
+            metrics["shared_misses"] = Querier.__shared_core_call_cache.misses
+        return metrics
+
     def get_all_core_urls_for_path(self, path: str) -> List[str]:
         normalized_path = NormalisedURLPath(path)
 
@@ -472,6 +718,7 @@ class Querier:
         http_function: Callable[[str, str], Awaitable[Response]],
         no_of_tries: int,
         retry_info_map: Optional[Dict[str, int]] = None,
+        record: Optional[CoreCallRecord] = None,
     ) -> Dict[str, Any]:
         if no_of_tries == 0:
             raise Exception("No SuperTokens core available to query")
@@ -500,6 +747,8 @@ class Querier:
                 PROCESS_STATE.CALLING_SERVICE_IN_REQUEST_HELPER
             )
             response = await http_function(url, method)
+            if record is not None:
+                record.status_code = response.status_code
             if ("SUPERTOKENS_ENV" in environ) and (
                 environ["SUPERTOKENS_ENV"] == "testing"
             ):
@@ -515,8 +764,10 @@ class Querier:
                     delay = (10 + attempts_made * 250) / 1000
 
                     await asyncio.sleep(delay)
+                    if record is not None:
+                        record.retries += 1
                     return await self.__send_request_helper(
-                        path, method, http_function, no_of_tries, retry_info_map
+                        path, method, http_function, no_of_tries, retry_info_map, record
                     )
 
             if is_4xx_error(response.status_code) or is_5xx_error(response.status_code):  # type: ignore
@@ -541,6 +792,8 @@ class Querier:
             return res
 
         except (ConnectionError, NetworkError, ConnectTimeout) as _:
+            if record is not None and no_of_tries > 1:
+                record.retries += 1
             return await self.__send_request_helper(
-                path, method, http_function, no_of_tries - 1, retry_info_map
+                path, method, http_function, no_of_tries - 1, retry_info_map, record
             )
@@ -142,8 +142,10 @@ class RecipeImplementation(RecipeInterface):
         )
 
         if response["status"] == "OK":
+            user = User.from_json(response["user"])
+            self.querier.add_user_to_identity_map(user, user_context)
             return CreatePrimaryUserOkResult(
-                User.from_json(response["user"]),
+                user,
                 response["wasAlreadyAPrimaryUser"],
             )
         elif (
@@ -268,6 +270,7 @@ class RecipeImplementation(RecipeInterface):
             response["user"] = user
 
         if response["status"] == "OK":
+            self.querier.add_user_to_identity_map(response["user"], user_context)
             return LinkAccountsOkResult(
                 user=response["user"],
                 accounts_already_linked=response["accountsAlreadyLinked"],
@@ -311,6 +314,10 @@ class RecipeImplementation(RecipeInterface):
     async def get_user(
         self, user_id: str, user_context: Dict[str, Any]
     ) -> Optional[User]:
+        user = self.querier.get_user_from_identity_map(user_id, user_context)
+        if user is not None:
+            return user
+        snapshot = self.querier.get_user_identity_snapshot([user_id])
         response = await self.querier.send_get_request(
             NormalisedURLPath("/user/id"),
             {
@@ -319,7 +326,9 @@ class RecipeImplementation(RecipeInterface):
             user_context,
         )
         if response["status"] == "OK":
-            return User.from_json(response["user"])
+            user = User.from_json(response["user"])
+            self.querier.add_user_to_identity_map(user, user_context, snapshot)
+            return user
         return None
 
     async def list_users_by_account_info(
@@ -347,7 +356,10 @@ class RecipeImplementation(RecipeInterface):
             user_context,
         )
 
-        return [User.from_json(u) for u in response["users"]]
+        users = [User.from_json(u) for u in response["users"]]
+        for user in users:
+            self.querier.add_user_to_identity_map(user, user_context)
+        return users
 
     async def delete_user(
         self,
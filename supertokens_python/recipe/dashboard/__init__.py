@@ -29,9 +29,13 @@ def init(
     api_key: Optional[str] = None,
     admins: Optional[List[str]] = None,
     override: Optional[InputOverrideConfig] = None,
+    users_metadata_fetch_concurrency: Optional[int] = None,
+    session_verification_cache_ttl_sec: Optional[int] = None,
 ) -> Callable[[AppInfo], RecipeModule]:
     return DashboardRecipe.init(
         api_key,
         admins,
         override,
+        users_metadata_fetch_concurrency,
+        session_verification_cache_ttl_sec,
     )
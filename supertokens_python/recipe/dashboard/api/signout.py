@@ -23,6 +23,7 @@ from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.querier import Querier
 
 from ..interfaces import SignOutOK
+from ..recipe_implementation import RecipeImplementation
 
 
 async def handle_emailpassword_signout_api(
@@ -44,4 +45,12 @@ async def handle_emailpassword_signout_api(
         {"sessionId": session_id_form_auth_header},
         user_context=_user_context,
     )
+    recipe_implementation = api_options.recipe_implementation
+    if (
+        isinstance(recipe_implementation, RecipeImplementation)
+        and recipe_implementation.session_verification_cache is not None
+    ):
+        recipe_implementation.session_verification_cache.remove(
+            session_id_form_auth_header
+        )
     return SignOutOK()
@@ -1,11 +1,14 @@
-import asyncio
-from typing import List, Optional, Dict, Any
+from typing import Dict, Any, Optional
 
 from supertokens_python.exceptions import raise_bad_input_exception
 from supertokens_python.recipe.session.asyncio import (
     get_all_session_handles_for_user,
     get_session_information,
 )
+from supertokens_python.recipe.session.session_functions import (
+    SESSION_INFORMATION_FETCH_CONCURRENCY,
+)
+from supertokens_python.utils import gather_with_concurrency_limit
 
 from ...interfaces import (
     APIInterface,
@@ -29,22 +32,21 @@ async def handle_sessions_get(
     # Passing tenant id as None sets fetch_across_all_tenants to True
     # which is what we want here.
     session_handles = await get_all_session_handles_for_user(user_id)
-    sessions: List[Optional[SessionInfo]] = [None for _ in session_handles]
 
-    async def call_(i: int, session_handle: str):
+    async def call_(session_handle: str) -> Optional[SessionInfo]:
         try:
             session_response = await get_session_information(
                 session_handle, user_context
             )
             if session_response is not None:
-                sessions[i] = SessionInfo(session_response)
+                return SessionInfo(session_response)
         except Exception:
-            sessions[i] = None
-
-    session_info_promises = [
-        call_(i, handle) for i, handle in enumerate(session_handles)
-    ]
+            pass
+        return None
 
-    await asyncio.gather(*session_info_promises)
+    sessions = await gather_with_concurrency_limit(
+        SESSION_INFORMATION_FETCH_CONCURRENCY,
+        [call_(handle) for handle in session_handles],
+    )
 
     return UserSessionsGetAPIResponse([s for s in sessions if s is not None])
@@ -165,14 +165,20 @@ class DashboardRecipe(RecipeModule):
         api_key: Optional[str],
         admins: Optional[List[str]],
         override: Optional[InputOverrideConfig] = None,
+        users_metadata_fetch_concurrency: Optional[int] = None,
+        session_verification_cache_ttl_sec: Optional[int] = None,
     ):
         super().__init__(recipe_id, app_info)
         self.config = validate_and_normalise_user_input(
             api_key,
             admins,
             override,
+            users_metadata_fetch_concurrency,
+            session_verification_cache_ttl_sec,
+        )
+        recipe_implementation = RecipeImplementation(
+            self.config.session_verification_cache_ttl_sec
         )
-        recipe_implementation = RecipeImplementation()
         self.recipe_implementation = (
             recipe_implementation
             if self.config.override.functions is None
@@ -651,6 +657,8 @@ class DashboardRecipe(RecipeModule):
         api_key: Optional[str],
         admins: Optional[List[str]] = None,
         override: Optional[InputOverrideConfig] = None,
+        users_metadata_fetch_concurrency: Optional[int] = None,
+        session_verification_cache_ttl_sec: Optional[int] = None,
     ):
         def func(app_info: AppInfo):
             if DashboardRecipe.__instance is None:
@@ -660,6 +668,8 @@ class DashboardRecipe(RecipeModule):
                     api_key,
                     admins,
                     override,
+                    users_metadata_fetch_concurrency,
+                    session_verification_cache_ttl_sec,
                 )
                 return DashboardRecipe.__instance
             raise Exception(
@@ -13,7 +13,7 @@
 # under the License.
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from supertokens_python.constants import DASHBOARD_VERSION
 from supertokens_python.framework import BaseRequest
@@ -28,9 +28,18 @@ from supertokens_python.recipe.dashboard.constants import (
 from .interfaces import RecipeInterface
 from .utils import DashboardConfig, validate_api_key
 from .exceptions import DashboardOperationNotAllowedError
+from .session_verification_cache import SessionVerificationCache
 
 
 class RecipeImplementation(RecipeInterface):
+    def __init__(self, session_verification_cache_ttl_sec: Optional[int] = None):
+        super().__init__()
+        self.session_verification_cache: Optional[SessionVerificationCache] = (
+            SessionVerificationCache(session_verification_cache_ttl_sec)
+            if session_verification_cache_ttl_sec is not None
+            else None
+        )
+
     async def get_dashboard_bundle_location(self, user_context: Dict[str, Any]) -> str:
         return f"https://cdn.jsdelivr.net/gh/supertokens/dashboard@v{DASHBOARD_VERSION}/build/"
 
@@ -48,14 +57,24 @@ class RecipeImplementation(RecipeInterface):
 
             auth_header_value = auth_header_value.split()[1]
             session_verification_response = (
-                await Querier.get_instance().send_post_request(
-                    NormalisedURLPath("/recipe/dashboard/session/verify"),
-                    {"sessionId": auth_header_value},
-                    user_context=user_context,
-                )
+                self.session_verification_cache.get(auth_header_value)
+                if self.session_verification_cache is not None
+                else None
             )
-            if session_verification_response.get("status") != "OK":
-                return False
+            if session_verification_response is None:
+                session_verification_response = (
+                    await Querier.get_instance().send_post_request(
+                        NormalisedURLPath("/recipe/dashboard/session/verify"),
+                        {"sessionId": auth_header_value},
+                        user_context=user_context,
+                    )
+                )
+                if session_verification_response.get("status") != "OK":
+                    return False
+                if self.session_verification_cache is not None:
+                    self.session_verification_cache.set(
+                        auth_header_value, session_verification_response
+                    )
 
             # For all non GET requests we also want to check if the
             # user is allowed to perform this operation
@@ -0,0 +1,73 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from hashlib import sha256
+from typing import Any, Dict, Optional, Tuple
+
+from supertokens_python.utils import get_timestamp_ms
+
+MAX_CACHED_DASHBOARD_SESSIONS = 1000
+
+
+class SessionVerificationCache:
+    """
+    Remembers the core's response for dashboard sessions it has verified, so that
+    the API calls made by one dashboard screen don't each verify the session again.
+
+    Only successful verifications are cached, keyed by a hash of the session id.
+    Sessions signed out through this SDK instance are removed right away, sessions
+    revoked elsewhere are rejected once their entry expires.
+    """
+
+    def __init__(self, ttl_sec: int):
+        self.ttl_sec = ttl_sec
+        self.__entries: OrderedDict[str, Tuple[Dict[str, Any], int]] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def __get_key(session_id: str) -> str:
+        return sha256(session_id.encode()).hexdigest()
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        key = self.__get_key(session_id)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= get_timestamp_ms():
+                del self.__entries[key]
+                return None
+            return entry[0]
+
+    def set(self, session_id: str, verification_response: Dict[str, Any]):
+        key = self.__get_key(session_id)
+        with self.__lock:
+            self.__entries[key] = (
+                verification_response,
+                get_timestamp_ms() + self.ttl_sec * 1000,
+            )
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > MAX_CACHED_DASHBOARD_SESSIONS:
+                self.__entries.popitem(last=False)
+
+    def remove(self, session_id: str):
+        with self.__lock:
+            self.__entries.pop(self.__get_key(session_id), None)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
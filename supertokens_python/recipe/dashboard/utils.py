@@ -23,6 +23,9 @@ if TYPE_CHECKING:
 from supertokens_python.recipe.emailpassword import EmailPasswordRecipe
 from supertokens_python.recipe.passwordless import PasswordlessRecipe
 from supertokens_python.recipe.thirdparty import ThirdPartyRecipe
+from supertokens_python.recipe.usermetadata.asyncio import (
+    DEFAULT_BULK_FETCH_CONCURRENCY,
+)
 from supertokens_python.types import User, RecipeUserId
 from supertokens_python.utils import log_debug_message, normalise_email
 
@@ -98,11 +101,15 @@ class DashboardConfig:
         admins: Optional[List[str]],
         override: OverrideConfig,
         auth_mode: str,
+        users_metadata_fetch_concurrency: int = DEFAULT_BULK_FETCH_CONCURRENCY,
+        session_verification_cache_ttl_sec: Optional[int] = None,
     ):
         self.api_key = api_key
         self.admins = admins
         self.override = override
         self.auth_mode = auth_mode
+        self.users_metadata_fetch_concurrency = users_metadata_fetch_concurrency
+        self.session_verification_cache_ttl_sec = session_verification_cache_ttl_sec
 
 
 def validate_and_normalise_user_input(
@@ -110,6 +117,8 @@ def validate_and_normalise_user_input(
     api_key: Union[str, None],
     admins: Optional[List[str]],
     override: Optional[InputOverrideConfig] = None,
+    users_metadata_fetch_concurrency: Optional[int] = None,
+    session_verification_cache_ttl_sec: Optional[int] = None,
 ) -> DashboardConfig:
 
     if override is None:
@@ -122,6 +131,21 @@ def validate_and_normalise_user_input(
 
     admins = [normalise_email(a) for a in admins] if admins is not None else None
 
+    if users_metadata_fetch_concurrency is None:
+        users_metadata_fetch_concurrency = DEFAULT_BULK_FETCH_CONCURRENCY
+    elif users_metadata_fetch_concurrency <= 0:
+        raise ValueError(
+            "users_metadata_fetch_concurrency must be a positive integer or None"
+        )
+
+    if (
+        session_verification_cache_ttl_sec is not None
+        and session_verification_cache_ttl_sec <= 0
+    ):
+        raise ValueError(
+            "session_verification_cache_ttl_sec must be a positive integer or None"
+        )
+
     return DashboardConfig(
         api_key,
         admins,
@@ -130,6 +154,8 @@ def validate_and_normalise_user_input(
             apis=override.apis,
         ),
         "api-key" if api_key else "email-password",
+        users_metadata_fetch_concurrency,
+        session_verification_cache_ttl_sec,
     )
 
 
@@ -12,8 +12,12 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from string import Template
+from typing import Optional
 
+from supertokens_python.ingredients.emaildelivery.templates import (
+    EmailTemplateLoader,
+    load_email_template,
+)
 from supertokens_python.ingredients.emaildelivery.types import EmailContent
 from supertokens_python.recipe.emailpassword.types import PasswordResetEmailTemplateVars
 from supertokens_python.supertokens import Supertokens
@@ -23,11 +27,15 @@ from .password_reset_email import html_template
 
 def get_password_reset_email_content(
     email_input: PasswordResetEmailTemplateVars,
+    template_loader: Optional[EmailTemplateLoader] = None,
 ) -> EmailContent:
     supertokens = Supertokens.get_instance()
     app_name = supertokens.app_info.app_name
     body = get_password_reset_email_html(
-        app_name, email_input.user.email, email_input.password_reset_link
+        app_name,
+        email_input.user.email,
+        email_input.password_reset_link,
+        template_loader,
     )
     content_result = EmailContent(
         body, "Password reset instructions", email_input.user.email, is_html=True
@@ -35,7 +43,15 @@ def get_password_reset_email_content(
     return content_result
 
 
-def get_password_reset_email_html(app_name: str, email: str, reset_link: str):
-    return Template(html_template).substitute(
-        appname=app_name, resetLink=reset_link, toEmail=email
+def get_password_reset_email_html(
+    app_name: str,
+    email: str,
+    reset_link: str,
+    template_loader: Optional[EmailTemplateLoader] = None,
+):
+    template = load_email_template(
+        "emailpassword.password_reset", html_template, template_loader
+    )
+    return template.partial(appname=app_name).render(
+        resetLink=reset_link, toEmail=email
     )
@@ -33,4 +33,4 @@ class ServiceImplementation(SMTPServiceInterface[EmailTemplateVars]):
     async def get_content(
         self, template_vars: EmailTemplateVars, user_context: Dict[str, Any]
     ) -> EmailContent:
-        return get_password_reset_email_content(template_vars)
+        return get_password_reset_email_content(template_vars, self.template_loader)
@@ -108,7 +108,8 @@ class EmailPasswordRecipe(RecipeModule):
         email_delivery_ingredient = ingredients.email_delivery
         if email_delivery_ingredient is None:
             self.email_delivery = EmailDeliveryIngredient(
-                self.config.get_email_delivery_config(self.recipe_implementation)
+                self.config.get_email_delivery_config(self.recipe_implementation),
+                f"{recipe_id}.email",
             )
         else:
             self.email_delivery = email_delivery_ingredient
@@ -272,7 +272,9 @@ def validate_and_normalise_user_input(
     ) -> EmailDeliveryConfigWithService[EmailTemplateVars]:
         if email_delivery and email_delivery.service:
             return EmailDeliveryConfigWithService(
-                service=email_delivery.service, override=email_delivery.override
+                service=email_delivery.service,
+                override=email_delivery.override,
+                queue=email_delivery.queue,
             )
 
         email_service = BackwardCompatibilityService(
@@ -283,7 +285,11 @@ def validate_and_normalise_user_input(
             override = email_delivery.override
         else:
             override = None
-        return EmailDeliveryConfigWithService(email_service, override=override)
+        return EmailDeliveryConfigWithService(
+            email_service,
+            override=override,
+            queue=email_delivery.queue if email_delivery is not None else None,
+        )
 
     return EmailPasswordConfig(
         SignUpFeature(sign_up_feature.form_fields),
@@ -15,6 +15,9 @@
 from typing import Any, Dict, Callable, Union
 
 from supertokens_python.ingredients.emaildelivery.services.smtp import Transporter
+from supertokens_python.ingredients.emaildelivery.templates import (
+    EmailTemplateLoader,
+)
 from supertokens_python.ingredients.emaildelivery.types import (
     EmailDeliveryInterface,
     SMTPServiceInterface,
@@ -35,9 +38,10 @@ class SMTPService(EmailDeliveryInterface[VerificationEmailTemplateVars]):
         self,
         smtp_settings: SMTPSettings,
         override: Union[Callable[[SMTPOverrideInput], SMTPOverrideInput], None] = None,
+        template_loader: Union[EmailTemplateLoader, None] = None,
     ) -> None:
         transporter = Transporter(smtp_settings)
-        oi = ServiceImplementation(transporter)
+        oi = ServiceImplementation(transporter, template_loader)
         self.service_implementation = oi if override is None else override(oi)
 
     async def send_email(
@@ -12,8 +12,12 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from string import Template
+from typing import Optional
 
+from supertokens_python.ingredients.emaildelivery.templates import (
+    EmailTemplateLoader,
+    load_email_template,
+)
 from supertokens_python.ingredients.emaildelivery.types import EmailContent
 from supertokens_python.recipe.emailverification.types import (
     VerificationEmailTemplateVars,
@@ -25,18 +29,30 @@ from .email_verify_email import html_template
 
 def get_email_verify_email_content(
     email_input: VerificationEmailTemplateVars,
+    template_loader: Optional[EmailTemplateLoader] = None,
 ) -> EmailContent:
     supertokens = Supertokens.get_instance()
     app_name = supertokens.app_info.app_name
     body = get_email_verify_email_html(
-        app_name, email_input.user.email, email_input.email_verify_link
+        app_name,
+        email_input.user.email,
+        email_input.email_verify_link,
+        template_loader,
     )
     return EmailContent(
         body, "Email verification instructions", email_input.user.email, is_html=True
     )
 
 
-def get_email_verify_email_html(app_name: str, email: str, verification_link: str):
-    return Template(html_template).substitute(
-        appname=app_name, verificationLink=verification_link, toEmail=email
+def get_email_verify_email_html(
+    app_name: str,
+    email: str,
+    verification_link: str,
+    template_loader: Optional[EmailTemplateLoader] = None,
+):
+    template = load_email_template(
+        "emailverification.email_verify", html_template, template_loader
+    )
+    return template.partial(appname=app_name).render(
+        verificationLink=verification_link, toEmail=email
     )
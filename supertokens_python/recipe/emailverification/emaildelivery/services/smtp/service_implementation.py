@@ -36,4 +36,4 @@ class ServiceImplementation(SMTPServiceInterface[VerificationEmailTemplateVars])
         self, template_vars: VerificationEmailTemplateVars, user_context: Dict[str, Any]
     ) -> EmailContent:
         _ = user_context
-        return get_email_verify_email_content(template_vars)
+        return get_email_verify_email_content(template_vars, self.template_loader)
@@ -124,7 +124,7 @@ class EmailVerificationRecipe(RecipeModule):
         email_delivery_ingredient = ingredients.email_delivery
         if email_delivery_ingredient is None:
             self.email_delivery = EmailDeliveryIngredient(
-                self.config.get_email_delivery_config()
+                self.config.get_email_delivery_config(), f"{recipe_id}.email"
             )
         else:
             self.email_delivery = email_delivery_ingredient
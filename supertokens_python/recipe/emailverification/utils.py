@@ -87,7 +87,11 @@ def validate_and_normalise_user_input(
             override = email_delivery.override
         else:
             override = None
-        return EmailDeliveryConfigWithService(email_service, override=override)
+        return EmailDeliveryConfigWithService(
+            email_service,
+            override=override,
+            queue=email_delivery.queue if email_delivery is not None else None,
+        )
 
     if override is not None and not isinstance(override, OverrideConfig):  # type: ignore
         raise ValueError("override must be of type OverrideConfig or None")
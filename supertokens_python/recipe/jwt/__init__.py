@@ -27,5 +27,6 @@ if TYPE_CHECKING:
 def init(
     jwt_validity_seconds: Union[int, None] = None,
     override: Union[OverrideConfig, None] = None,
+    cache_jwks_response: bool = False,
 ) -> Callable[[AppInfo], RecipeModule]:
-    return JWTRecipe.init(jwt_validity_seconds, override)
+    return JWTRecipe.init(jwt_validity_seconds, override, cache_jwks_response)
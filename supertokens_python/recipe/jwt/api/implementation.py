@@ -24,6 +24,17 @@ class APIImplementation(APIInterface):
     async def jwks_get(
         self, api_options: APIOptions, user_context: Dict[str, Any]
     ) -> JWKSGetResponse:
+        if api_options.jwks_cache is not None:
+            cached = await api_options.jwks_cache.get_or_fetch(
+                lambda: api_options.recipe_implementation.get_jwks(user_context)
+            )
+            api_options.response.set_header(
+                "Cache-Control",
+                f"max-age={cached.remaining_validity_in_secs()}, must-revalidate",
+            )
+            api_options.response.set_header("ETag", cached.etag)
+            return JWKSGetResponse(cached.keys, cached.body)
+
         response = await api_options.recipe_implementation.get_jwks(user_context)
 
         if response.validity_in_secs is not None:
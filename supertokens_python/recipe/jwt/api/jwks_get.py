@@ -14,7 +14,7 @@
 from __future__ import annotations
 from typing import Any, Dict
 from supertokens_python.recipe.jwt.interfaces import APIInterface, APIOptions
-from supertokens_python.utils import send_200_response
+from supertokens_python.utils import etag_matches, send_200_response
 
 from ..interfaces import JWKSGetResponse
 
@@ -32,4 +32,16 @@ async def jwks_get(
     if isinstance(result, JWKSGetResponse):
         api_options.response.set_header("Access-Control-Allow-Origin", "*")
 
+        etag = api_options.response.get_header("ETag")
+        if etag is not None and etag_matches(
+            etag, api_options.request.get_header("If-None-Match")
+        ):
+            api_options.response.set_status_code(304)
+            return api_options.response
+
+        if result.serialized_body is not None:
+            api_options.response.set_json_bytes_content(result.serialized_body)
+            api_options.response.set_status_code(200)
+            return api_options.response
+
     return send_200_response(result.to_json(), api_options.response)
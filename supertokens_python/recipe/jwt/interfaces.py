@@ -12,13 +12,16 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Union, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Union, Optional
 
 from supertokens_python.framework import BaseRequest, BaseResponse
 from supertokens_python.types import APIResponse, GeneralErrorResponse
 
 from .utils import JWTConfig
 
+if TYPE_CHECKING:
+    from .jwks_response_cache import JWKSResponseCache
+
 
 class JsonWebKey:
     def __init__(self, kty: str, kid: str, n: str, e: str, alg: str, use: str):
@@ -72,17 +75,21 @@ class APIOptions:
         recipe_id: str,
         config: JWTConfig,
         recipe_implementation: RecipeInterface,
+        jwks_cache: Optional["JWKSResponseCache"] = None,
     ):
         self.request = request
         self.response = response
         self.recipe_id = recipe_id
         self.config = config
         self.recipe_implementation = recipe_implementation
+        self.jwks_cache = jwks_cache
 
 
 class JWKSGetResponse(APIResponse):
-    def __init__(self, keys: List[JsonWebKey]):
+    def __init__(self, keys: List[JsonWebKey], serialized_body: Optional[bytes] = None):
         self.keys = keys
+        # The JSON of the keys, if it was already serialised (by the JWKS cache)
+        self.serialized_body = serialized_body
 
     def to_json(self) -> Dict[str, Any]:
         keys: List[Dict[str, Any]] = []
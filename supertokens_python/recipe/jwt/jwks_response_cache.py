@@ -0,0 +1,123 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+from math import ceil
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from weakref import WeakKeyDictionary
+
+from supertokens_python.logger import log_debug_message
+from supertokens_python.utils import (
+    get_etag,
+    get_timestamp_ms,
+    serialise_json_response,
+)
+
+from .interfaces import GetJWKSResult, JsonWebKey
+
+# Used when the core doesn't say how long the keys are valid for
+DEFAULT_CACHED_JWKS_VALIDITY_SEC = 60
+
+
+class CachedJWKS:
+    def __init__(
+        self,
+        keys: List[JsonWebKey],
+        validity_in_secs: int,
+        previous: Optional[CachedJWKS] = None,
+    ):
+        self.keys = keys
+        self.expires_at = get_timestamp_ms() + validity_in_secs * 1000
+        self.body = serialise_json_response(
+            {"keys": [key_to_json(key) for key in keys]}
+        )
+        if previous is not None and previous.body == self.body:
+            # the keys didn't change, so neither did the ETag
+            self.etag = previous.etag
+        else:
+            self.etag = get_etag(self.body)
+
+    def remaining_validity_in_secs(self) -> int:
+        return max(0, ceil((self.expires_at - get_timestamp_ms()) / 1000))
+
+
+def key_to_json(key: JsonWebKey) -> Dict[str, Any]:
+    return {
+        "kty": key.kty,
+        "kid": key.kid,
+        "n": key.n,
+        "e": key.e,
+        "alg": key.alg,
+        "use": key.use,
+    }
+
+
+class JWKSResponseCache:
+    """
+    Keeps the JWKS served by the jwks.json API, with its serialised body and
+    ETag, for as long as the core says the keys are valid. Concurrent requests
+    on an event loop that find the keys expired share one get_jwks call.
+    """
+
+    def __init__(self):
+        self.entry: Optional[CachedJWKS] = None
+        self.in_flight: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Task[CachedJWKS]
+        ] = WeakKeyDictionary()
+
+    def get(self) -> Optional[CachedJWKS]:
+        entry = self.entry
+        if entry is None or entry.expires_at <= get_timestamp_ms():
+            return None
+        return entry
+
+    async def get_or_fetch(
+        self, fetch: Callable[[], Awaitable[GetJWKSResult]]
+    ) -> CachedJWKS:
+        entry = self.get()
+        if entry is not None:
+            return entry
+
+        loop = asyncio.get_running_loop()
+        task = self.in_flight.get(loop)
+        if task is None:
+
+            async def fetch_and_set() -> CachedJWKS:
+                result = await fetch()
+                validity_in_secs = (
+                    result.validity_in_secs
+                    if result.validity_in_secs is not None
+                    else DEFAULT_CACHED_JWKS_VALIDITY_SEC
+                )
+                fetched = CachedJWKS(result.keys, validity_in_secs, self.entry)
+                self.entry = fetched
+                return fetched
+
+            task = loop.create_task(fetch_and_set())
+
+            def on_done(t: asyncio.Task[CachedJWKS]):
+                self.in_flight.pop(loop, None)
+                if not t.cancelled() and t.exception() is not None:
+                    log_debug_message("Fetching the JWKS failed: %s", t.exception())
+
+            task.add_done_callback(on_done)
+            self.in_flight[loop] = task
+
+        # shield so that a cancelled request doesn't cancel the fetch other requests are waiting on
+        return await asyncio.shield(task)
+
+    def clear(self):
+        self.entry = None
+        self.in_flight.clear()
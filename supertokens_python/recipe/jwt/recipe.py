@@ -22,6 +22,7 @@ from supertokens_python.recipe.jwt.api.jwks_get import jwks_get
 from supertokens_python.recipe.jwt.constants import GET_JWKS_API
 from supertokens_python.recipe.jwt.exceptions import SuperTokensJWTError
 from supertokens_python.recipe.jwt.interfaces import APIOptions
+from supertokens_python.recipe.jwt.jwks_response_cache import JWKSResponseCache
 from supertokens_python.recipe.jwt.recipe_implementation import RecipeImplementation
 from supertokens_python.recipe.jwt.utils import (
     OverrideConfig,
@@ -48,9 +49,15 @@ class JWTRecipe(RecipeModule):
         app_info: AppInfo,
         jwt_validity_seconds: Union[int, None] = None,
         override: Union[OverrideConfig, None] = None,
+        cache_jwks_response: bool = False,
     ):
         super().__init__(recipe_id, app_info)
-        self.config = validate_and_normalise_user_input(jwt_validity_seconds, override)
+        self.config = validate_and_normalise_user_input(
+            jwt_validity_seconds, override, cache_jwks_response
+        )
+        self.jwks_cache = (
+            JWKSResponseCache() if self.config.cache_jwks_response else None
+        )
 
         recipe_implementation = RecipeImplementation(
             Querier.get_instance(recipe_id), self.config, app_info
@@ -93,6 +100,7 @@ class JWTRecipe(RecipeModule):
             self.get_recipe_id(),
             self.config,
             self.recipe_implementation,
+            self.jwks_cache,
         )
 
         if request_id == GET_JWKS_API:
@@ -121,11 +129,16 @@ class JWTRecipe(RecipeModule):
     def init(
         jwt_validity_seconds: Union[int, None] = None,
         override: Union[OverrideConfig, None] = None,
+        cache_jwks_response: bool = False,
     ):
         def func(app_info: AppInfo):
             if JWTRecipe.__instance is None:
                 JWTRecipe.__instance = JWTRecipe(
-                    JWTRecipe.recipe_id, app_info, jwt_validity_seconds, override
+                    JWTRecipe.recipe_id,
+                    app_info,
+                    jwt_validity_seconds,
+                    override,
+                    cache_jwks_response,
                 )
                 return JWTRecipe.__instance
             raise_general_exception(
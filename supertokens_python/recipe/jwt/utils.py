@@ -30,14 +30,21 @@ class OverrideConfig:
 
 
 class JWTConfig:
-    def __init__(self, override: OverrideConfig, jwt_validity_seconds: int):
+    def __init__(
+        self,
+        override: OverrideConfig,
+        jwt_validity_seconds: int,
+        cache_jwks_response: bool = False,
+    ):
         self.override = override
         self.jwt_validity_seconds = jwt_validity_seconds
+        self.cache_jwks_response = cache_jwks_response
 
 
 def validate_and_normalise_user_input(
     jwt_validity_seconds: Union[int, None] = None,
     override: Union[OverrideConfig, None] = None,
+    cache_jwks_response: bool = False,
 ):
     if jwt_validity_seconds is not None and not isinstance(jwt_validity_seconds, int):  # type: ignore
         raise ValueError("jwt_validity_seconds must be an integer or None")
@@ -50,4 +57,4 @@ def validate_and_normalise_user_input(
     if jwt_validity_seconds is None:
         jwt_validity_seconds = 3153600000
 
-    return JWTConfig(override, jwt_validity_seconds)
+    return JWTConfig(override, jwt_validity_seconds, cache_jwks_response)
@@ -34,8 +34,10 @@ def init(
         TypeGetAllowedDomainsForTenantId, None
     ] = None,
     override: Union[InputOverrideConfig, None] = None,
+    tenant_config_cache_ttl_sec: Union[int, None] = None,
 ) -> Callable[[AppInfo], RecipeModule]:
     return recipe.MultitenancyRecipe.init(
         get_allowed_domains_for_tenant_id,
         override,
+        tenant_config_cache_ttl_sec,
     )
@@ -40,7 +40,7 @@ class APIImplementation(APIInterface):
             "supertokens_python.recipe.multifactorauth.utils"
         )
         from supertokens_python.recipe.thirdparty.providers.config_utils import (
-            merge_providers_from_core_and_static,
+            get_merged_providers_for_tenant,
             find_and_create_provider_instance,
         )
 
@@ -55,12 +55,9 @@ class APIImplementation(APIInterface):
         if tenant_config is None:
             raise Exception("Tenant not found")
 
-        provider_inputs_from_static = api_options.static_third_party_providers
-        provider_configs_from_core = tenant_config.third_party_providers
-
-        merged_providers = merge_providers_from_core_and_static(
-            provider_configs_from_core,
-            provider_inputs_from_static,
+        merged_providers = get_merged_providers_for_tenant(
+            tenant_config,
+            api_options.static_third_party_providers,
             tenant_id == DEFAULT_TENANT_ID,
         )
 
@@ -64,11 +64,13 @@ class MultitenancyRecipe(RecipeModule):
             TypeGetAllowedDomainsForTenantId
         ] = None,
         override: Union[InputOverrideConfig, None] = None,
+        tenant_config_cache_ttl_sec: Union[int, None] = None,
     ) -> None:
         super().__init__(recipe_id, app_info)
         self.config = validate_and_normalise_user_input(
             get_allowed_domains_for_tenant_id,
             override,
+            tenant_config_cache_ttl_sec,
         )
 
         recipe_implementation = RecipeImplementation(
@@ -154,6 +156,7 @@ class MultitenancyRecipe(RecipeModule):
             TypeGetAllowedDomainsForTenantId, None
         ] = None,
         override: Union[InputOverrideConfig, None] = None,
+        tenant_config_cache_ttl_sec: Union[int, None] = None,
     ):
         def func(app_info: AppInfo):
             if MultitenancyRecipe.__instance is None:
@@ -162,6 +165,7 @@ class MultitenancyRecipe(RecipeModule):
                     app_info,
                     get_allowed_domains_for_tenant_id,
                     override,
+                    tenant_config_cache_ttl_sec,
                 )
 
                 def callback():
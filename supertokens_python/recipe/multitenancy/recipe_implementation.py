@@ -43,6 +43,7 @@ if TYPE_CHECKING:
 
 from supertokens_python.querier import NormalisedURLPath
 from .constants import DEFAULT_TENANT_ID
+from .tenant_config_cache import TenantConfigCache
 
 
 def parse_tenant_config(tenant: Dict[str, Any]) -> TenantConfig:
@@ -120,6 +121,15 @@ class RecipeImplementation(RecipeInterface):
         super().__init__()
         self.querier = querier
         self.config = config
+        self.tenant_config_cache: Optional[TenantConfigCache] = (
+            TenantConfigCache(config.tenant_config_cache_ttl_sec)
+            if config.tenant_config_cache_ttl_sec is not None
+            else None
+        )
+
+    def invalidate_cached_tenant(self, tenant_id: Optional[str]):
+        if self.tenant_config_cache is not None:
+            self.tenant_config_cache.invalidate(tenant_id or DEFAULT_TENANT_ID)
 
     async def get_tenant_id(
         self, tenant_id_from_frontend: str, user_context: Dict[str, Any]
@@ -149,6 +159,7 @@ class RecipeImplementation(RecipeInterface):
             json_body,
             user_context=user_context,
         )
+        self.invalidate_cached_tenant(tenant_id)
         return CreateOrUpdateTenantOkResult(
             created_new=response["createdNew"],
         )
@@ -161,6 +172,7 @@ class RecipeImplementation(RecipeInterface):
             {"tenantId": tenant_id},
             user_context=user_context,
         )
+        self.invalidate_cached_tenant(tenant_id)
         return DeleteTenantOkResult(
             did_exist=response["didExist"],
         )
@@ -168,6 +180,15 @@ class RecipeImplementation(RecipeInterface):
     async def get_tenant(
         self, tenant_id: Optional[str], user_context: Dict[str, Any]
     ) -> Optional[TenantConfig]:
+        generation = 0
+        if self.tenant_config_cache is not None:
+            cached_tenant_config = self.tenant_config_cache.get(
+                tenant_id or DEFAULT_TENANT_ID
+            )
+            if cached_tenant_config is not None:
+                return cached_tenant_config
+            generation = self.tenant_config_cache.get_generation()
+
         res = await self.querier.send_get_request(
             NormalisedURLPath(
                 f"{tenant_id or DEFAULT_TENANT_ID}/recipe/multitenancy/tenant/v2"
@@ -181,6 +202,11 @@ class RecipeImplementation(RecipeInterface):
 
         tenant_config = parse_tenant_config(res)
 
+        if self.tenant_config_cache is not None:
+            self.tenant_config_cache.set(
+                tenant_id or DEFAULT_TENANT_ID, tenant_config, generation
+            )
+
         return tenant_config
 
     async def list_all_tenants(
@@ -219,6 +245,7 @@ class RecipeImplementation(RecipeInterface):
             },
             user_context=user_context,
         )
+        self.invalidate_cached_tenant(tenant_id)
 
         return CreateOrUpdateThirdPartyConfigOkResult(
             created_new=response["createdNew"],
@@ -239,6 +266,7 @@ class RecipeImplementation(RecipeInterface):
             },
             user_context=user_context,
         )
+        self.invalidate_cached_tenant(tenant_id)
 
         return DeleteThirdPartyConfigOkResult(
             did_config_exist=response["didConfigExist"],
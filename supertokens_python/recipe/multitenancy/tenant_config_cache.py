@@ -0,0 +1,72 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import threading
+from typing import Dict, Optional, Tuple
+
+from supertokens_python.utils import get_timestamp_ms
+
+from .interfaces import TenantConfig
+
+
+class TenantConfigCache:
+    """
+    Process wide cache of the tenant configs returned by the core, so that
+    get_tenant doesn't query the core on every sign in / authorisation URL call.
+
+    Changes made through this SDK instance invalidate the cached tenant right
+    away. Changes made elsewhere (the dashboard of another instance, the core
+    API) are picked up once the entry expires.
+    """
+
+    def __init__(self, ttl_sec: int):
+        self.ttl_sec = ttl_sec
+        self.__entries: Dict[str, Tuple[TenantConfig, int]] = {}
+        # Bumped on every invalidation so that a fetch that started before a
+        # tenant was updated doesn't put the old config back in the cache.
+        self.__generation = 0
+        self.__lock = threading.Lock()
+
+    def get_generation(self) -> int:
+        return self.__generation
+
+    def get(self, tenant_id: str) -> Optional[TenantConfig]:
+        with self.__lock:
+            entry = self.__entries.get(tenant_id)
+            if entry is None:
+                return None
+            if entry[1] <= get_timestamp_ms():
+                del self.__entries[tenant_id]
+                return None
+            return entry[0]
+
+    def set(self, tenant_id: str, tenant_config: TenantConfig, generation: int):
+        with self.__lock:
+            if generation != self.__generation:
+                return
+            self.__entries[tenant_id] = (
+                tenant_config,
+                get_timestamp_ms() + self.ttl_sec * 1000,
+            )
+
+    def invalidate(self, tenant_id: str):
+        with self.__lock:
+            self.__generation += 1
+            self.__entries.pop(tenant_id, None)
+
+    def clear(self):
+        with self.__lock:
+            self.__generation += 1
+            self.__entries.clear()
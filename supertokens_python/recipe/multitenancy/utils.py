@@ -86,14 +86,17 @@ class MultitenancyConfig:
         self,
         get_allowed_domains_for_tenant_id: Optional[TypeGetAllowedDomainsForTenantId],
         override: OverrideConfig,
+        tenant_config_cache_ttl_sec: Optional[int],
     ):
         self.get_allowed_domains_for_tenant_id = get_allowed_domains_for_tenant_id
         self.override = override
+        self.tenant_config_cache_ttl_sec = tenant_config_cache_ttl_sec
 
 
 def validate_and_normalise_user_input(
     get_allowed_domains_for_tenant_id: Optional[TypeGetAllowedDomainsForTenantId],
     override: Union[InputOverrideConfig, None] = None,
+    tenant_config_cache_ttl_sec: Union[int, None] = None,
 ) -> MultitenancyConfig:
     if override is not None and not isinstance(override, OverrideConfig):  # type: ignore
         raise ValueError("override must be of type OverrideConfig or None")
@@ -101,7 +104,16 @@ def validate_and_normalise_user_input(
     if override is None:
         override = InputOverrideConfig()
 
+    if tenant_config_cache_ttl_sec is not None and (
+        not isinstance(tenant_config_cache_ttl_sec, int)  # type: ignore
+        or tenant_config_cache_ttl_sec <= 0
+    ):
+        raise ValueError(
+            "tenant_config_cache_ttl_sec must be a positive integer or None"
+        )
+
     return MultitenancyConfig(
         get_allowed_domains_for_tenant_id,
         OverrideConfig(override.functions, override.apis),
+        tenant_config_cache_ttl_sec,
     )
@@ -28,5 +28,8 @@ def init(
     jwt_validity_seconds: Union[int, None] = None,
     issuer: Union[str, None] = None,
     override: Union[InputOverrideConfig, None] = None,
+    cache_jwks_response: bool = False,
 ) -> Callable[[AppInfo], RecipeModule]:
-    return OpenIdRecipe.init(jwt_validity_seconds, issuer, override)
+    return OpenIdRecipe.init(
+        jwt_validity_seconds, issuer, override, cache_jwks_response
+    )
@@ -14,7 +14,9 @@
 from __future__ import annotations
 from typing import Any, Dict
 from supertokens_python.recipe.openid.interfaces import APIInterface, APIOptions
-from supertokens_python.utils import send_200_response
+from supertokens_python.utils import etag_matches, send_200_response
+
+from ..discovery_document import DISCOVERY_DOCUMENT_MAX_AGE_SEC
 
 from ..interfaces import OpenIdDiscoveryConfigurationGetResponse
 
@@ -33,4 +35,20 @@ async def open_id_discovery_configuration_get(
 
     if isinstance(result, OpenIdDiscoveryConfigurationGetResponse):
         api_options.response.set_header("Access-Control-Allow-Origin", "*")
+
+        if api_options.discovery_document_cache is not None:
+            document = api_options.discovery_document_cache.get(result.to_json())
+            api_options.response.set_header(
+                "Cache-Control", f"public, max-age={DISCOVERY_DOCUMENT_MAX_AGE_SEC}"
+            )
+            api_options.response.set_header("ETag", document.etag)
+            if etag_matches(
+                document.etag, api_options.request.get_header("If-None-Match")
+            ):
+                api_options.response.set_status_code(304)
+                return api_options.response
+            api_options.response.set_json_bytes_content(document.body)
+            api_options.response.set_status_code(200)
+            return api_options.response
+
     return send_200_response(result.to_json(), api_options.response)
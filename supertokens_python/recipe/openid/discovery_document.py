@@ -0,0 +1,49 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Tuple
+
+from supertokens_python.utils import get_etag, serialise_json_response
+
+# The document only changes with the config, and clients can revalidate cheaply
+# with the ETag.
+DISCOVERY_DOCUMENT_MAX_AGE_SEC = 3600
+
+
+class SerialisedDiscoveryDocument:
+    def __init__(self, content: Dict[str, Any]):
+        self.content = content
+        self.body = serialise_json_response(content)
+        self.etag = get_etag(self.body)
+
+
+class DiscoveryDocumentCache:
+    """
+    Keeps the serialised discovery document and its ETag. It's keyed by the
+    document's content, so a different issuer (from a config change or an
+    override) serialises the new document once.
+    """
+
+    def __init__(self):
+        self.__entry: Optional[Tuple[Any, SerialisedDiscoveryDocument]] = None
+
+    def get(self, content: Dict[str, Any]) -> SerialisedDiscoveryDocument:
+        key = tuple(sorted(content.items()))
+        entry = self.__entry
+        if entry is not None and entry[0] == key:
+            return entry[1]
+        document = SerialisedDiscoveryDocument(content)
+        self.__entry = (key, document)
+        return document
@@ -12,7 +12,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Union, Optional
+from typing import TYPE_CHECKING, Any, Dict, Union, Optional
 
 from supertokens_python.framework import BaseRequest, BaseResponse
 from supertokens_python.recipe.jwt.interfaces import (
@@ -24,6 +24,9 @@ from supertokens_python.types import APIResponse, GeneralErrorResponse
 
 from .utils import OpenIdConfig
 
+if TYPE_CHECKING:
+    from .discovery_document import DiscoveryDocumentCache
+
 
 class GetOpenIdDiscoveryConfigurationResult:
     def __init__(self, issuer: str, jwks_uri: str):
@@ -64,12 +67,14 @@ class APIOptions:
         recipe_id: str,
         config: OpenIdConfig,
         recipe_implementation: RecipeInterface,
+        discovery_document_cache: Optional["DiscoveryDocumentCache"] = None,
     ):
         self.request = request
         self.response = response
         self.recipe_id = recipe_id
         self.config = config
         self.recipe_implementation = recipe_implementation
+        self.discovery_document_cache = discovery_document_cache
 
 
 class OpenIdDiscoveryConfigurationGetResponse(APIResponse):
@@ -21,6 +21,7 @@ from supertokens_python.querier import Querier
 from .api.implementation import APIImplementation
 from .api.open_id_discovery_configuration_get import open_id_discovery_configuration_get
 from .constants import GET_DISCOVERY_CONFIG_URL
+from .discovery_document import DiscoveryDocumentCache
 from .exceptions import SuperTokensOpenIdError
 from .interfaces import APIOptions
 from .recipe_implementation import RecipeImplementation
@@ -47,6 +48,7 @@ class OpenIdRecipe(RecipeModule):
         jwt_validity_seconds: Union[int, None] = None,
         issuer: Union[str, None] = None,
         override: Union[InputOverrideConfig, None] = None,
+        cache_jwks_response: bool = False,
     ):
         from supertokens_python.recipe.jwt import JWTRecipe
 
@@ -56,7 +58,7 @@ class OpenIdRecipe(RecipeModule):
         if override is not None:
             jwt_feature = override.jwt_feature
         self.jwt_recipe = JWTRecipe(
-            recipe_id, app_info, jwt_validity_seconds, jwt_feature
+            recipe_id, app_info, jwt_validity_seconds, jwt_feature, cache_jwks_response
         )
 
         recipe_implementation = RecipeImplementation(
@@ -70,6 +72,7 @@ class OpenIdRecipe(RecipeModule):
             if self.config.override.functions is None
             else self.config.override.functions(recipe_implementation)
         )
+        self.discovery_document_cache = DiscoveryDocumentCache()
         api_implementation = APIImplementation()
         self.api_implementation = (
             api_implementation
@@ -103,6 +106,7 @@ class OpenIdRecipe(RecipeModule):
             self.get_recipe_id(),
             self.config,
             self.recipe_implementation,
+            self.discovery_document_cache,
         )
 
         if request_id == GET_DISCOVERY_CONFIG_URL:
@@ -138,6 +142,7 @@ class OpenIdRecipe(RecipeModule):
         jwt_validity_seconds: Union[int, None] = None,
         issuer: Union[str, None] = None,
         override: Union[InputOverrideConfig, None] = None,
+        cache_jwks_response: bool = False,
     ):
         def func(app_info: AppInfo):
             if OpenIdRecipe.__instance is None:
@@ -147,6 +152,7 @@ class OpenIdRecipe(RecipeModule):
                     jwt_validity_seconds,
                     issuer,
                     override,
+                    cache_jwks_response,
                 )
                 return OpenIdRecipe.__instance
             raise_general_exception(
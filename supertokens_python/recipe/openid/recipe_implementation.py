@@ -13,7 +13,7 @@
 # under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Union, Optional
+from typing import TYPE_CHECKING, Any, Dict, Tuple, Union, Optional
 
 from supertokens_python.querier import Querier
 
@@ -22,6 +22,7 @@ if TYPE_CHECKING:
     from .interfaces import CreateJwtOkResult, CreateJwtResultUnsupportedAlgorithm
     from supertokens_python.supertokens import AppInfo
 
+from supertokens_python.normalised_url_domain import NormalisedURLDomain
 from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.recipe.jwt.constants import GET_JWKS_API
 from supertokens_python.recipe.jwt.interfaces import (
@@ -39,20 +40,33 @@ class RecipeImplementation(RecipeInterface):
     async def get_open_id_discovery_configuration(
         self, user_context: Dict[str, Any]
     ) -> GetOpenIdDiscoveryConfigurationResult:
-        issuer = (
-            self.config.issuer_domain.get_as_string_dangerous()
-            + self.config.issuer_path.get_as_string_dangerous()
-        )
-
-        jwks_uri = (
-            self.config.issuer_domain.get_as_string_dangerous()
-            + self.config.issuer_path.append(
-                NormalisedURLPath(GET_JWKS_API)
-            ).get_as_string_dangerous()
-        )
-
+        issuer, jwks_uri = self.get_issuer_and_jwks_uri()
         return GetOpenIdDiscoveryConfigurationResult(issuer, jwks_uri)
 
+    def get_issuer_and_jwks_uri(self) -> Tuple[str, str]:
+        # Built once, and again only if the issuer in the config is replaced
+        issuer_domain = self.config.issuer_domain
+        issuer_path = self.config.issuer_path
+        if self.__issuer_and_jwks_uri is None or self.__issuer_and_jwks_uri[0] != (
+            issuer_domain,
+            issuer_path,
+        ):
+            issuer = (
+                issuer_domain.get_as_string_dangerous()
+                + issuer_path.get_as_string_dangerous()
+            )
+            jwks_uri = (
+                issuer_domain.get_as_string_dangerous()
+                + issuer_path.append(
+                    NormalisedURLPath(GET_JWKS_API)
+                ).get_as_string_dangerous()
+            )
+            self.__issuer_and_jwks_uri = (
+                (issuer_domain, issuer_path),
+                (issuer, jwks_uri),
+            )
+        return self.__issuer_and_jwks_uri[1]
+
     def __init__(
         self,
         querier: Querier,
@@ -65,6 +79,9 @@ class RecipeImplementation(RecipeInterface):
         self.config = config
         self.app_info = app_info
         self.jwt_recipe_implementation = jwt_recipe_implementation
+        self.__issuer_and_jwks_uri: Optional[
+            Tuple[Tuple[NormalisedURLDomain, NormalisedURLPath], Tuple[str, str]]
+        ] = None
 
     async def create_jwt(
         self,
@@ -73,10 +90,7 @@ class RecipeImplementation(RecipeInterface):
         use_static_signing_key: Optional[bool],
         user_context: Dict[str, Any],
     ) -> Union[CreateJwtOkResult, CreateJwtResultUnsupportedAlgorithm]:
-        issuer = (
-            self.config.issuer_domain.get_as_string_dangerous()
-            + self.config.issuer_path.get_as_string_dangerous()
-        )
+        issuer, _ = self.get_issuer_and_jwks_uri()
         payload = {"iss": issuer, **payload}
         return await self.jwt_recipe_implementation.create_jwt(
             payload, validity_seconds, use_static_signing_key, user_context
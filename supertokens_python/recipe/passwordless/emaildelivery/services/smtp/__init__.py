@@ -17,6 +17,9 @@ from __future__ import annotations
 from typing import Any, Dict, Callable, Union
 
 from supertokens_python.ingredients.emaildelivery.services.smtp import Transporter
+from supertokens_python.ingredients.emaildelivery.templates import (
+    EmailTemplateLoader,
+)
 from supertokens_python.ingredients.emaildelivery.types import (
     EmailDeliveryInterface,
     SMTPServiceInterface,
@@ -37,9 +40,10 @@ class SMTPService(EmailDeliveryInterface[PasswordlessLoginEmailTemplateVars]):
         self,
         smtp_settings: SMTPSettings,
         override: Union[Callable[[SMTPOverrideInput], SMTPOverrideInput], None] = None,
+        template_loader: Union[EmailTemplateLoader, None] = None,
     ) -> None:
         self.transporter = Transporter(smtp_settings)
-        oi = ServiceImplementation(self.transporter)
+        oi = ServiceImplementation(self.transporter, template_loader)
         self.service_implementation = oi if override is None else override(oi)
 
     async def send_email(
@@ -13,9 +13,13 @@
 # under the License.
 from __future__ import annotations
 
-from string import Template
-from typing import TYPE_CHECKING, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Union
 
+from supertokens_python.ingredients.emaildelivery.templates import (
+    EmailTemplateLoader,
+    load_email_template,
+)
 from supertokens_python.ingredients.emaildelivery.types import EmailContent
 from supertokens_python.supertokens import Supertokens
 from supertokens_python.utils import humanize_time
@@ -28,16 +32,25 @@ if TYPE_CHECKING:
     )
 
 
-def pless_email_content(input_: PasswordlessLoginEmailTemplateVars) -> EmailContent:
+@lru_cache(maxsize=32)
+def humanize_code_lifetime(code_life_time: int) -> str:
+    return humanize_time(code_life_time)
+
+
+def pless_email_content(
+    input_: PasswordlessLoginEmailTemplateVars,
+    template_loader: Optional[EmailTemplateLoader] = None,
+) -> EmailContent:
     supertokens = Supertokens.get_instance()
     app_name = supertokens.app_info.app_name
-    code_lifetime = humanize_time(input_.code_life_time)
+    code_lifetime = humanize_code_lifetime(input_.code_life_time)
     body = get_pless_email_html(
         app_name,
         code_lifetime,
         input_.email,
         input_.url_with_link_code,
         input_.user_input_code,
+        template_loader,
     )
     content_result = EmailContent(body, "Login to your account", input_.email, True)
     return content_result
@@ -49,19 +62,22 @@ def get_pless_email_html(
     email: str,
     url_with_link_code: Union[str, None] = None,
     user_input_code: Union[str, None] = None,
+    template_loader: Optional[EmailTemplateLoader] = None,
 ):
     if (user_input_code is not None) and (url_with_link_code is not None):
-        html_template = otp_and_magic_link_body
+        template_id, html_template = (
+            "passwordless.otp_and_magic_link",
+            otp_and_magic_link_body,
+        )
     elif user_input_code is not None:
-        html_template = otp_body
+        template_id, html_template = "passwordless.otp", otp_body
     elif url_with_link_code is not None:
-        html_template = magic_link_body
+        template_id, html_template = "passwordless.magic_link", magic_link_body
     else:
         raise Exception("This should never be thrown.")
 
-    return Template(html_template).substitute(
-        appname=app_name,
-        time=code_lifetime,
+    template = load_email_template(template_id, html_template, template_loader)
+    return template.partial(appname=app_name, time=code_lifetime).render(
         toEmail=email,
         otp=user_input_code,
         urlWithLinkCode=url_with_link_code,
@@ -40,4 +40,4 @@ class ServiceImplementation(SMTPServiceInterface[PasswordlessLoginEmailTemplateV
         user_context: Dict[str, Any],
     ) -> EmailContent:
         _ = user_context
-        return pless_email_content(template_vars)
+        return pless_email_content(template_vars, self.template_loader)
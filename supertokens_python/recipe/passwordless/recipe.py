@@ -142,14 +142,16 @@ class PasswordlessRecipe(RecipeModule):
         email_delivery_ingredient = ingredients.email_delivery
         if email_delivery_ingredient is None:
             self.email_delivery = EmailDeliveryIngredient(
-                self.config.get_email_delivery_config()
+                self.config.get_email_delivery_config(), f"{recipe_id}.email"
             )
         else:
             self.email_delivery = email_delivery_ingredient
 
         sms_delivery_ingredient = ingredients.sms_delivery
         self.sms_delivery = (
-            SMSDeliveryIngredient(self.config.get_sms_delivery_config())
+            SMSDeliveryIngredient(
+                self.config.get_sms_delivery_config(), f"{recipe_id}.sms"
+            )
             if sms_delivery_ingredient is None
             else sms_delivery_ingredient
         )
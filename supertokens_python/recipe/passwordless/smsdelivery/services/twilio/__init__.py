@@ -17,6 +17,7 @@ from __future__ import annotations
 from typing import Any, Dict, Callable, Union, TypeVar
 
 from supertokens_python.ingredients.smsdelivery.services.twilio import (
+    TwilioMessageSender,
     normalize_twilio_settings,
 )
 from supertokens_python.ingredients.smsdelivery.types import (
@@ -50,7 +51,10 @@ class TwilioService(SMSDeliveryInterface[PasswordlessLoginSMSTemplateVars]):
         self.twilio_client = Client(  # type: ignore
             twilio_settings.account_sid, twilio_settings.auth_token, **otps
         )
-        oi = ServiceImplementation(self.twilio_client)  # type: ignore
+        self.message_sender = TwilioMessageSender(
+            self.config.max_concurrent_requests, self.config.max_retries
+        )
+        oi = ServiceImplementation(self.twilio_client, self.message_sender)  # type: ignore
         self.service_implementation = oi if override is None else override(oi)  # type: ignore
 
     async def send_sms(
@@ -37,13 +37,15 @@ class ServiceImplementation(TwilioServiceInterface[PasswordlessLoginSMSTemplateV
         messaging_service_sid: Union[str, None] = None,
     ) -> None:
         if from_:
-            self.twilio_client.messages.create(  # type: ignore
+            await self.message_sender.create_message(
+                self.twilio_client,
                 to=content.to_phone,
                 body=content.body,
                 from_=from_,
             )
         else:
-            self.twilio_client.messages.create(  # type: ignore
+            await self.message_sender.create_message(
+                self.twilio_client,
                 to=content.to_phone,
                 body=content.body,
                 messaging_service_sid=messaging_service_sid,
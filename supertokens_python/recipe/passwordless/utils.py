@@ -201,7 +201,11 @@ def validate_and_normalise_user_input(
         else:
             override = None
 
-        return EmailDeliveryConfigWithService(email_service, override=override)
+        return EmailDeliveryConfigWithService(
+            email_service,
+            override=override,
+            queue=email_delivery.queue if email_delivery is not None else None,
+        )
 
     def get_sms_delivery_config() -> (
         SMSDeliveryConfigWithService[PasswordlessLoginSMSTemplateVars]
@@ -216,7 +220,11 @@ def validate_and_normalise_user_input(
         else:
             override = None
 
-        return SMSDeliveryConfigWithService(sms_service, override=override)
+        return SMSDeliveryConfigWithService(
+            sms_service,
+            override=override,
+            queue=sms_delivery.queue if sms_delivery is not None else None,
+        )
 
     if not isinstance(contact_config, ContactConfig):  # type: ignore user might not have linter enabled
         raise ValueError("contact_config must be of type ContactConfig")
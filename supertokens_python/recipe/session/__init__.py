@@ -52,6 +52,9 @@ def init(
     use_dynamic_access_token_signing_key: Union[bool, None] = None,
     expose_access_token_to_frontend_in_cookie_based_auth: Union[bool, None] = None,
     jwks_refresh_interval_sec: Union[int, None] = None,
+    verified_access_token_cache_size: Union[int, None] = None,
+    claim_refetch_soft_expiry_threshold: Union[float, None] = None,
+    cache_jwks_response: bool = False,
 ) -> Callable[[AppInfo], RecipeModule]:
     return SessionRecipe.init(
         cookie_domain,
@@ -67,4 +70,7 @@ def init(
         use_dynamic_access_token_signing_key,
         expose_access_token_to_frontend_in_cookie_based_auth,
         jwks_refresh_interval_sec,
+        verified_access_token_cache_size,
+        claim_refetch_soft_expiry_threshold,
+        cache_jwks_response,
     )
@@ -13,15 +13,26 @@
 # under the License.
 from __future__ import annotations
 
+from copy import deepcopy
 from typing import Any, Dict, Optional, Union
 
-import jwt
-from jwt.exceptions import DecodeError
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
+from jwt import PyJWK
+from jwt.algorithms import get_default_algorithms
+from jwt.exceptions import (
+    DecodeError,
+    InvalidAlgorithmError,
+    InvalidKeyError,
+    InvalidSignatureError,
+    PyJWTError,
+)
+from jwt.utils import base64url_decode
 
 from supertokens_python.logger import log_debug_message
 from supertokens_python.recipe.session.utils import SessionConfig
 from supertokens_python.utils import get_timestamp_ms
 
+from .access_token_cache import VerifiedAccessTokenCache
 from .exceptions import raise_try_refresh_token_exception
 from .jwt import ParsedJWTInfo
 
@@ -45,13 +56,49 @@ def sanitize_number(n: Any) -> Union[Union[int, float], None]:
     return None
 
 
-from supertokens_python.recipe.session.jwks import get_latest_keys
+from supertokens_python.recipe.session.jwks import (
+    find_matching_cached_keys,
+    get_latest_keys_async,
+)
 
+supported_algorithms = get_default_algorithms()
 
-def get_info_from_access_token(
+
+def verify_access_token_signature(
+    jwt_info: ParsedJWTInfo, key: PyJWK, algorithm_name: str
+) -> None:
+    # The header and payload have already been decoded by parse_jwt_without_signature_verification,
+    # so unlike jwt.decode we only need to check the signature over the raw segments.
+    # The core signs access tokens with RSA keys, so only the algorithm of the key
+    # (RS256 by default) is accepted, like jwt.decode does with algorithms=[...].
+    if algorithm_name not in ("RS256", key.algorithm_name):
+        raise InvalidAlgorithmError("The specified alg value is not allowed")
+    algorithm = supported_algorithms.get(algorithm_name)
+    if algorithm is None:
+        raise InvalidAlgorithmError("Algorithm not supported")
+
+    try:
+        prepared_key = algorithm.prepare_key(key.key)  # type: ignore
+    except (TypeError, ValueError) as e:
+        raise InvalidKeyError("Invalid key for the token's algorithm") from e
+    if not isinstance(prepared_key, RSAPublicKey):
+        raise InvalidKeyError("Access tokens must be verified with an RSA public key")
+
+    signing_input = (jwt_info.header + "." + jwt_info.raw_payload).encode()
+    try:
+        signature = base64url_decode(jwt_info.signature)
+    except Exception as e:
+        raise DecodeError("Invalid signature padding") from e
+
+    if not algorithm.verify(signing_input, prepared_key, signature):  # type: ignore
+        raise InvalidSignatureError("Signature verification failed")
+
+
+async def get_info_from_access_token(
     config: SessionConfig,
     jwt_info: ParsedJWTInfo,
     do_anti_csrf_check: bool,
+    verified_access_token_cache: Optional[VerifiedAccessTokenCache] = None,
 ):
     try:
         payload: Optional[Dict[str, Any]] = None
@@ -61,27 +108,31 @@ def get_info_from_access_token(
             else "RS256"
         )
 
-        if jwt_info.version >= 3:
-            matching_keys = get_latest_keys(config, jwt_info.kid)
-            payload = jwt.decode(  # type: ignore
+        cached_entry = None
+        if verified_access_token_cache is not None:
+            # Entries verified with a key that is no longer in the JWKS (rotated
+            # out, or the JWKS cache was reset) have to be verified again.
+            cached_entry = verified_access_token_cache.get(
                 jwt_info.raw_token_string,
-                matching_keys[0].key,  # type: ignore
-                algorithms=[decode_algo],
-                options={"verify_signature": True, "verify_exp": True},
+                lambda entry: find_matching_cached_keys(entry.kid, allow_stale=True)
+                is not None,
             )
+
+        if cached_entry is not None:
+            payload = deepcopy(cached_entry.payload)
+        elif jwt_info.version >= 3:
+            matching_keys = await get_latest_keys_async(config, jwt_info.kid)
+            verify_access_token_signature(jwt_info, matching_keys[0], decode_algo)
+            payload = jwt_info.payload
         else:
             # It won't have kid. So we'll have to try the token against all the keys from all the jwk_clients
             # If any of them work, we'll use that payload
-            for k in get_latest_keys(config):
+            for k in await get_latest_keys_async(config):
                 try:
-                    payload = jwt.decode(  # type: ignore
-                        jwt_info.raw_token_string,
-                        k.key,  # type: ignore
-                        algorithms=[decode_algo],
-                        options={"verify_signature": True, "verify_exp": True},
-                    )
+                    verify_access_token_signature(jwt_info, k, decode_algo)
+                    payload = jwt_info.payload
                     break
-                except DecodeError:
+                except PyJWTError:
                     pass
 
         if payload is None:
@@ -120,6 +171,15 @@ def get_info_from_access_token(
         if expiry_time < get_timestamp_ms():
             raise Exception("Access token expired")
 
+        if verified_access_token_cache is not None and cached_entry is None:
+            verified_access_token_cache.add(
+                jwt_info.raw_token_string,
+                deepcopy(payload),
+                jwt_info.kid,
+                session_handle,
+                int(expiry_time),
+            )
+
         return {
             "sessionHandle": session_handle,
             "userId": user_id,
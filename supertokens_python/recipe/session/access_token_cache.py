@@ -0,0 +1,118 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from hashlib import sha256
+from typing import Any, Callable, Dict, Optional, Set
+
+from supertokens_python.utils import get_timestamp_ms
+
+
+class VerifiedAccessTokenCacheEntry:
+    def __init__(
+        self,
+        payload: Dict[str, Any],
+        kid: Optional[str],
+        session_handle: Optional[str],
+        expiry_time: int,
+    ):
+        self.payload = payload
+        self.kid = kid
+        self.session_handle = session_handle
+        self.expiry_time = expiry_time
+
+
+class VerifiedAccessTokenCache:
+    """
+    LRU cache of access tokens whose signature has already been verified, so that
+    the same token arriving on many requests only pays for the RSA verification once.
+
+    Entries are keyed by a hash of the raw token, so the cache never holds the
+    tokens themselves, and they are dropped once the token expires.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.__entries: OrderedDict[str, VerifiedAccessTokenCacheEntry] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def get_key(raw_token: str) -> str:
+        return sha256(raw_token.encode()).hexdigest()
+
+    def get(
+        self,
+        raw_token: str,
+        is_valid: Optional[Callable[[VerifiedAccessTokenCacheEntry], bool]] = None,
+    ) -> Optional[VerifiedAccessTokenCacheEntry]:
+        # is_valid lets the caller drop entries that can no longer be trusted,
+        # for example because the key they were verified with has been rotated out.
+        key = VerifiedAccessTokenCache.get_key(raw_token)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and (
+                entry.expiry_time <= get_timestamp_ms()
+                or (is_valid is not None and not is_valid(entry))
+            ):
+                del self.__entries[key]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def add(
+        self,
+        raw_token: str,
+        payload: Dict[str, Any],
+        kid: Optional[str],
+        session_handle: Optional[str],
+        expiry_time: int,
+    ):
+        key = VerifiedAccessTokenCache.get_key(raw_token)
+        with self.__lock:
+            self.__entries[key] = VerifiedAccessTokenCacheEntry(
+                payload, kid, session_handle, expiry_time
+            )
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def remove(self, raw_token: str):
+        with self.__lock:
+            self.__entries.pop(VerifiedAccessTokenCache.get_key(raw_token), None)
+
+    def remove_sessions(self, session_handles: Set[str]):
+        with self.__lock:
+            for key in [
+                k
+                for k, v in self.__entries.items()
+                if v.session_handle in session_handles
+            ]:
+                del self.__entries[key]
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
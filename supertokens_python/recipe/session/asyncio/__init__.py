@@ -12,7 +12,16 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 from __future__ import annotations
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
 
 from supertokens_python.recipe.openid.interfaces import (
     GetOpenIdDiscoveryConfigurationResult,
@@ -41,6 +50,7 @@ from ..session_request_functions import (
     refresh_session_in_request,
 )
 from ..constants import protected_props
+from .. import session_functions
 from ..utils import get_required_claim_validators
 
 from supertokens_python.recipe.multitenancy.constants import DEFAULT_TENANT_ID
@@ -456,6 +466,39 @@ async def get_session_information(
     )
 
 
+async def get_session_information_pages(
+    session_handles: List[str],
+    page_size: int = session_functions.SESSION_INFORMATION_PAGE_SIZE,
+    max_concurrency: int = session_functions.SESSION_INFORMATION_FETCH_CONCURRENCY,
+    user_context: Union[None, Dict[str, Any]] = None,
+) -> AsyncIterator[List[SessionInformationResult]]:
+    if user_context is None:
+        user_context = {}
+    async for page in session_functions.get_session_information_pages(
+        SessionRecipe.get_instance().recipe_implementation,
+        session_handles,
+        user_context,
+        page_size,
+        max_concurrency,
+    ):
+        yield page
+
+
+async def get_sessions_information(
+    session_handles: List[str],
+    max_concurrency: int = session_functions.SESSION_INFORMATION_FETCH_CONCURRENCY,
+    user_context: Union[None, Dict[str, Any]] = None,
+) -> List[SessionInformationResult]:
+    sessions: List[SessionInformationResult] = []
+    async for page in get_session_information_pages(
+        session_handles,
+        max_concurrency=max_concurrency,
+        user_context=user_context,
+    ):
+        sessions.extend(page)
+    return sessions
+
+
 async def update_session_data_in_database(
     session_handle: str,
     new_session_data: Dict[str, Any],
@@ -25,6 +25,7 @@ from ..interfaces import (
     ClaimValidationResult,
     JSONPrimitiveList,
 )
+from .primitive_claim import MaxAgeSCV
 
 
 Primitive = TypeVar("Primitive", bound=JSONPrimitive)
@@ -33,7 +34,7 @@ PrimitiveList = TypeVar("PrimitiveList", bound=JSONPrimitiveList)
 _T = TypeVar("_T")
 
 
-class SCVMixin(SessionClaimValidator, Generic[_T]):
+class SCVMixin(MaxAgeSCV, Generic[_T]):
     def __init__(
         self,
         id_: str,
@@ -41,10 +42,9 @@ class SCVMixin(SessionClaimValidator, Generic[_T]):
         val: _T,
         max_age_in_sec: Optional[int] = None,
     ):
-        super().__init__(id_)
+        super().__init__(id_, max_age_in_sec)
         self.claim = claim
         self.val = val
-        self.max_age_in_sec = max_age_in_sec
 
     def should_refetch(
         self,
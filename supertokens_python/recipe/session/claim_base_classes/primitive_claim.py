@@ -28,7 +28,34 @@ from ..interfaces import (
 Primitive = TypeVar("Primitive", bound=JSONPrimitive)
 
 
-class HasValueSCV(SessionClaimValidator):
+class MaxAgeSCV(SessionClaimValidator):
+    """
+    Base of the validators of claims that are saved as {"v": value, "t": fetch time}
+    and expire max_age_in_sec after they were fetched
+    """
+
+    def __init__(self, id_: str, max_age_in_sec: Optional[int] = None):
+        super().__init__(id_)
+        self.max_age_in_sec = max_age_in_sec
+
+    def should_refetch_in_background(
+        self,
+        payload: JSONObject,
+        user_context: Dict[str, Any],
+        soft_expiry_threshold: float,
+    ) -> bool:
+        if self.claim is None:
+            raise Exception("should never happen")
+
+        return (
+            self.max_age_in_sec is not None
+            and self.claim.get_value_from_payload(payload, user_context) is not None
+            and payload[self.claim.key]["t"]
+            < get_timestamp_ms() - self.max_age_in_sec * 1000 * soft_expiry_threshold
+        )
+
+
+class HasValueSCV(MaxAgeSCV):
     def __init__(
         self,
         id_: str,
@@ -36,10 +63,9 @@ class HasValueSCV(SessionClaimValidator):
         val: Primitive,
         max_age_in_sec: Optional[int] = None,
     ):
-        super().__init__(id_)
+        super().__init__(id_, max_age_in_sec)
         self.claim = claim
         self.val = val
-        self.max_age_in_sec = max_age_in_sec
 
     def should_refetch(
         self,
@@ -0,0 +1,119 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from supertokens_python.logger import log_debug_message
+from supertokens_python.utils import get_timestamp_ms
+
+# (session handle, claim key)
+ClaimRefetchKey = Tuple[str, str]
+
+# Values fetched in the background are only applied to the session if one of its
+# requests comes back within this time.
+PREFETCHED_CLAIM_VALUE_TTL_SEC = 60
+MAX_PREFETCHED_CLAIM_VALUES = 10000
+
+
+class ClaimRefetcher:
+    """
+    Coalesces the claim refetches of concurrent requests of the same session, so
+    that a burst of requests with an expired claim queries the core once.
+
+    Claims can also be fetched in the background before they expire. The fetched
+    value is then added to the payload by the next request of the session.
+    """
+
+    def __init__(self):
+        self.in_flight: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, Dict[ClaimRefetchKey, asyncio.Task[Any]]
+        ] = WeakKeyDictionary()
+        self.__prefetched: OrderedDict[ClaimRefetchKey, Tuple[Any, int]] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def fetch_single_flight(
+        self, key: ClaimRefetchKey, fetch: Callable[[], Awaitable[Any]]
+    ) -> asyncio.Task[Any]:
+        loop = asyncio.get_running_loop()
+        tasks = self.in_flight.setdefault(loop, {})
+        task = tasks.get(key)
+        if task is None:
+            task = loop.create_task(fetch())
+
+            def on_done(t: asyncio.Task[Any]):
+                tasks.pop(key, None)
+                if not t.cancelled() and t.exception() is not None:
+                    log_debug_message(
+                        "Fetching claim %s for session %s failed: %s",
+                        key[1],
+                        key[0],
+                        t.exception(),
+                    )
+
+            task.add_done_callback(on_done)
+            tasks[key] = task
+        return task
+
+    async def fetch(self, key: ClaimRefetchKey, fetch: Callable[[], Awaitable[Any]]):
+        # Values fetched in the background aren't used here: the claim has to be
+        # refetched, and the value it would get may have changed since then.
+        # shield so that a cancelled request doesn't cancel the fetch other requests are waiting on
+        value = await asyncio.shield(self.fetch_single_flight(key, fetch))
+        # in case this joined a background fetch, which also stored the value
+        self.pop_prefetched(key)
+        return value
+
+    def fetch_in_background(
+        self, key: ClaimRefetchKey, fetch: Callable[[], Awaitable[Any]]
+    ):
+        async def fetch_and_store():
+            value = await fetch()
+            if value is None:
+                return value
+            with self.__lock:
+                self.__prefetched[key] = (value, get_timestamp_ms())
+                self.__prefetched.move_to_end(key)
+                while len(self.__prefetched) > MAX_PREFETCHED_CLAIM_VALUES:
+                    self.__prefetched.popitem(last=False)
+            return value
+
+        self.fetch_single_flight(key, fetch_and_store)
+
+    def pop_prefetched(
+        self, key: ClaimRefetchKey, max_age_in_sec: Optional[int] = None
+    ) -> Optional[Tuple[Any, int]]:
+        """
+        Returns the value fetched in the background and the time it was fetched at,
+        if it's not older than max_age_in_sec (nor PREFETCHED_CLAIM_VALUE_TTL_SEC)
+        """
+        with self.__lock:
+            entry = self.__prefetched.pop(key, None)
+        if entry is None:
+            return None
+        ttl_sec = PREFETCHED_CLAIM_VALUE_TTL_SEC
+        if max_age_in_sec is not None:
+            ttl_sec = min(ttl_sec, max_age_in_sec)
+        if get_timestamp_ms() - entry[1] > ttl_sec * 1000:
+            return None
+        return entry
+
+    def clear(self):
+        with self.__lock:
+            self.__prefetched.clear()
+        self.in_flight.clear()
@@ -765,3 +765,16 @@ class SessionClaimValidator(ABC):
         self, payload: JSONObject, user_context: Dict[str, Any]
     ) -> MaybeAwaitable[bool]:
         raise NotImplementedError()
+
+    def should_refetch_in_background(
+        self,
+        payload: JSONObject,
+        user_context: Dict[str, Any],
+        soft_expiry_threshold: float,
+    ) -> bool:
+        """
+        Whether the value is still valid but older than soft_expiry_threshold of
+        its max age, so it can be refetched without making the request wait.
+        """
+        _ = payload, user_context, soft_expiry_threshold
+        return False
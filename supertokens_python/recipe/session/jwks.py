@@ -11,14 +11,19 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
+from __future__ import annotations
 
+import asyncio
+import threading
 import requests
 from os import environ
-from typing import List, Optional
+from typing import Dict, List, Optional
+from weakref import WeakKeyDictionary
 from typing_extensions import TypedDict
 
 from jwt import PyJWK, PyJWKSet
 
+from supertokens_python.async_to_sync_wrapper import is_in_background_event_loop
 from supertokens_python.recipe.session.utils import SessionConfig
 from supertokens_python.utils import RWMutex, RWLockContext, get_timestamp_ms
 from supertokens_python.querier import Querier
@@ -27,121 +32,358 @@ from supertokens_python.logger import log_debug_message
 
 class JWKSConfigType(TypedDict):
     request_timeout: int
+    # Fraction of jwks_refresh_interval_sec after which the keys are refreshed
+    # in the background (while the cached ones are still being served).
+    # Set to None to only refresh when the cache has expired.
+    background_refresh_threshold: Optional[float]
+    # Time after a failed fetch during which the keys aren't fetched again if
+    # the stale ones can be used instead.
+    refresh_backoff_ms: int
 
 
 JWKSConfig: JWKSConfigType = {
     "request_timeout": 10000,  # 10s
+    "background_refresh_threshold": 0.8,
+    "refresh_backoff_ms": 5000,  # 5s
 }
 
 
 class CachedKeys:
     def __init__(self, keys: List[PyJWK], refresh_interval_sec: int):
         self.keys = keys
+        # PyJWK parses the key when it's created, so verifying with the
+        # objects in here doesn't need to rebuild the key for every token.
+        self.keys_by_kid: Dict[str, PyJWK] = {
+            key.key_id: key for key in keys if key.key_id is not None  # type: ignore
+        }
         self.last_refresh_time = get_timestamp_ms()
         self.refresh_interval_sec = refresh_interval_sec
 
+    def find_matching_keys(self, kid: Optional[str]) -> Optional[List[PyJWK]]:
+        if kid is None:
+            # return all keys since the token does not have a kid
+            return self.keys
+
+        key = self.keys_by_kid.get(kid)
+        if key is not None:
+            return [key]
+
+        return None
+
     def is_fresh(self):
         return (
             get_timestamp_ms() - self.last_refresh_time
             < self.refresh_interval_sec * 1000
         )
 
+    def should_refresh_in_background(self):
+        threshold = JWKSConfig["background_refresh_threshold"]
+        if threshold is None or is_in_refresh_backoff():
+            return False
+        return (
+            get_timestamp_ms() - self.last_refresh_time
+            >= self.refresh_interval_sec * 1000 * threshold
+        )
+
 
 cached_keys: Optional[CachedKeys] = None
 mutex = RWMutex()
 
+# Time of the last fetch that failed, reset by the next one that succeeds.
+last_failed_fetch_time: Optional[int] = None
+
+# Used by the WSGI (thread based) provider to make sure that only one
+# background refresh runs at a time.
+background_refresh_lock = threading.Lock()
+background_refresh_running = False
+# Number of threads fetching the keys, in the background or not.
+sync_fetches_running = 0
+
+# Used by the ASGI provider. All the coroutines of a loop that need the keys
+# wait on the same fetch instead of each querying the core.
+in_flight_fetches: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Task[None]] = (
+    WeakKeyDictionary()
+)
+
 
 # only for testing purposes
 def reset_jwks_cache():
     with RWLockContext(mutex, read=False):
-        global cached_keys
+        global cached_keys, last_failed_fetch_time
         cached_keys = None
+        last_failed_fetch_time = None
+    in_flight_fetches.clear()
 
 
-def get_cached_keys() -> Optional[List[PyJWK]]:
-    if cached_keys is not None:
-        # This means that we have valid JWKs for the given core path
-        # We check if we need to refresh before returning
+def is_in_refresh_backoff() -> bool:
+    failed_at = last_failed_fetch_time
+    return (
+        failed_at is not None
+        and get_timestamp_ms() - failed_at < JWKSConfig["refresh_backoff_ms"]
+    )
 
-        # This means that the value in cache is not expired, in this case we return the cached value
-        # Note that this also means that the SDK will not try to query any other core (if there are multiple)
-        # if it has a valid cache entry from one of the core URLs. It will only attempt to fetch
-        # from the cores again after the entry in the cache is expired
-        if cached_keys.is_fresh():
-            return cached_keys.keys
 
-    return None
+def find_stale_keys_to_serve(
+    kid: Optional[str], fetch_running: bool
+) -> Optional[List[PyJWK]]:
+    # Expired keys that match the kid are served without waiting for a fetch if
+    # one is already running, or if the last one failed a moment ago. Otherwise
+    # every request would wait for the fetch (up to request_timeout) while the
+    # core is unreachable.
+    if not fetch_running and not is_in_refresh_backoff():
+        return None
+    return find_matching_cached_keys(kid, allow_stale=True)
+
+
+def record_fetch_result(failed: bool):
+    global last_failed_fetch_time
+    last_failed_fetch_time = get_timestamp_ms() if failed else None
 
 
-def find_matching_keys(
-    keys: Optional[List[PyJWK]], kid: Optional[str]
+def find_matching_cached_keys(
+    kid: Optional[str], allow_stale: bool = False
 ) -> Optional[List[PyJWK]]:
-    if kid is None or keys is None:
-        # return all keys since the token does not have a kid
-        return keys
+    current = cached_keys
+    if current is None or (not allow_stale and not current.is_fresh()):
+        return None
+
+    return current.find_matching_keys(kid)
 
-    # kid has been provided so filter the keys
-    matching_keys = [key for key in keys if key.key_id == kid]  # type: ignore
-    if len(matching_keys) > 0:
-        return matching_keys
 
-    return None
+def get_core_jwks_paths() -> List[str]:
+    core_paths = Querier.get_instance().get_all_core_urls_for_path(
+        "./.well-known/jwks.json"
+    )
+
+    if len(core_paths) == 0:
+        raise Exception(
+            "No SuperTokens core available to query. Please pass supertokens > connection_uri to the init function, or override all the functions of the recipe you are using."
+        )
+
+    return core_paths
+
+
+def fetch_keys(config: SessionConfig) -> CachedKeys:
+    global sync_fetches_running
+
+    with background_refresh_lock:
+        sync_fetches_running += 1
+    try:
+        result = fetch_keys_from_core_paths(config)
+    except Exception:
+        record_fetch_result(failed=True)
+        raise
+    finally:
+        with background_refresh_lock:
+            sync_fetches_running -= 1
+    record_fetch_result(failed=False)
+    return result
+
+
+def fetch_keys_from_core_paths(config: SessionConfig) -> CachedKeys:
+    last_error: Exception = Exception("No valid JWKS found")
+
+    for path in get_core_jwks_paths():
+        if environ.get("SUPERTOKENS_ENV") == "testing":
+            log_debug_message("Attempting to fetch JWKS from path: %s", path)
+
+        try:
+            log_debug_message("Fetching jwk set from the configured uri")
+            with requests.get(
+                path, timeout=JWKSConfig["request_timeout"] / 1000
+            ) as response:
+                response.raise_for_status()
+                keys = PyJWKSet.from_dict(response.json()).keys  # type: ignore
+        except Exception as e:
+            last_error = e
+            continue
+
+        return CachedKeys(keys, config.jwks_refresh_interval_sec)
+
+    raise last_error
+
+
+async def fetch_keys_async(config: SessionConfig) -> CachedKeys:
+    try:
+        result = await fetch_keys_from_core_paths_async(config)
+    except Exception:
+        record_fetch_result(failed=True)
+        raise
+    record_fetch_result(failed=False)
+    return result
+
+
+async def fetch_keys_from_core_paths_async(config: SessionConfig) -> CachedKeys:
+    last_error: Exception = Exception("No valid JWKS found")
+
+    for path in get_core_jwks_paths():
+        if environ.get("SUPERTOKENS_ENV") == "testing":
+            log_debug_message("Attempting to fetch JWKS from path: %s", path)
+
+        try:
+            log_debug_message("Fetching jwk set from the configured uri")
+            response = await Querier.get_http_client().get(
+                path, timeout=JWKSConfig["request_timeout"] / 1000
+            )
+            response.raise_for_status()
+            keys = PyJWKSet.from_dict(response.json()).keys  # type: ignore
+        except Exception as e:
+            last_error = e
+            continue
+
+        return CachedKeys(keys, config.jwks_refresh_interval_sec)
+
+    raise last_error
+
+
+def refresh_keys_in_background(config: SessionConfig) -> None:
+    global background_refresh_running
+
+    with background_refresh_lock:
+        if background_refresh_running:
+            return
+        background_refresh_running = True
+
+    def refresh():
+        global background_refresh_running, cached_keys
+        try:
+            # The fetch happens without holding the lock so that requests can
+            # keep reading the current keys in the meantime.
+            new_keys = fetch_keys(config)
+            with RWLockContext(mutex, read=False):
+                cached_keys = new_keys
+            log_debug_message("Refreshed JWKS in the background")
+        except Exception as e:
+            log_debug_message("Background refresh of JWKS failed: %s", e)
+        finally:
+            with background_refresh_lock:
+                background_refresh_running = False
+
+    threading.Thread(target=refresh, daemon=True).start()
 
 
 def get_latest_keys(config: SessionConfig, kid: Optional[str] = None) -> List[PyJWK]:
+    """
+    Thread safe provider used in WSGI mode. This blocks the calling thread while
+    the keys are being fetched.
+    """
     global cached_keys
 
     if environ.get("SUPERTOKENS_ENV") == "testing":
         log_debug_message("Called find_jwk_client")
 
     with RWLockContext(mutex, read=True):
-        matching_keys = find_matching_keys(get_cached_keys(), kid)
+        matching_keys = find_matching_cached_keys(kid)
         if matching_keys is not None:
             if environ.get("SUPERTOKENS_ENV") == "testing":
                 log_debug_message("Returning JWKS from cache")
+            if cached_keys is not None and cached_keys.should_refresh_in_background():
+                refresh_keys_in_background(config)
             return matching_keys
         # otherwise unknown kid, will continue to reload the keys
 
-    core_paths = Querier.get_instance().get_all_core_urls_for_path(
-        "./.well-known/jwks.json"
-    )
-
-    if len(core_paths) == 0:
-        raise Exception(
-            "No SuperTokens core available to query. Please pass supertokens > connection_uri to the init function, or override all the functions of the recipe you are using."
-        )
+    # Checked without the lock, which a thread that is fetching the keys holds
+    stale_keys = find_stale_keys_to_serve(kid, sync_fetches_running > 0)
+    if stale_keys is not None:
+        log_debug_message("Returning stale JWKS while the keys can't be fetched")
+        return stale_keys
 
-    last_error: Exception = Exception("No valid JWKS found")
+    get_core_jwks_paths()
 
     with RWLockContext(mutex, read=False):
         # check again if the keys are in cache
         # because another thread might have fetched the keys while this one was waiting for the lock
-        matching_keys = find_matching_keys(get_cached_keys(), kid)
+        matching_keys = find_matching_cached_keys(kid)
         if matching_keys is not None:
             return matching_keys
 
-        for path in core_paths:
-            if environ.get("SUPERTOKENS_ENV") == "testing":
-                log_debug_message("Attempting to fetch JWKS from path: %s", path)
-
-            cached_jwks: Optional[List[PyJWK]] = None
-            try:
-                log_debug_message("Fetching jwk set from the configured uri")
-                with requests.get(
-                    path, timeout=JWKSConfig["request_timeout"] / 1000
-                ) as response:  # 5 second timeout
-                    response.raise_for_status()
-                    cached_jwks = PyJWKSet.from_dict(response.json()).keys  # type: ignore
-            except Exception as e:
-                last_error = e
-
-            if cached_jwks is not None:  # we found a valid JWKS
-                cached_keys = CachedKeys(cached_jwks, config.jwks_refresh_interval_sec)
-                log_debug_message("Returning JWKS from fetch")
-                matching_keys = find_matching_keys(get_cached_keys(), kid)
-                if matching_keys is not None:
-                    return matching_keys
-
-                raise Exception("No matching JWKS found")
+        try:
+            cached_keys = fetch_keys(config)
+        except Exception as e:
+            stale_keys = find_matching_cached_keys(kid, allow_stale=True)
+            if stale_keys is None:
+                raise e
+            log_debug_message("Returning stale JWKS because the fetch failed: %s", e)
+            return stale_keys
+
+        log_debug_message("Returning JWKS from fetch")
+        matching_keys = find_matching_cached_keys(kid)
+        if matching_keys is not None:
+            return matching_keys
 
-    raise last_error
+        raise Exception("No matching JWKS found")
+
+
+def fetch_keys_single_flight(config: SessionConfig) -> asyncio.Task[None]:
+    loop = asyncio.get_running_loop()
+    task = in_flight_fetches.get(loop)
+    if task is None:
+
+        async def refresh():
+            global cached_keys
+            cached_keys = await fetch_keys_async(config)
+
+        task = loop.create_task(refresh())
+
+        def on_done(t: asyncio.Task[None]):
+            in_flight_fetches.pop(loop, None)
+            # Retrieve the error here so that background refreshes that nobody
+            # awaits don't end up as "exception was never retrieved" warnings.
+            if not t.cancelled() and t.exception() is not None:
+                log_debug_message("Fetching JWKS failed: %s", t.exception())
+
+        task.add_done_callback(on_done)
+        in_flight_fetches[loop] = task
+    return task
+
+
+async def get_latest_keys_async(
+    config: SessionConfig, kid: Optional[str] = None
+) -> List[PyJWK]:
+    """
+    Non blocking provider used in ASGI mode. Concurrent cache misses share a single
+    fetch, and the keys are refreshed in the background before they expire.
+    """
+    # With per thread event loops (the default for WSGI) the thread safe provider
+    # is shared by all threads. The shared background event loop must not be
+    # blocked though, so it uses the non blocking provider.
+    if config.mode == "wsgi" and not is_in_background_event_loop():
+        return get_latest_keys(config, kid)
+
+    if environ.get("SUPERTOKENS_ENV") == "testing":
+        log_debug_message("Called find_jwk_client")
+
+    matching_keys = find_matching_cached_keys(kid)
+    if matching_keys is not None:
+        if environ.get("SUPERTOKENS_ENV") == "testing":
+            log_debug_message("Returning JWKS from cache")
+        if cached_keys is not None and cached_keys.should_refresh_in_background():
+            fetch_keys_single_flight(config)
+        return matching_keys
+    # otherwise unknown kid, will continue to reload the keys
+
+    stale_keys = find_stale_keys_to_serve(
+        kid, asyncio.get_running_loop() in in_flight_fetches
+    )
+    if stale_keys is not None:
+        log_debug_message("Returning stale JWKS while the keys can't be fetched")
+        return stale_keys
+
+    get_core_jwks_paths()
+
+    try:
+        # shield so that a cancelled request doesn't cancel the fetch other requests are waiting on
+        await asyncio.shield(fetch_keys_single_flight(config))
+    except Exception as e:
+        stale_keys = find_matching_cached_keys(kid, allow_stale=True)
+        if stale_keys is None:
+            raise e
+        log_debug_message("Returning stale JWKS because the fetch failed: %s", e)
+        return stale_keys
+
+    log_debug_message("Returning JWKS from fetch")
+    matching_keys = find_matching_cached_keys(kid)
+    if matching_keys is not None:
+        return matching_keys
+
+    raise Exception("No matching JWKS found")
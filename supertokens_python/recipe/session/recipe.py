@@ -93,6 +93,9 @@ class SessionRecipe(RecipeModule):
         use_dynamic_access_token_signing_key: Union[bool, None] = None,
         expose_access_token_to_frontend_in_cookie_based_auth: Union[bool, None] = None,
         jwks_refresh_interval_sec: Union[int, None] = None,
+        verified_access_token_cache_size: Union[int, None] = None,
+        claim_refetch_soft_expiry_threshold: Union[float, None] = None,
+        cache_jwks_response: bool = False,
     ):
         super().__init__(recipe_id, app_info)
         self.config = validate_and_normalise_user_input(
@@ -110,6 +113,8 @@ class SessionRecipe(RecipeModule):
             use_dynamic_access_token_signing_key,
             expose_access_token_to_frontend_in_cookie_based_auth,
             jwks_refresh_interval_sec,
+            verified_access_token_cache_size,
+            claim_refetch_soft_expiry_threshold,
         )
         self.openid_recipe = OpenIdRecipe(
             recipe_id,
@@ -117,6 +122,7 @@ class SessionRecipe(RecipeModule):
             None,
             None,
             override.openid_feature if override is not None else None,
+            cache_jwks_response,
         )
         log_debug_message(
             "session init: anti_csrf: %s", self.config.anti_csrf_function_or_string
@@ -307,6 +313,9 @@ class SessionRecipe(RecipeModule):
         use_dynamic_access_token_signing_key: Union[bool, None] = None,
         expose_access_token_to_frontend_in_cookie_based_auth: Union[bool, None] = None,
         jwks_refresh_interval_sec: Union[int, None] = None,
+        verified_access_token_cache_size: Union[int, None] = None,
+        claim_refetch_soft_expiry_threshold: Union[float, None] = None,
+        cache_jwks_response: bool = False,
     ):
         def func(app_info: AppInfo):
             if SessionRecipe.__instance is None:
@@ -326,6 +335,9 @@ class SessionRecipe(RecipeModule):
                     use_dynamic_access_token_signing_key,
                     expose_access_token_to_frontend_in_cookie_based_auth,
                     jwks_refresh_interval_sec,
+                    verified_access_token_cache_size,
+                    claim_refetch_soft_expiry_threshold,
+                    cache_jwks_response,
                 )
                 return SessionRecipe.__instance
             raise_general_exception(
@@ -23,6 +23,9 @@ from supertokens_python.utils import resolve
 from ...types import MaybeAwaitable, RecipeUserId
 from . import session_functions
 from .access_token import validate_access_token_structure
+from .access_token_cache import VerifiedAccessTokenCache
+from .claim_base_classes.primitive_claim import MaxAgeSCV
+from .claim_refetcher import ClaimRefetcher
 from .cookie_and_header import build_front_token
 from .exceptions import UnauthorisedError
 from .interfaces import (
@@ -57,6 +60,12 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
         self.querier = querier
         self.config = config
         self.app_info = app_info
+        self.verified_access_token_cache: Optional[VerifiedAccessTokenCache] = None
+        if config.verified_access_token_cache_size is not None:
+            self.verified_access_token_cache = VerifiedAccessTokenCache(
+                config.verified_access_token_cache_size
+            )
+        self.claim_refetcher = ClaimRefetcher()
 
     async def create_new_session(
         self,
@@ -116,35 +125,83 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
         access_token_payload_update = None
         original_access_token_payload = json.dumps(access_token_payload)
 
+        session_handle: Optional[str] = access_token_payload.get("sessionHandle")
+        soft_expiry_threshold = self.config.claim_refetch_soft_expiry_threshold
+
         for validator in claim_validators:
+            claim = validator.claim
+            if claim is None:
+                continue
+
+            def fetch_value(claim: SessionClaim[Any] = claim):
+                return resolve(
+                    claim.fetch_value(
+                        user_id,
+                        recipe_user_id,
+                        access_token_payload.get("tId", DEFAULT_TENANT_ID),
+                        access_token_payload,
+                        user_context,
+                    )
+                )
+
             log_debug_message(
                 "update_claims_in_payload_if_needed checking should_refetch for %s",
                 validator.id,
             )
-            if validator.claim is not None and validator.should_refetch(
-                access_token_payload, user_context
-            ):
+            value = None
+            fetched_at: Optional[int] = None
+            if validator.should_refetch(access_token_payload, user_context):
                 log_debug_message(
                     "update_claims_in_payload_if_needed refetching for %s", validator.id
                 )
-                value = await resolve(
-                    validator.claim.fetch_value(
-                        user_id,
-                        recipe_user_id,
-                        access_token_payload.get("tId", DEFAULT_TENANT_ID),
-                        access_token_payload,
-                        user_context,
+                if session_handle is None:
+                    value = await fetch_value()
+                else:
+                    # concurrent requests of the same session share the refetch
+                    value = await self.claim_refetcher.fetch(
+                        (session_handle, claim.key), fetch_value
                     )
-                )
                 log_debug_message(
                     "update_claims_in_payload_if_needed %s refetch result %s",
                     validator.id,
                     value,
                 )
-                if value is not None:
-                    access_token_payload = validator.claim.add_to_payload_(
-                        access_token_payload, value, user_context
+            elif (
+                soft_expiry_threshold is not None
+                and session_handle is not None
+                and validator.should_refetch_in_background(
+                    access_token_payload, user_context, soft_expiry_threshold
+                )
+            ):
+                prefetched = self.claim_refetcher.pop_prefetched(
+                    (session_handle, claim.key),
+                    (
+                        validator.max_age_in_sec
+                        if isinstance(validator, MaxAgeSCV)
+                        else None
+                    ),
+                )
+                if prefetched is not None:
+                    value, fetched_at = prefetched
+                else:
+                    log_debug_message(
+                        "update_claims_in_payload_if_needed refetching %s in the background",
+                        validator.id,
                     )
+                    self.claim_refetcher.fetch_in_background(
+                        (session_handle, claim.key), fetch_value
+                    )
+
+            if value is not None:
+                access_token_payload = claim.add_to_payload_(
+                    access_token_payload, value, user_context
+                )
+                if fetched_at is not None:
+                    # add_to_payload_ stamps the value with the current time, but
+                    # its age has to count from when it was fetched
+                    claim_entry = access_token_payload.get(claim.key)
+                    if isinstance(claim_entry, dict) and "t" in claim_entry:
+                        claim_entry["t"] = fetched_at
 
         if json.dumps(access_token_payload) != original_access_token_payload:
             access_token_payload_update = access_token_payload
@@ -14,7 +14,7 @@
 from __future__ import annotations
 
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Union, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Union, Optional
 
 from supertokens_python.recipe.session.interfaces import SessionInformationResult
 from supertokens_python.types import RecipeUserId
@@ -23,6 +23,7 @@ from .access_token import get_info_from_access_token
 from .jwt import ParsedJWTInfo
 
 if TYPE_CHECKING:
+    from .interfaces import RecipeInterface
     from .recipe_implementation import RecipeImplementation
 
 from supertokens_python.logger import log_debug_message
@@ -38,6 +39,10 @@ from .exceptions import (
 )
 
 from supertokens_python.recipe.multitenancy.constants import DEFAULT_TENANT_ID
+from supertokens_python.utils import gather_with_concurrency_limit
+
+SESSION_INFORMATION_PAGE_SIZE = 100
+SESSION_INFORMATION_FETCH_CONCURRENCY = 10
 
 
 class CreateOrRefreshAPIResponseSession:
@@ -169,10 +174,11 @@ async def get_session(
     access_token_info: Optional[Dict[str, Any]] = None
 
     try:
-        access_token_info = get_info_from_access_token(
+        access_token_info = await get_info_from_access_token(
             config,
             parsed_access_token,
             config.anti_csrf_function_or_string == "VIA_TOKEN" and do_anti_csrf_check,
+            recipe_implementation.verified_access_token_cache,
         )
 
     except Exception as e:
@@ -446,6 +452,10 @@ async def revoke_all_sessions_for_user(
             },
             user_context=user_context,
         )
+    if recipe_implementation.verified_access_token_cache is not None:
+        recipe_implementation.verified_access_token_cache.remove_sessions(
+            set(response["sessionHandlesRevoked"])
+        )
     return response["sessionHandlesRevoked"]
 
 
@@ -493,6 +503,10 @@ async def revoke_session(
         {"sessionHandles": [session_handle]},
         user_context=user_context,
     )
+    if recipe_implementation.verified_access_token_cache is not None:
+        recipe_implementation.verified_access_token_cache.remove_sessions(
+            {session_handle}
+        )
     return len(response["sessionHandlesRevoked"]) == 1
 
 
@@ -506,6 +520,10 @@ async def revoke_multiple_sessions(
         {"sessionHandles": session_handles},
         user_context=user_context,
     )
+    if recipe_implementation.verified_access_token_cache is not None:
+        recipe_implementation.verified_access_token_cache.remove_sessions(
+            set(session_handles)
+        )
     return response["sessionHandlesRevoked"]
 
 
@@ -565,3 +583,29 @@ async def get_session_information(
             response["tenantId"],
         )
     return None
+
+
+async def get_session_information_pages(
+    recipe_implementation: RecipeInterface,
+    session_handles: List[str],
+    user_context: Dict[str, Any],
+    page_size: int = SESSION_INFORMATION_PAGE_SIZE,
+    max_concurrency: int = SESSION_INFORMATION_FETCH_CONCURRENCY,
+) -> AsyncIterator[List[SessionInformationResult]]:
+    """
+    Fetches the information of many sessions, page_size handles at a time, with
+    at most max_concurrency requests to the core in flight. Sessions that no
+    longer exist are left out.
+    """
+    if page_size <= 0 or max_concurrency <= 0:
+        raise ValueError("page_size and max_concurrency must be positive integers")
+
+    for start in range(0, len(session_handles), page_size):
+        page = await gather_with_concurrency_limit(
+            max_concurrency,
+            [
+                recipe_implementation.get_session_information(handle, user_context)
+                for handle in session_handles[start : start + page_size]
+            ],
+        )
+        yield [info for info in page if info is not None]
@@ -245,6 +245,25 @@ def get_session_information(
     return sync(async_get_session_information(session_handle, user_context))
 
 
+def get_sessions_information(
+    session_handles: List[str],
+    max_concurrency: Optional[int] = None,
+    user_context: Union[None, Dict[str, Any]] = None,
+) -> List[SessionInformationResult]:
+    from supertokens_python.recipe.session.asyncio import (
+        get_sessions_information as async_get_sessions_information,
+    )
+    from supertokens_python.recipe.session.session_functions import (
+        SESSION_INFORMATION_FETCH_CONCURRENCY,
+    )
+
+    if max_concurrency is None:
+        max_concurrency = SESSION_INFORMATION_FETCH_CONCURRENCY
+    return sync(
+        async_get_sessions_information(session_handles, max_concurrency, user_context)
+    )
+
+
 def update_session_data_in_database(
     session_handle: str,
     new_session_data: Dict[str, Any],
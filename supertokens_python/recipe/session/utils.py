@@ -391,6 +391,8 @@ class SessionConfig:
         use_dynamic_access_token_signing_key: bool,
         expose_access_token_to_frontend_in_cookie_based_auth: bool,
         jwks_refresh_interval_sec: int,
+        verified_access_token_cache_size: Optional[int],
+        claim_refetch_soft_expiry_threshold: Optional[float],
     ):
         self.session_expired_status_code = session_expired_status_code
         self.invalid_claim_status_code = invalid_claim_status_code
@@ -411,6 +413,8 @@ class SessionConfig:
         self.framework = framework
         self.mode = mode
         self.jwks_refresh_interval_sec = jwks_refresh_interval_sec
+        self.verified_access_token_cache_size = verified_access_token_cache_size
+        self.claim_refetch_soft_expiry_threshold = claim_refetch_soft_expiry_threshold
 
 
 def validate_and_normalise_user_input(
@@ -434,6 +438,8 @@ def validate_and_normalise_user_input(
     use_dynamic_access_token_signing_key: Union[bool, None] = None,
     expose_access_token_to_frontend_in_cookie_based_auth: Union[bool, None] = None,
     jwks_refresh_interval_sec: Union[int, None] = None,
+    verified_access_token_cache_size: Union[int, None] = None,
+    claim_refetch_soft_expiry_threshold: Union[float, None] = None,
 ):
     _ = cookie_same_site  # we have this otherwise pylint complains that cookie_same_site is unused, but it is being used in the get_cookie_same_site function.
     if anti_csrf not in {"VIA_TOKEN", "VIA_CUSTOM_HEADER", "NONE", None}:
@@ -544,6 +550,22 @@ def validate_and_normalise_user_input(
     if jwks_refresh_interval_sec is None:
         jwks_refresh_interval_sec = 4 * 3600  # 4 hours
 
+    if verified_access_token_cache_size is not None and (
+        not isinstance(verified_access_token_cache_size, int)  # type: ignore
+        or verified_access_token_cache_size <= 0
+    ):
+        raise ValueError(
+            "verified_access_token_cache_size must be a positive integer or None"
+        )
+
+    if claim_refetch_soft_expiry_threshold is not None and (
+        not isinstance(claim_refetch_soft_expiry_threshold, (int, float))  # type: ignore
+        or not 0 < claim_refetch_soft_expiry_threshold < 1
+    ):
+        raise ValueError(
+            "claim_refetch_soft_expiry_threshold must be a number between 0 and 1 (exclusive) or None"
+        )
+
     return SessionConfig(
         app_info.api_base_path.append(NormalisedURLPath(SESSION_REFRESH)),
         cookie_domain,
@@ -561,6 +583,8 @@ def validate_and_normalise_user_input(
         use_dynamic_access_token_signing_key,
         expose_access_token_to_frontend_in_cookie_based_auth,
         jwks_refresh_interval_sec,
+        verified_access_token_cache_size,
+        claim_refetch_soft_expiry_threshold,
     )
 
 
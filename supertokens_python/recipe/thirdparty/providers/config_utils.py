@@ -1,4 +1,7 @@
-from typing import List, Dict, Optional, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Dict, Optional, Any, Tuple
+from weakref import WeakKeyDictionary
 
 from supertokens_python.normalised_url_domain import NormalisedURLDomain
 from supertokens_python.normalised_url_path import NormalisedURLPath
@@ -16,7 +19,7 @@ from .linkedin import Linkedin
 from .twitter import Twitter
 from .okta import Okta
 from .custom import NewProvider
-from .utils import do_get_request
+from .response_cache import ResponseCache, ResponseCacheConfigType
 
 from ..provider import (
     ProviderConfig,
@@ -27,6 +30,9 @@ from ..provider import (
     UserInfoMap,
 )
 
+if TYPE_CHECKING:
+    from supertokens_python.recipe.multitenancy.interfaces import TenantConfig
+
 
 def merge_config(
     config_from_static: ProviderConfig, config_from_core: ProviderConfig
@@ -186,6 +192,40 @@ def merge_providers_from_core_and_static(
     return merged_providers
 
 
+# tenant config -> (static providers, include_all_providers, merged providers). Tenant configs
+# returned from the tenant config cache are reused across requests, so their merged
+# provider list is only computed once. The entries go away with the tenant config.
+merged_providers_cache: WeakKeyDictionary[
+    TenantConfig, Tuple[List[ProviderInput], bool, List[ProviderInput]]
+] = WeakKeyDictionary()
+
+
+def get_merged_providers_for_tenant(
+    tenant_config: TenantConfig,
+    provider_inputs_from_static: List[ProviderInput],
+    include_all_providers: bool,
+) -> List[ProviderInput]:
+    cached = merged_providers_cache.get(tenant_config)
+    if (
+        cached is not None
+        and cached[0] is provider_inputs_from_static
+        and cached[1] == include_all_providers
+    ):
+        return cached[2]
+
+    merged_providers = merge_providers_from_core_and_static(
+        provider_configs_from_core=tenant_config.third_party_providers,
+        provider_inputs_from_static=provider_inputs_from_static,
+        include_all_providers=include_all_providers,
+    )
+    merged_providers_cache[tenant_config] = (
+        provider_inputs_from_static,
+        include_all_providers,
+        merged_providers,
+    )
+    return merged_providers
+
+
 def create_provider(provider_input: ProviderInput) -> Provider:
     if provider_input.config.third_party_id.startswith("active-directory"):
         return ActiveDirectory(provider_input)
@@ -217,22 +257,25 @@ def create_provider(provider_input: ProviderInput) -> Provider:
     return NewProvider(provider_input)
 
 
-OIDC_INFO_MAP: Dict[str, Any] = {}
+OIDCDiscoveryCacheConfig: ResponseCacheConfigType = {
+    "default_ttl_sec": 60 * 60,  # 1 hour
+    "min_ttl_sec": 60,
+    "max_ttl_sec": 24 * 60 * 60,
+    "request_timeout": 30000,  # 30s
+}
 
+oidc_discovery_cache: ResponseCache[Dict[str, Any]] = ResponseCache(
+    "OIDC discovery info", lambda res: res.json(), OIDCDiscoveryCacheConfig
+)
 
-async def get_oidc_discovery_info(issuer: str):
-    if issuer in OIDC_INFO_MAP:
-        return OIDC_INFO_MAP[issuer]
 
+async def get_oidc_discovery_info(issuer: str) -> Dict[str, Any]:
     ndomain = NormalisedURLDomain(issuer)
     npath = NormalisedURLPath(issuer)
 
-    oidc_info = await do_get_request(
+    return await oidc_discovery_cache.get(
         ndomain.get_as_string_dangerous() + npath.get_as_string_dangerous()
     )
-    OIDC_INFO_MAP[issuer] = oidc_info
-
-    return oidc_info
 
 
 async def discover_oidc_endpoints(
@@ -1,9 +1,7 @@
 from typing import Any, Callable, Dict, List, Optional, Union
 from urllib.parse import parse_qs, urlencode, urlparse
 
-from httpx import AsyncClient
-
-from jwt import decode  # type: ignore
+from jwt import decode, get_unverified_header  # type: ignore
 from jwt.algorithms import RSAAlgorithm
 import pkce
 
@@ -18,6 +16,10 @@ from supertokens_python.recipe.thirdparty.providers.utils import (
     DEV_KEY_IDENTIFIER,
     DEV_OAUTH_CLIENT_IDS,
 )
+from supertokens_python.recipe.thirdparty.providers.response_cache import (
+    ResponseCache,
+    ResponseCacheConfigType,
+)
 
 from ..types import RawUserInfoFromProvider, UserInfo, UserInfoEmail
 from ..provider import (
@@ -152,18 +154,62 @@ def get_supertokens_user_info_result_from_raw_user_info(
     return result
 
 
+class ProviderJWKS:
+    def __init__(self, jwks: Dict[str, Any]):
+        # Only RSA keys are parsed since the id token is verified with RS256
+        self.keys: List[Any] = []
+        self.keys_by_kid: Dict[str, Any] = {}
+        for jwk in jwks.get("keys", []):
+            if jwk.get("kty") != "RSA":
+                continue
+            key = RSAAlgorithm.from_jwk(jwk)  # type: ignore
+            self.keys.append(key)
+            if jwk.get("kid") is not None:
+                self.keys_by_kid[jwk["kid"]] = key
+
+    def find_matching_keys(self, kid: Optional[str]) -> Optional[List[Any]]:
+        if kid is None:
+            # try all the keys since the token does not have a kid
+            return self.keys
+
+        key = self.keys_by_kid.get(kid)
+        if key is not None:
+            return [key]
+
+        return None
+
+
+ThirdPartyJWKSCacheConfig: ResponseCacheConfigType = {
+    "default_ttl_sec": 60 * 60,  # 1 hour
+    "min_ttl_sec": 60,
+    "max_ttl_sec": 24 * 60 * 60,
+    "request_timeout": 30000,  # 30s
+}
+
+# Minimum time between two fetches of a JWKS because of an unknown kid
+UNKNOWN_KID_REFETCH_INTERVAL_SEC = 60
+
+third_party_jwks_cache: ResponseCache[ProviderJWKS] = ResponseCache(
+    "JWKS", lambda res: ProviderJWKS(res.json()), ThirdPartyJWKSCacheConfig
+)
+
+
 async def verify_id_token_from_jwks_endpoint_and_get_payload(
     id_token: str, jwks_uri: str, audience: str
 ):
-    public_keys: List[RSAAlgorithm] = []
-    async with AsyncClient(timeout=30.0) as client:
-        response = await client.get(jwks_uri)  # type:ignore
-        key_payload = response.json()
-        for key in key_payload["keys"]:
-            public_keys.append(RSAAlgorithm.from_jwk(key))  # type: ignore
+    kid: Optional[str] = get_unverified_header(id_token).get("kid")
+
+    public_keys = (await third_party_jwks_cache.get(jwks_uri)).find_matching_keys(kid)
+    if public_keys is None:
+        # The provider may have rotated its keys since we last fetched them
+        public_keys = (
+            await third_party_jwks_cache.refresh(
+                jwks_uri, UNKNOWN_KID_REFETCH_INTERVAL_SEC
+            )
+        ).find_matching_keys(kid)
 
     err = Exception("id token verification failed")
-    for key in public_keys:
+    for key in public_keys or []:
         try:
             return decode(jwt=id_token, key=key, audience=[audience], algorithms=["RS256"])  # type: ignore
         except Exception as e:
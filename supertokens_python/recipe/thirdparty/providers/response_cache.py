@@ -0,0 +1,168 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+from typing import Callable, Dict, Generic, Optional, TypeVar
+from weakref import WeakKeyDictionary
+
+from httpx import Headers, Response
+from typing_extensions import TypedDict
+
+from supertokens_python.logger import log_debug_message
+from supertokens_python.querier import Querier
+from supertokens_python.utils import get_timestamp_ms
+
+T = TypeVar("T")
+
+
+class ResponseCacheConfigType(TypedDict):
+    # Used when the response has no Cache-Control max-age
+    default_ttl_sec: int
+    # Bounds applied to the max-age sent by the provider. The lower bound makes
+    # sure that "no-cache" responses don't cause a fetch on every request.
+    min_ttl_sec: int
+    max_ttl_sec: int
+    request_timeout: int
+
+
+def get_ttl_sec_from_headers(headers: Headers, config: ResponseCacheConfigType) -> int:
+    ttl_sec: Optional[int] = None
+    cache_control = headers.get("cache-control")
+    if cache_control is not None:
+        for directive in cache_control.lower().split(","):
+            directive = directive.strip()
+            if directive in ("no-cache", "no-store"):
+                ttl_sec = 0
+                break
+            if directive.startswith("max-age="):
+                try:
+                    ttl_sec = int(directive[len("max-age=") :].strip('"'))
+                except ValueError:
+                    pass
+
+    if ttl_sec is None:
+        return config["default_ttl_sec"]
+
+    return min(max(ttl_sec, config["min_ttl_sec"]), config["max_ttl_sec"])
+
+
+class CachedResponse(Generic[T]):
+    def __init__(self, value: T, ttl_sec: int):
+        self.value = value
+        self.fetched_at = get_timestamp_ms()
+        self.expires_at = self.fetched_at + ttl_sec * 1000
+
+    def is_fresh(self) -> bool:
+        return get_timestamp_ms() < self.expires_at
+
+
+class ResponseCache(Generic[T]):
+    """
+    Process wide cache of responses fetched from third party providers (OIDC
+    discovery documents, JWKS), keyed by URL.
+
+    Entries are kept for as long as the provider's Cache-Control allows. Concurrent
+    misses for the same URL on an event loop share one request, and if refreshing an
+    expired entry fails, the expired entry keeps being used.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        parse: Callable[[Response], T],
+        config: ResponseCacheConfigType,
+    ):
+        self.name = name
+        self.parse = parse
+        self.config = config
+        self.entries: Dict[str, CachedResponse[T]] = {}
+        self.in_flight: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, Dict[str, asyncio.Task[CachedResponse[T]]]
+        ] = WeakKeyDictionary()
+
+    async def fetch(self, url: str) -> CachedResponse[T]:
+        log_debug_message("Fetching %s from %s", self.name, url)
+        response = await Querier.get_http_client().get(
+            url, timeout=self.config["request_timeout"] / 1000
+        )
+        log_debug_message(
+            "Received response with status %s and body %s",
+            response.status_code,
+            response.text,
+        )
+        response.raise_for_status()
+
+        entry = CachedResponse(
+            self.parse(response),
+            get_ttl_sec_from_headers(response.headers, self.config),
+        )
+        self.entries[url] = entry
+        return entry
+
+    def fetch_single_flight(self, url: str) -> asyncio.Task[CachedResponse[T]]:
+        loop = asyncio.get_running_loop()
+        tasks = self.in_flight.setdefault(loop, {})
+        task = tasks.get(url)
+        if task is None:
+            task = loop.create_task(self.fetch(url))
+
+            def on_done(t: asyncio.Task[CachedResponse[T]]):
+                tasks.pop(url, None)
+                if not t.cancelled() and t.exception() is not None:
+                    log_debug_message(
+                        "Fetching %s from %s failed: %s", self.name, url, t.exception()
+                    )
+
+            task.add_done_callback(on_done)
+            tasks[url] = task
+        return task
+
+    async def refresh(self, url: str, min_interval_sec: Optional[int] = None) -> T:
+        stale_entry = self.entries.get(url)
+        if (
+            min_interval_sec is not None
+            and stale_entry is not None
+            and get_timestamp_ms() - stale_entry.fetched_at < min_interval_sec * 1000
+        ):
+            # Fetched too recently, this keeps unknown kids (or bad tokens)
+            # from making us hit the provider on every request.
+            return stale_entry.value
+
+        try:
+            # shield so that a cancelled request doesn't cancel the fetch other requests are waiting on
+            entry = await asyncio.shield(self.fetch_single_flight(url))
+        except Exception as e:
+            if stale_entry is None:
+                raise e
+            log_debug_message(
+                "Using the expired %s for %s because the fetch failed: %s",
+                self.name,
+                url,
+                e,
+            )
+            return stale_entry.value
+
+        return entry.value
+
+    async def get(self, url: str) -> T:
+        entry = self.entries.get(url)
+        if entry is not None and entry.is_fresh():
+            return entry.value
+
+        return await self.refresh(url)
+
+    def clear(self):
+        self.entries.clear()
+        self.in_flight.clear()
@@ -197,6 +197,11 @@ class ThirdPartyRecipe(RecipeModule):
             environ["SUPERTOKENS_ENV"] != "testing"
         ):
             raise_general_exception("calling testing function in non testing env")
+        from .providers.config_utils import oidc_discovery_cache
+        from .providers.custom import third_party_jwks_cache
+
+        oidc_discovery_cache.clear()
+        third_party_jwks_cache.clear()
         ThirdPartyRecipe.__instance = None
 
     # instance functions below...............
@@ -24,7 +24,7 @@ from supertokens_python.recipe.session import SessionContainer
 from supertokens_python.recipe.thirdparty.provider import ProviderInput
 from supertokens_python.recipe.thirdparty.providers.config_utils import (
     find_and_create_provider_instance,
-    merge_providers_from_core_and_static,
+    get_merged_providers_for_tenant,
 )
 from supertokens_python.types import AccountInfo, User, RecipeUserId
 
@@ -208,8 +208,8 @@ class RecipeImplementation(RecipeInterface):
         if tenant_config is None:
             raise Exception("Tenant not found")
 
-        merged_providers = merge_providers_from_core_and_static(
-            provider_configs_from_core=tenant_config.third_party_providers,
+        merged_providers = get_merged_providers_for_tenant(
+            tenant_config,
             provider_inputs_from_static=self.providers,
             include_all_providers=tenant_id == DEFAULT_TENANT_ID,
         )
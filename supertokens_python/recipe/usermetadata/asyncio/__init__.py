@@ -1,6 +1,10 @@
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Union
 
+from supertokens_python.recipe.usermetadata.interfaces import MetadataResult
 from supertokens_python.recipe.usermetadata.recipe import UserMetadataRecipe
+from supertokens_python.utils import gather_with_concurrency_limit
+
+DEFAULT_BULK_FETCH_CONCURRENCY = 5
 
 
 async def get_user_metadata(
@@ -15,6 +19,31 @@ async def get_user_metadata(
     )
 
 
+async def get_users_metadata(
+    user_ids: List[str],
+    max_concurrency: int = DEFAULT_BULK_FETCH_CONCURRENCY,
+    user_context: Union[Dict[str, Any], None] = None,
+) -> Dict[str, MetadataResult]:
+    """
+    Fetches the metadata of several users, with at most `max_concurrency` requests
+    to the core in flight at a time. The result is keyed by user id.
+    """
+    if user_context is None:
+        user_context = {}
+    if max_concurrency <= 0:
+        raise ValueError("max_concurrency must be a positive integer")
+    recipe_implementation = UserMetadataRecipe.get_instance().recipe_implementation
+    unique_user_ids = list(dict.fromkeys(user_ids))
+    results = await gather_with_concurrency_limit(
+        max_concurrency,
+        [
+            recipe_implementation.get_user_metadata(user_id, user_context)
+            for user_id in unique_user_ids
+        ],
+    )
+    return dict(zip(unique_user_ids, results))
+
+
 async def update_user_metadata(
     user_id: str,
     metadata_update: Dict[str, Any],
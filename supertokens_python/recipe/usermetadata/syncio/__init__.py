@@ -1,4 +1,4 @@
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Union
 
 from supertokens_python.async_to_sync_wrapper import sync
 
@@ -9,6 +9,21 @@ def get_user_metadata(user_id: str, user_context: Union[Dict[str, Any], None] =
     return sync(get_user_metadata(user_id, user_context))
 
 
+def get_users_metadata(
+    user_ids: List[str],
+    max_concurrency: Union[int, None] = None,
+    user_context: Union[Dict[str, Any], None] = None,
+):
+    from supertokens_python.recipe.usermetadata.asyncio import (
+        DEFAULT_BULK_FETCH_CONCURRENCY,
+        get_users_metadata,
+    )
+
+    if max_concurrency is None:
+        max_concurrency = DEFAULT_BULK_FETCH_CONCURRENCY
+    return sync(get_users_metadata(user_ids, max_concurrency, user_context))
+
+
 def update_user_metadata(
     user_id: str,
     metadata_update: Dict[str, Any],
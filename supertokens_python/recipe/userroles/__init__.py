@@ -32,9 +32,13 @@ def init(
     skip_adding_roles_to_access_token: Optional[bool] = None,
     skip_adding_permissions_to_access_token: Optional[bool] = None,
     override: Union[utils.InputOverrideConfig, None] = None,
+    role_permissions_cache_ttl_sec: Union[int, None] = None,
+    role_permissions_snapshot_refresh_interval_sec: Union[int, None] = None,
 ) -> Callable[[AppInfo], RecipeModule]:
     return UserRolesRecipe.init(
         skip_adding_roles_to_access_token,
         skip_adding_permissions_to_access_token,
         override,
+        role_permissions_cache_ttl_sec,
+        role_permissions_snapshot_refresh_interval_sec,
     )
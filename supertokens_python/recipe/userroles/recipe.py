@@ -22,12 +22,14 @@ from supertokens_python.framework import BaseRequest, BaseResponse
 from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.querier import Querier
 from supertokens_python.recipe.userroles.recipe_implementation import (
+    ROLE_PERMISSIONS_FETCH_CONCURRENCY,
     RecipeImplementation,
 )
 from supertokens_python.recipe.userroles.utils import validate_and_normalise_user_input
 from supertokens_python.recipe_module import APIHandled, RecipeModule
 from supertokens_python.supertokens import AppInfo
 from supertokens_python.types import RecipeUserId
+from supertokens_python.utils import gather_with_concurrency_limit
 
 from ...post_init_callbacks import PostSTInitCallbacks
 from ..session import SessionRecipe
@@ -48,6 +50,8 @@ class UserRolesRecipe(RecipeModule):
         skip_adding_roles_to_access_token: Optional[bool] = None,
         skip_adding_permissions_to_access_token: Optional[bool] = None,
         override: Union[InputOverrideConfig, None] = None,
+        role_permissions_cache_ttl_sec: Union[int, None] = None,
+        role_permissions_snapshot_refresh_interval_sec: Union[int, None] = None,
     ):
         super().__init__(recipe_id, app_info)
         self.config = validate_and_normalise_user_input(
@@ -56,8 +60,12 @@ class UserRolesRecipe(RecipeModule):
             skip_adding_roles_to_access_token,
             skip_adding_permissions_to_access_token,
             override,
+            role_permissions_cache_ttl_sec,
+            role_permissions_snapshot_refresh_interval_sec,
+        )
+        recipe_implementation = RecipeImplementation(
+            Querier.get_instance(recipe_id), self.config
         )
-        recipe_implementation = RecipeImplementation(Querier.get_instance(recipe_id))
         self.recipe_implementation = (
             recipe_implementation
             if self.config.override.functions is None
@@ -111,6 +119,8 @@ class UserRolesRecipe(RecipeModule):
         skip_adding_roles_to_access_token: Optional[bool] = None,
         skip_adding_permissions_to_access_token: Optional[bool] = None,
         override: Union[InputOverrideConfig, None] = None,
+        role_permissions_cache_ttl_sec: Union[int, None] = None,
+        role_permissions_snapshot_refresh_interval_sec: Union[int, None] = None,
     ):
         def func(app_info: AppInfo):
             if UserRolesRecipe.__instance is None:
@@ -120,6 +130,8 @@ class UserRolesRecipe(RecipeModule):
                     skip_adding_roles_to_access_token,
                     skip_adding_permissions_to_access_token,
                     override,
+                    role_permissions_cache_ttl_sec,
+                    role_permissions_snapshot_refresh_interval_sec,
                 )
                 return UserRolesRecipe.__instance
             raise Exception(
@@ -166,13 +178,18 @@ class PermissionClaimClass(PrimitiveArrayClaim[List[str]]):
 
             user_permissions: Set[str] = set()
 
-            for role in user_roles.roles:
-                role_permissions = (
-                    await recipe.recipe_implementation.get_permissions_for_role(
+            # The roles are independent, so their permissions are fetched concurrently
+            roles_permissions = await gather_with_concurrency_limit(
+                ROLE_PERMISSIONS_FETCH_CONCURRENCY,
+                [
+                    recipe.recipe_implementation.get_permissions_for_role(
                         role, user_context
                     )
-                )
+                    for role in user_roles.roles
+                ],
+            )
 
+            for role_permissions in roles_permissions:
                 if isinstance(role_permissions, GetPermissionsForRoleOkResult):
                     for permission in role_permissions.permissions:
                         user_permissions.add(permission)
@@ -11,12 +11,13 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
+from __future__ import annotations
 
-
-from typing import Any, Dict, List, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.querier import Querier
+from supertokens_python.utils import gather_with_concurrency_limit
 
 from .interfaces import (
     AddRoleToUserOkResult,
@@ -32,12 +33,31 @@ from .interfaces import (
     RemoveUserRoleOkResult,
     UnknownRoleError,
 )
+from .role_permissions_cache import PermissionsForRoleResult, RolePermissionsCache
+
+# Max number of role permission requests to the core in flight at a time
+ROLE_PERMISSIONS_FETCH_CONCURRENCY = 10
+
+if TYPE_CHECKING:
+    from .utils import UserRolesConfig
 
 
 class RecipeImplementation(RecipeInterface):
-    def __init__(self, querier: Querier):
+    def __init__(self, querier: Querier, config: Optional[UserRolesConfig] = None):
         super().__init__()
         self.querier = querier
+        self.role_permissions_cache: Optional[RolePermissionsCache] = (
+            RolePermissionsCache(
+                config.role_permissions_cache_ttl_sec,
+                config.role_permissions_snapshot_refresh_interval_sec,
+            )
+            if config is not None and config.role_permissions_cache_ttl_sec is not None
+            else None
+        )
+
+    def invalidate_cached_role(self, role: str):
+        if self.role_permissions_cache is not None:
+            self.role_permissions_cache.invalidate(role)
 
     async def add_role_to_user(
         self,
@@ -110,6 +130,7 @@ class RecipeImplementation(RecipeInterface):
             params,
             user_context=user_context,
         )
+        self.invalidate_cached_role(role)
         return CreateNewRoleOrAddPermissionsOkResult(
             created_new_role=response["createdNewRole"]
         )
@@ -117,6 +138,20 @@ class RecipeImplementation(RecipeInterface):
     async def get_permissions_for_role(
         self, role: str, user_context: Dict[str, Any]
     ) -> Union[GetPermissionsForRoleOkResult, UnknownRoleError]:
+        cache = self.role_permissions_cache
+        if cache is None:
+            return await self.get_permissions_for_role_from_core(role, user_context)
+
+        if cache.should_refresh_snapshot():
+            cache.refresh_snapshot_in_background(self.get_all_roles_permissions)
+
+        return await cache.get_or_fetch(
+            role, lambda: self.get_permissions_for_role_from_core(role, user_context)
+        )
+
+    async def get_permissions_for_role_from_core(
+        self, role: str, user_context: Dict[str, Any]
+    ) -> PermissionsForRoleResult:
         params = {"role": role}
         response = await self.querier.send_get_request(
             NormalisedURLPath("/recipe/role/permissions"),
@@ -127,6 +162,16 @@ class RecipeImplementation(RecipeInterface):
             return GetPermissionsForRoleOkResult(permissions=response["permissions"])
         return UnknownRoleError()
 
+    async def get_all_roles_permissions(self) -> Dict[str, PermissionsForRoleResult]:
+        # Used to load the role permissions snapshot. This runs in the background,
+        # so it doesn't use the user_context of the request that triggered it.
+        roles = (await self.get_all_roles({})).roles
+        results = await gather_with_concurrency_limit(
+            ROLE_PERMISSIONS_FETCH_CONCURRENCY,
+            [self.get_permissions_for_role_from_core(role, {}) for role in roles],
+        )
+        return dict(zip(roles, results))
+
     async def remove_permissions_from_role(
         self, role: str, permissions: List[str], user_context: Dict[str, Any]
     ) -> Union[RemovePermissionsFromRoleOkResult, UnknownRoleError]:
@@ -136,6 +181,7 @@ class RecipeImplementation(RecipeInterface):
             params,
             user_context=user_context,
         )
+        self.invalidate_cached_role(role)
         if response["status"] == "OK":
             return RemovePermissionsFromRoleOkResult()
         return UnknownRoleError()
@@ -160,6 +206,7 @@ class RecipeImplementation(RecipeInterface):
             params,
             user_context=user_context,
         )
+        self.invalidate_cached_role(role)
         return DeleteRoleOkResult(did_role_exist=response["didRoleExist"])
 
     async def get_all_roles(self, user_context: Dict[str, Any]) -> GetAllRolesOkResult:
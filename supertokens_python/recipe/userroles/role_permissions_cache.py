@@ -0,0 +1,173 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Awaitable, Callable, Dict, Optional, Tuple, Union
+from weakref import WeakKeyDictionary
+
+from supertokens_python.logger import log_debug_message
+from supertokens_python.utils import get_timestamp_ms
+
+from .interfaces import GetPermissionsForRoleOkResult, UnknownRoleError
+
+PermissionsForRoleResult = Union[GetPermissionsForRoleOkResult, UnknownRoleError]
+
+
+class RolePermissionsCache:
+    """
+    Process wide cache of the permissions of each role, so that fetching the
+    PermissionClaim doesn't query the core for every role of the user.
+
+    Concurrent misses for the same role on an event loop share one request. Roles
+    changed through this SDK instance are invalidated right away, changes made
+    elsewhere are picked up once the entry expires.
+
+    If snapshot_refresh_interval_sec is set, the permissions of all the roles are
+    also loaded in one go, and reloaded in the background once the snapshot is
+    older than the interval. Roles in the snapshot don't expire in between.
+    """
+
+    def __init__(self, ttl_sec: int, snapshot_refresh_interval_sec: Optional[int]):
+        self.ttl_sec = ttl_sec
+        self.snapshot_refresh_interval_sec = snapshot_refresh_interval_sec
+        self.__entries: Dict[str, Tuple[PermissionsForRoleResult, int]] = {}
+        self.__snapshot: Dict[str, PermissionsForRoleResult] = {}
+        self.__snapshot_loaded_at: Optional[int] = None
+        # Bumped on every invalidation so that a fetch that started before a
+        # role was updated doesn't put the old permissions back in the cache.
+        self.__generation = 0
+        self.__lock = threading.Lock()
+        self.in_flight: WeakKeyDictionary[
+            asyncio.AbstractEventLoop,
+            Dict[str, asyncio.Task[PermissionsForRoleResult]],
+        ] = WeakKeyDictionary()
+        self.snapshot_refresh: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Task[None]
+        ] = WeakKeyDictionary()
+
+    def get(self, role: str) -> Optional[PermissionsForRoleResult]:
+        with self.__lock:
+            snapshot_result = self.__snapshot.get(role)
+            if snapshot_result is not None:
+                return snapshot_result
+            entry = self.__entries.get(role)
+            if entry is None:
+                return None
+            if entry[1] <= get_timestamp_ms():
+                del self.__entries[role]
+                return None
+            return entry[0]
+
+    def set(self, role: str, result: PermissionsForRoleResult, generation: int):
+        with self.__lock:
+            if generation != self.__generation:
+                return
+            self.__entries[role] = (result, get_timestamp_ms() + self.ttl_sec * 1000)
+
+    def set_snapshot(
+        self, results: Dict[str, PermissionsForRoleResult], generation: int
+    ):
+        with self.__lock:
+            if generation != self.__generation:
+                return
+            self.__snapshot = results
+            self.__snapshot_loaded_at = get_timestamp_ms()
+
+    def invalidate(self, role: str):
+        with self.__lock:
+            self.__generation += 1
+            self.__entries.pop(role, None)
+            self.__snapshot.pop(role, None)
+
+    def clear(self):
+        with self.__lock:
+            self.__generation += 1
+            self.__entries.clear()
+            self.__snapshot = {}
+            self.__snapshot_loaded_at = None
+        self.in_flight.clear()
+        self.snapshot_refresh.clear()
+
+    async def get_or_fetch(
+        self, role: str, fetch: Callable[[], Awaitable[PermissionsForRoleResult]]
+    ) -> PermissionsForRoleResult:
+        result = self.get(role)
+        if result is not None:
+            return result
+
+        loop = asyncio.get_running_loop()
+        tasks = self.in_flight.setdefault(loop, {})
+        task = tasks.get(role)
+        if task is None:
+            generation = self.__generation
+
+            async def fetch_and_set() -> PermissionsForRoleResult:
+                fetched = await fetch()
+                self.set(role, fetched, generation)
+                return fetched
+
+            task = loop.create_task(fetch_and_set())
+
+            def on_done(t: asyncio.Task[PermissionsForRoleResult]):
+                tasks.pop(role, None)
+                if not t.cancelled() and t.exception() is not None:
+                    log_debug_message(
+                        "Fetching the permissions of role %s failed: %s",
+                        role,
+                        t.exception(),
+                    )
+
+            task.add_done_callback(on_done)
+            tasks[role] = task
+
+        # shield so that a cancelled request doesn't cancel the fetch other requests are waiting on
+        return await asyncio.shield(task)
+
+    def should_refresh_snapshot(self) -> bool:
+        if self.snapshot_refresh_interval_sec is None:
+            return False
+        return (
+            self.__snapshot_loaded_at is None
+            or get_timestamp_ms() - self.__snapshot_loaded_at
+            >= self.snapshot_refresh_interval_sec * 1000
+        )
+
+    def refresh_snapshot_in_background(
+        self, fetch: Callable[[], Awaitable[Dict[str, PermissionsForRoleResult]]]
+    ) -> asyncio.Task[None]:
+        loop = asyncio.get_running_loop()
+        task = self.snapshot_refresh.get(loop)
+        if task is None:
+            generation = self.__generation
+
+            async def refresh():
+                self.set_snapshot(await fetch(), generation)
+
+            task = loop.create_task(refresh())
+
+            def on_done(t: asyncio.Task[None]):
+                self.snapshot_refresh.pop(loop, None)
+                # Retrieve the error here so that it doesn't end up as an
+                # "exception was never retrieved" warning.
+                if not t.cancelled() and t.exception() is not None:
+                    log_debug_message(
+                        "Refreshing the role permissions snapshot failed: %s",
+                        t.exception(),
+                    )
+
+            task.add_done_callback(on_done)
+            self.snapshot_refresh[loop] = task
+        return task
@@ -39,12 +39,18 @@ class UserRolesConfig:
         skip_adding_roles_to_access_token: bool,
         skip_adding_permissions_to_access_token: bool,
         override: InputOverrideConfig,
+        role_permissions_cache_ttl_sec: Optional[int],
+        role_permissions_snapshot_refresh_interval_sec: Optional[int],
     ) -> None:
         self.skip_adding_roles_to_access_token = skip_adding_roles_to_access_token
         self.skip_adding_permissions_to_access_token = (
             skip_adding_permissions_to_access_token
         )
         self.override = override
+        self.role_permissions_cache_ttl_sec = role_permissions_cache_ttl_sec
+        self.role_permissions_snapshot_refresh_interval_sec = (
+            role_permissions_snapshot_refresh_interval_sec
+        )
 
 
 def validate_and_normalise_user_input(
@@ -53,6 +59,8 @@ def validate_and_normalise_user_input(
     skip_adding_roles_to_access_token: Optional[bool] = None,
     skip_adding_permissions_to_access_token: Optional[bool] = None,
     override: Union[InputOverrideConfig, None] = None,
+    role_permissions_cache_ttl_sec: Optional[int] = None,
+    role_permissions_snapshot_refresh_interval_sec: Optional[int] = None,
 ) -> UserRolesConfig:
     if override is not None and not isinstance(override, InputOverrideConfig):  # type: ignore
         raise ValueError("override must be an instance of InputOverrideConfig or None")
@@ -60,6 +68,27 @@ def validate_and_normalise_user_input(
     if override is None:
         override = InputOverrideConfig()
 
+    if role_permissions_cache_ttl_sec is not None and (
+        not isinstance(role_permissions_cache_ttl_sec, int)  # type: ignore
+        or role_permissions_cache_ttl_sec <= 0
+    ):
+        raise ValueError(
+            "role_permissions_cache_ttl_sec must be a positive integer or None"
+        )
+
+    if role_permissions_snapshot_refresh_interval_sec is not None:
+        if (
+            not isinstance(role_permissions_snapshot_refresh_interval_sec, int)  # type: ignore
+            or role_permissions_snapshot_refresh_interval_sec <= 0
+        ):
+            raise ValueError(
+                "role_permissions_snapshot_refresh_interval_sec must be a positive integer or None"
+            )
+        if role_permissions_cache_ttl_sec is None:
+            raise ValueError(
+                "role_permissions_snapshot_refresh_interval_sec requires role_permissions_cache_ttl_sec to be set"
+            )
+
     if skip_adding_roles_to_access_token is None:
         skip_adding_roles_to_access_token = False
     if skip_adding_permissions_to_access_token is None:
@@ -69,4 +98,6 @@ def validate_and_normalise_user_input(
         skip_adding_roles_to_access_token=skip_adding_roles_to_access_token,
         skip_adding_permissions_to_access_token=skip_adding_permissions_to_access_token,
         override=override,
+        role_permissions_cache_ttl_sec=role_permissions_cache_ttl_sec,
+        role_permissions_snapshot_refresh_interval_sec=role_permissions_snapshot_refresh_interval_sec,
     )
@@ -16,7 +16,17 @@ from __future__ import annotations
 
 import abc
 import re
-from typing import TYPE_CHECKING, List, Union, Optional, Dict, Any, Callable, Awaitable
+from typing import (
+    TYPE_CHECKING,
+    List,
+    Union,
+    Optional,
+    Dict,
+    Any,
+    Callable,
+    Awaitable,
+    Tuple,
+)
 from typing_extensions import Literal
 
 from .framework.response import BaseResponse
@@ -134,6 +144,124 @@ class RecipeModule(abc.ABC):
         pass
 
 
+class RouteTable:
+    """
+    Index of the APIs handled by the recipes, built once so that finding the recipe
+    that can handle a request is a dict lookup instead of a loop over every recipe.
+
+    It gives the same result as calling return_api_id_if_can_handle_request on each
+    recipe in order. Recipes that override return_api_id_if_can_handle_request are
+    not indexed and are still asked directly.
+    """
+
+    TENANT_PATH_REGEX = re.compile(r"^/([a-zA-Z0-9-]+)(/.*)$")
+
+    def __init__(
+        self, api_base_path: NormalisedURLPath, recipe_modules: List[RecipeModule]
+    ):
+        self.api_base_path = api_base_path.get_as_string_dangerous()
+        self.recipe_modules = recipe_modules
+        # (method, path) -> [(recipe index, api index, api id)]
+        self.routes: Dict[Tuple[str, str], List[Tuple[int, int, str]]] = {}
+        self.custom_matcher_indexes: List[int] = []
+
+        for recipe_index, recipe in enumerate(recipe_modules):
+            if (
+                type(recipe).return_api_id_if_can_handle_request
+                is not RecipeModule.return_api_id_if_can_handle_request
+            ):
+                self.custom_matcher_indexes.append(recipe_index)
+                continue
+
+            for api_index, api in enumerate(recipe.get_apis_handled()):
+                if api.disabled:
+                    continue
+                path = api_base_path.append(api.path_without_api_base_path)
+                self.routes.setdefault(
+                    (api.method, path.get_as_string_dangerous()), []
+                ).append((recipe_index, api_index, api.request_id))
+
+    def find_routes(
+        self, path: str, method: str
+    ) -> Dict[int, Tuple[str, Optional[str]]]:
+        """
+        Returns recipe index -> (api id, tenant id from the path) for the indexed recipes.
+        The tenant id is None if the path matched without a tenant prefix.
+        """
+        # recipe index -> (api index, 0 for a match without tenant and 1 with, api id, tenant id)
+        matches: Dict[int, Tuple[int, int, str, Optional[str]]] = {}
+
+        def add_matches(key: Tuple[str, str], tenant_id: Optional[str]):
+            for recipe_index, api_index, api_id in self.routes.get(key, []):
+                candidate = (
+                    api_index,
+                    0 if tenant_id is None else 1,
+                    api_id,
+                    tenant_id,
+                )
+                current = matches.get(recipe_index)
+                if current is None or candidate[:2] < current[:2]:
+                    matches[recipe_index] = candidate
+
+        if not path.startswith(self.api_base_path):
+            return {}
+
+        add_matches((method, path), None)
+
+        match = RouteTable.TENANT_PATH_REGEX.match(path[len(self.api_base_path) :])
+        if match is not None:
+            add_matches((method, self.api_base_path + match.group(2)), match.group(1))
+
+        return {
+            recipe_index: (api_id, tenant_id)
+            for recipe_index, (_, _, api_id, tenant_id) in matches.items()
+        }
+
+    async def get_matching_apis(
+        self,
+        path: NormalisedURLPath,
+        method: str,
+        user_context: Dict[str, Any],
+        recipes: Optional[List[RecipeModule]] = None,
+        first_only: bool = False,
+    ) -> List[Tuple[RecipeModule, ApiIdWithTenantId]]:
+        from supertokens_python.recipe.multitenancy.constants import DEFAULT_TENANT_ID
+
+        routes = self.find_routes(path.get_as_string_dangerous(), method)
+        candidate_indexes = sorted(set(routes).union(self.custom_matcher_indexes))
+
+        assert RecipeModule.get_tenant_id is not None
+        assert callable(RecipeModule.get_tenant_id)
+
+        result: List[Tuple[RecipeModule, ApiIdWithTenantId]] = []
+        for recipe_index in candidate_indexes:
+            recipe = self.recipe_modules[recipe_index]
+            if recipes is not None and all(recipe is not r for r in recipes):
+                continue
+
+            if recipe_index in routes:
+                api_id, tenant_id = routes[recipe_index]
+                final_tenant_id = (
+                    await RecipeModule.get_tenant_id(  # pylint: disable=not-callable
+                        DEFAULT_TENANT_ID if tenant_id is None else tenant_id,
+                        user_context,
+                    )
+                )
+                api_and_tenant_id = ApiIdWithTenantId(api_id, final_tenant_id)
+            else:
+                api_and_tenant_id = await recipe.return_api_id_if_can_handle_request(
+                    path, method, user_context
+                )
+                if api_and_tenant_id is None:
+                    continue
+
+            result.append((recipe, api_and_tenant_id))
+            if first_only:
+                break
+
+        return result
+
+
 class APIHandled:
     def __init__(
         self,
@@ -28,6 +28,9 @@ from supertokens_python.logger import (
 
 from .constants import FDI_KEY_HEADER, RID_KEY_HEADER, USER_COUNT
 from .exceptions import SuperTokensError
+from .http_client import HttpClientConfig
+from .core_call_cache import SharedCoreCallCacheConfig
+from .core_call_tracing import CoreCallTracingConfig
 from .interfaces import (
     CreateUserIdMappingOkResult,
     DeleteUserIdMappingOkResult,
@@ -51,7 +54,7 @@ from .utils import (
 )
 
 if TYPE_CHECKING:
-    from .recipe_module import RecipeModule
+    from .recipe_module import RecipeModule, RouteTable
     from supertokens_python.framework.request import BaseRequest
     from supertokens_python.framework.response import BaseResponse
     from supertokens_python.recipe.session import SessionContainer
@@ -86,11 +89,17 @@ class SupertokensConfig:
             ]
         ] = None,
         disable_core_call_cache: bool = False,
+        http_client_config: Optional[HttpClientConfig] = None,
+        shared_core_call_cache: Optional[SharedCoreCallCacheConfig] = None,
+        core_call_tracing: Optional[CoreCallTracingConfig] = None,
     ):  # We keep this = None here because this is directly used by the user.
         self.connection_uri = connection_uri
         self.api_key = api_key
         self.network_interceptor = network_interceptor
         self.disable_core_call_cache = disable_core_call_cache
+        self.http_client_config = http_client_config
+        self.shared_core_call_cache = shared_core_call_cache
+        self.core_call_tracing = core_call_tracing
 
 
 class Host:
@@ -248,6 +257,9 @@ class Supertokens:
             supertokens_config.api_key,
             supertokens_config.network_interceptor,
             supertokens_config.disable_core_call_cache,
+            supertokens_config.http_client_config,
+            supertokens_config.shared_core_call_cache,
+            supertokens_config.core_call_tracing,
         )
 
         if len(recipe_list) == 0:
@@ -286,6 +298,8 @@ class Supertokens:
 
             self.recipe_modules.append(UserMetadataRecipe.init()(self.app_info))
 
+        self.route_table: Optional[RouteTable] = None
+
         self.telemetry = (
             telemetry
             if telemetry is not None
@@ -505,6 +519,17 @@ class Supertokens:
 
         raise_general_exception("Please upgrade the SuperTokens core to >= 3.15.0")
 
+    def get_route_table(self) -> RouteTable:
+        # Built on first use rather than in __init__ so that the APIs handled
+        # reflect the recipes after all the post init callbacks have run.
+        if self.route_table is None:
+            from .recipe_module import RouteTable
+
+            self.route_table = RouteTable(
+                self.app_info.api_base_path, self.recipe_modules
+            )
+        return self.route_table
+
     async def middleware(
         self, request: BaseRequest, response: BaseResponse, user_context: Dict[str, Any]
     ) -> Union[BaseResponse, None]:
@@ -528,38 +553,39 @@ class Supertokens:
             # see https://github.com/supertokens/supertokens-python/issues/54
             request_rid = None
 
+        route_table = self.get_route_table()
+
         async def handle_without_rid():
-            for recipe in self.recipe_modules:
+            log_debug_message(
+                "middleware: Checking for a recipe that can handle path: %s and method: %s",
+                path.get_as_string_dangerous(),
+                method,
+            )
+            matching_apis = await route_table.get_matching_apis(
+                path, method, user_context, first_only=True
+            )
+            for recipe, api_and_tenant_id in matching_apis:
                 log_debug_message(
-                    "middleware: Checking recipe ID for match: %s with path: %s and method: %s",
-                    recipe.get_recipe_id(),
-                    path.get_as_string_dangerous(),
-                    method,
+                    "middleware: Request being handled by recipe. ID is: %s",
+                    api_and_tenant_id.api_id,
                 )
-                api_and_tenant_id = await recipe.return_api_id_if_can_handle_request(
-                    path, method, user_context
+                api_resp = await self.__handle_api_request(
+                    recipe,
+                    api_and_tenant_id.api_id,
+                    api_and_tenant_id.tenant_id,
+                    request,
+                    path,
+                    method,
+                    response,
+                    user_context,
                 )
-                if api_and_tenant_id is not None:
+                if api_resp is None:
                     log_debug_message(
-                        "middleware: Request being handled by recipe. ID is: %s",
-                        api_and_tenant_id.api_id,
-                    )
-                    api_resp = await recipe.handle_api_request(
-                        api_and_tenant_id.api_id,
-                        api_and_tenant_id.tenant_id,
-                        request,
-                        path,
-                        method,
-                        response,
-                        user_context,
+                        "middleware: Not handled because API returned None"
                     )
-                    if api_resp is None:
-                        log_debug_message(
-                            "middleware: Not handled because API returned None"
-                        )
-                        return None
-                    log_debug_message("middleware: Ended")
-                    return api_resp
+                    return None
+                log_debug_message("middleware: Ended")
+                return api_resp
             log_debug_message("middleware: Not handling because no recipe matched")
             return None
 
@@ -589,28 +615,24 @@ class Supertokens:
                     "middleware: Matched with recipe Ids: %s", recipe.get_recipe_id()
                 )
 
-            id_result = None
-            final_matched_recipe = None
-            for recipe in matched_recipes:
-                current_id_result = await recipe.return_api_id_if_can_handle_request(
-                    path, method, user_context
+            matching_apis = await route_table.get_matching_apis(
+                path, method, user_context, recipes=matched_recipes
+            )
+            if len(matching_apis) > 1:
+                raise ValueError(
+                    "Two recipes have matched the same API path and method! This is a bug in the SDK. Please contact support."
                 )
-                if current_id_result is not None:
-                    if id_result is not None:
-                        raise ValueError(
-                            "Two recipes have matched the same API path and method! This is a bug in the SDK. Please contact support."
-                        )
-                    final_matched_recipe = recipe
-                    id_result = current_id_result
-
-            if id_result is None or final_matched_recipe is None:
+
+            if len(matching_apis) == 0:
                 return await handle_without_rid()
 
+            final_matched_recipe, id_result = matching_apis[0]
             log_debug_message(
                 "middleware: Request being handled by recipe. ID is: %s",
                 id_result.api_id,
             )
-            request_handled = await final_matched_recipe.handle_api_request(
+            request_handled = await self.__handle_api_request(
+                final_matched_recipe,
                 id_result.api_id,
                 id_result.tenant_id,
                 request,
@@ -628,6 +650,34 @@ class Supertokens:
             return request_handled
         return await handle_without_rid()
 
+    async def __handle_api_request(
+        self,
+        recipe: RecipeModule,
+        api_id: str,
+        tenant_id: str,
+        request: BaseRequest,
+        path: NormalisedURLPath,
+        method: str,
+        response: BaseResponse,
+        user_context: Dict[str, Any],
+    ) -> Union[BaseResponse, None]:
+        tracer = Querier.get_core_call_tracer()
+        if tracer is None:
+            return await recipe.handle_api_request(
+                api_id, tenant_id, request, path, method, response, user_context
+            )
+
+        token = tracer.start_trace(recipe.get_recipe_id(), api_id)
+        try:
+            api_resp = await recipe.handle_api_request(
+                api_id, tenant_id, request, path, method, response, user_context
+            )
+        except Exception:
+            tracer.end_trace(token, user_context, check_budget=False)
+            raise
+        tracer.end_trace(token, user_context, check_budget=True)
+        return api_resp
+
     async def handle_supertokens_error(
         self,
         request: BaseRequest,
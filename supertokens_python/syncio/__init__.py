@@ -177,3 +177,11 @@ def list_users_by_account_info(
             tenant_id, account_info, do_union_of_account_info, user_context
         )
     )
+
+
+def close_core_connections() -> None:
+    from supertokens_python.asyncio import (
+        close_core_connections as async_close_core_connections,
+    )
+
+    return sync(async_close_core_connections())
@@ -0,0 +1,84 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+Request scoped map of the users fetched from or returned by the core, keyed by
+the user id and by the recipe user id of each of their login methods. It lets the
+places that need the same user during one sign in / sign up share one User
+object, including right after a write (like linking accounts) that returned it.
+
+Entries are tagged like the responses in the core call cache, so the same writes
+make them stale.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Optional, Set, Tuple, Union
+
+from supertokens_python.types import User
+
+from .core_call_cache import CoreCallCacheTagVersions
+
+# Families of core APIs whose writes can change what a User looks like.
+USER_IDENTITY_MAP_FAMILIES = ("users", "emailverification", "multitenancy")
+
+
+def get_user_ids(user: User) -> Set[str]:
+    return {user.id} | {lm.recipe_user_id.get_as_string() for lm in user.login_methods}
+
+
+def get_user_tags(user_ids: Iterable[str]) -> Set[str]:
+    tags = set(USER_IDENTITY_MAP_FAMILIES)
+    for user_id in user_ids:
+        for family in USER_IDENTITY_MAP_FAMILIES:
+            tags.add(f"{family}|user:{user_id}")
+    return tags
+
+
+def get_from_user_identity_map(
+    user_context: Union[Dict[str, Any], None],
+    user_id: str,
+    tag_versions: CoreCallCacheTagVersions,
+) -> Optional[User]:
+    if user_context is None:
+        return None
+    identity_map = user_context.get("_default", {}).get("user_identity_map", {})
+    entry = identity_map.get(user_id)
+    if entry is None or not tag_versions.is_valid(entry["snapshot"]):
+        return None
+    return entry["user"]
+
+
+def add_to_user_identity_map(
+    user_context: Union[Dict[str, Any], None],
+    user: User,
+    tag_versions: CoreCallCacheTagVersions,
+    snapshot: Optional[Tuple[int, Dict[str, int]]] = None,
+):
+    """
+    snapshot, if given, was taken before the user was fetched and takes
+    precedence over the current versions of the tags it has.
+    """
+    if user_context is None:
+        return
+    user_ids = get_user_ids(user)
+    tags = get_user_tags(user_ids)
+    global_version, versions = tag_versions.snapshot(tags)
+    if snapshot is not None:
+        global_version = snapshot[0]
+        versions.update(snapshot[1])
+    entry = {"user": user, "snapshot": (global_version, versions), "tags": tags}
+    identity_map = user_context.setdefault("_default", {}).setdefault(
+        "user_identity_map", {}
+    )
+    for user_id in user_ids:
+        identity_map[user_id] = entry
@@ -14,9 +14,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import threading
 import warnings
+from hashlib import sha256
 from base64 import urlsafe_b64decode, urlsafe_b64encode, b64encode, b64decode
 from math import floor
 from re import fullmatch
@@ -162,6 +164,33 @@ def send_200_response(
     return response
 
 
+def serialise_json_response(content: Dict[str, Any]) -> bytes:
+    # The same serialisation as the frameworks' set_json_content
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def get_etag(body: bytes) -> str:
+    return f'"{sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    if if_none_match is None:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag in ("*", etag):
+            return True
+    return False
+
+
 def get_timestamp_ms() -> int:
     return int(time() * 1000)
 
@@ -277,6 +306,22 @@ async def resolve(obj: MaybeAwaitable[_T]) -> _T:
     return obj  # type: ignore
 
 
+async def gather_with_concurrency_limit(
+    limit: int, awaitables: List[Awaitable[_T]]
+) -> List[_T]:
+    """
+    Like asyncio.gather, but runs at most `limit` of the awaitables at a time. A
+    new one is started as soon as any running one finishes.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(awaitable: Awaitable[_T]) -> _T:
+        async with semaphore:
+            return await awaitable
+
+    return list(await asyncio.gather(*[run(a) for a in awaitables]))
+
+
 def get_top_level_domain_for_same_site_resolution(url: str) -> str:
     url_obj = urlparse(url)
     hostname = url_obj.hostname
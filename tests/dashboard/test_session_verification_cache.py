@@ -0,0 +1,106 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import httpx
+import respx
+from fastapi import FastAPI
+from pytest import fixture, raises
+
+from supertokens_python import init
+from supertokens_python.framework.fastapi import get_middleware
+from supertokens_python.recipe import dashboard, session
+from tests.testclient import TestClientWithNoCookieJar as TestClient
+from tests.utils import (
+    get_st_init_args,
+    CORE_URL,
+    mock_core_api_version,
+    setup_function_without_core as setup_function,
+    teardown_function_without_core as teardown_function,
+)
+
+_ = setup_function
+_ = teardown_function
+
+
+@fixture(scope="function")
+def app():
+    app = FastAPI()
+    app.add_middleware(get_middleware())
+
+    return TestClient(app)
+
+
+def mock_core(mocker: respx.MockRouter):
+    mock_core_api_version(mocker, pass_through_test_client=True)
+    mocker.get(url__regex=rf"{CORE_URL}/.*users/count.*").mock(
+        return_value=httpx.Response(200, json={"status": "OK", "count": 1})
+    )
+    mocker.delete(f"{CORE_URL}/recipe/dashboard/session").mock(
+        return_value=httpx.Response(200, json={"status": "OK"})
+    )
+    return mocker.post(f"{CORE_URL}/recipe/dashboard/session/verify").mock(
+        return_value=httpx.Response(200, json={"status": "OK", "email": "a@b.com"})
+    )
+
+
+def get_users_count(app: TestClient, session_id: str):
+    return app.get(
+        "/auth/dashboard/api/users/count",
+        headers={"authorization": f"Bearer {session_id}"},
+    )
+
+
+def test_dashboard_session_verification_is_cached_until_sign_out(app: TestClient):
+    init(
+        **get_st_init_args(
+            [session.init(), dashboard.init(session_verification_cache_ttl_sec=60)]
+        )
+    )
+
+    with respx.mock(assert_all_called=False) as mocker:
+        verify_route = mock_core(mocker)
+
+        assert get_users_count(app, "session1").status_code == 200
+        assert get_users_count(app, "session1").status_code == 200
+        assert verify_route.call_count == 1
+
+        assert get_users_count(app, "session2").status_code == 200
+        assert verify_route.call_count == 2
+
+        res = app.post(
+            "/auth/dashboard/api/signout",
+            headers={"authorization": "Bearer session1"},
+        )
+        assert res.status_code == 200
+        assert get_users_count(app, "session1").status_code == 200
+        assert verify_route.call_count == 3
+
+
+def test_dashboard_session_verification_is_not_cached_by_default(app: TestClient):
+    init(**get_st_init_args([session.init(), dashboard.init()]))
+
+    with respx.mock(assert_all_called=False) as mocker:
+        verify_route = mock_core(mocker)
+
+        assert get_users_count(app, "session1").status_code == 200
+        assert get_users_count(app, "session1").status_code == 200
+        assert verify_route.call_count == 2
+
+
+def test_session_verification_cache_ttl_is_validated():
+    with raises(ValueError):
+        init(
+            **get_st_init_args(
+                [session.init(), dashboard.init(session_verification_cache_ttl_sec=0)]
+            )
+        )
@@ -0,0 +1,144 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+from typing import Any, Dict, List
+
+import httpx
+import respx
+from fastapi import FastAPI
+from pytest import fixture, mark
+
+from supertokens_python import init
+from supertokens_python.framework.fastapi import get_middleware
+from supertokens_python.recipe import jwt, session
+from supertokens_python.recipe.jwt.interfaces import GetJWKSResult, JsonWebKey
+from supertokens_python.recipe.jwt.jwks_response_cache import JWKSResponseCache
+from tests.testclient import TestClientWithNoCookieJar as TestClient
+from tests.utils import (
+    get_st_init_args,
+    CORE_URL,
+    mock_core_api_version,
+    setup_function_without_core as setup_function,
+    teardown_function_without_core as teardown_function,
+)
+
+_ = setup_function
+_ = teardown_function
+
+KEYS: List[Dict[str, Any]] = [
+    {"kty": "RSA", "kid": "s-1", "n": "abc", "e": "AQAB", "alg": "RS256", "use": "sig"}
+]
+
+
+@fixture(scope="function")
+def app():
+    app = FastAPI()
+    app.add_middleware(get_middleware())
+
+    return TestClient(app)
+
+
+def mock_core(mocker: respx.MockRouter):
+    mock_core_api_version(mocker, pass_through_test_client=True)
+    return mocker.get(f"{CORE_URL}/.well-known/jwks.json").mock(
+        return_value=httpx.Response(
+            200,
+            json={"keys": KEYS},
+            headers={"Cache-Control": "max-age=60, must-revalidate"},
+        )
+    )
+
+
+def test_jwks_response_is_cached_with_an_etag(app: TestClient):
+    init(**get_st_init_args([session.init(cache_jwks_response=True)]))
+
+    with respx.mock(assert_all_called=False) as mocker:
+        jwks_route = mock_core(mocker)
+
+        res = app.get("/auth/jwt/jwks.json")
+        assert res.status_code == 200
+        assert res.json() == {"keys": KEYS}
+        assert res.headers["cache-control"] == "max-age=60, must-revalidate"
+        etag = res.headers["etag"]
+
+        res = app.get("/auth/jwt/jwks.json")
+        assert res.status_code == 200
+        assert res.json() == {"keys": KEYS}
+        assert res.headers["etag"] == etag
+        assert jwks_route.call_count == 1
+
+        res = app.get("/auth/jwt/jwks.json", headers={"If-None-Match": etag})
+        assert res.status_code == 304
+        assert res.content == b""
+        assert res.headers["access-control-allow-origin"] == "*"
+
+        res = app.get("/auth/jwt/jwks.json", headers={"If-None-Match": '"other"'})
+        assert res.status_code == 200
+        assert jwks_route.call_count == 1
+
+
+def test_jwks_response_is_not_cached_by_default(app: TestClient):
+    init(**get_st_init_args([session.init(), jwt.init()]))
+
+    with respx.mock(assert_all_called=False) as mocker:
+        jwks_route = mock_core(mocker)
+
+        for _ in range(2):
+            res = app.get("/auth/jwt/jwks.json")
+            assert res.status_code == 200
+            assert res.json() == {"keys": KEYS}
+            assert "etag" not in res.headers
+        assert jwks_route.call_count == 2
+
+
+@mark.asyncio
+async def test_jwks_refreshes_are_single_flight_and_reuse_unchanged_bodies():
+    cache = JWKSResponseCache()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return GetJWKSResult(
+            [JsonWebKey("RSA", "s-1", "abc", "AQAB", "RS256", "sig")], 0
+        )
+
+    first, second = await asyncio.gather(
+        cache.get_or_fetch(fetch), cache.get_or_fetch(fetch)
+    )
+    assert calls == 1
+    assert first is second
+
+    # expired straight away (max-age=0), but the keys didn't change
+    third = await cache.get_or_fetch(fetch)
+    assert calls == 2
+    assert third is not first
+    assert third.body == first.body
+    assert third.etag == first.etag
+
+
+@mark.asyncio
+async def test_jwks_etag_changes_with_any_key_field():
+    cache = JWKSResponseCache()
+    use = "sig"
+
+    async def fetch():
+        return GetJWKSResult([JsonWebKey("RSA", "s-1", "abc", "AQAB", "RS256", use)], 0)
+
+    first = await cache.get_or_fetch(fetch)
+    use = "enc"
+    second = await cache.get_or_fetch(fetch)
+    assert second.body != first.body
+    assert second.etag != first.etag
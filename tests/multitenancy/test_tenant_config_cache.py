@@ -0,0 +1,125 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from typing import Any, Dict
+
+import httpx
+import respx
+from pytest import mark, raises
+
+from supertokens_python import init
+from supertokens_python.recipe import multitenancy, session, thirdparty
+from supertokens_python.recipe.multitenancy.asyncio import (
+    create_or_update_tenant,
+    get_tenant,
+)
+from supertokens_python.recipe.multitenancy.interfaces import (
+    TenantConfigCreateOrUpdate,
+)
+from supertokens_python.recipe.thirdparty.providers.config_utils import (
+    merged_providers_cache,
+)
+from supertokens_python.recipe.thirdparty.recipe import ThirdPartyRecipe
+from tests.utils import (
+    get_st_init_args,
+    CORE_URL,
+    mock_core_api_version,
+    setup_function_without_core as setup_function,
+    teardown_function_without_core as teardown_function,
+)
+
+_ = setup_function
+_ = teardown_function
+
+pytestmark = mark.asyncio
+
+
+def get_tenant_response(tenant_id: str) -> Dict[str, Any]:
+    return {
+        "status": "OK",
+        "tenantId": tenant_id,
+        "thirdParty": {
+            "providers": [
+                {
+                    "thirdPartyId": "custom",
+                    "name": "Custom",
+                    "clients": [{"clientId": "client-id"}],
+                    "authorizationEndpoint": "https://example.com/auth",
+                    "tokenEndpoint": "https://example.com/token",
+                }
+            ]
+        },
+        "coreConfig": {},
+        "firstFactors": None,
+        "requiredSecondaryFactors": None,
+    }
+
+
+def mock_core(mocker: respx.MockRouter):
+    mock_core_api_version(mocker)
+    return mocker.get(f"{CORE_URL}/t1/recipe/multitenancy/tenant/v2").mock(
+        return_value=httpx.Response(200, json=get_tenant_response("t1"))
+    )
+
+
+async def test_tenant_config_is_cached_until_the_tenant_is_updated():
+    init(
+        **get_st_init_args(
+            [
+                session.init(),
+                thirdparty.init(),
+                multitenancy.init(tenant_config_cache_ttl_sec=60),
+            ]
+        )
+    )
+
+    with respx.mock(assert_all_mocked=False) as mocker:
+        get_route = mock_core(mocker)
+        mocker.put(f"{CORE_URL}/recipe/multitenancy/tenant/v2").mock(
+            return_value=httpx.Response(200, json={"status": "OK", "createdNew": False})
+        )
+
+        tenant = await get_tenant("t1")
+        assert tenant is not None and tenant.tenant_id == "t1"
+        assert await get_tenant("t1") is tenant
+
+        recipe_implementation = ThirdPartyRecipe.get_instance().recipe_implementation
+        provider = await recipe_implementation.get_provider("custom", None, "t1", {})
+        assert provider is not None and provider.id == "custom"
+        merged_providers = merged_providers_cache[tenant][2]
+        await recipe_implementation.get_provider("custom", None, "t1", {})
+        assert merged_providers_cache[tenant][2] is merged_providers
+        assert get_route.call_count == 1
+
+        await create_or_update_tenant("t1", TenantConfigCreateOrUpdate())
+        await get_tenant("t1")
+        assert get_route.call_count == 2
+
+
+async def test_tenant_config_is_not_cached_by_default():
+    init(**get_st_init_args([session.init(), multitenancy.init()]))
+
+    with respx.mock(assert_all_mocked=False) as mocker:
+        get_route = mock_core(mocker)
+        await get_tenant("t1")
+        await get_tenant("t1")
+        assert get_route.call_count == 2
+
+
+def test_tenant_config_cache_ttl_must_be_positive():
+    with raises(ValueError):
+        init(
+            **get_st_init_args(
+                [session.init(), multitenancy.init(tenant_config_cache_ttl_sec=0)]
+            )
+        )
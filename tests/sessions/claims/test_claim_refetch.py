@@ -0,0 +1,173 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+from typing import Any, Dict, Optional
+
+from pytest import mark, raises
+
+from supertokens_python import init
+from supertokens_python.recipe import session
+from supertokens_python.recipe.session.claims import PrimitiveClaim
+from supertokens_python.recipe.session.recipe import SessionRecipe
+from supertokens_python.recipe.session.recipe_implementation import RecipeImplementation
+from supertokens_python.types import RecipeUserId
+from supertokens_python.utils import get_timestamp_ms
+from tests.utils import get_st_init_args, reset
+
+pytestmark = mark.asyncio
+
+fetch_count = 0
+
+
+async def fetch_value(*_: Any) -> Optional[str]:
+    global fetch_count
+    fetch_count += 1
+    await asyncio.sleep(0.01)
+    return f"value-{fetch_count}"
+
+
+SlowClaim = PrimitiveClaim("st-slow", fetch_value, 300)
+
+
+def setup_function(_: Any):
+    global fetch_count
+    fetch_count = 0
+    reset(stop_core=False)
+
+
+def teardown_function(_: Any):
+    reset(stop_core=False)
+
+
+def get_recipe_implementation() -> RecipeImplementation:
+    recipe_implementation = SessionRecipe.get_instance().recipe_implementation
+    assert isinstance(recipe_implementation, RecipeImplementation)
+    return recipe_implementation
+
+
+async def validate(payload: Dict[str, Any]):
+    return await get_recipe_implementation().validate_claims(
+        "user1",
+        RecipeUserId("user1"),
+        payload,
+        [SlowClaim.validators.has_value("value-1")],
+        {},
+    )
+
+
+async def test_concurrent_refetches_of_a_session_are_coalesced():
+    init(**get_st_init_args([session.init()]))  # type: ignore
+
+    results = await asyncio.gather(
+        validate({"sessionHandle": "handle1"}),
+        validate({"sessionHandle": "handle1"}),
+        validate({"sessionHandle": "handle1"}),
+    )
+    assert fetch_count == 1
+    for result in results:
+        assert result.invalid_claims == []
+        assert result.access_token_payload_update is not None
+        assert result.access_token_payload_update["st-slow"]["v"] == "value-1"
+
+    await validate({"sessionHandle": "handle2"})
+    assert fetch_count == 2
+
+
+async def test_soft_expired_claims_are_refetched_in_the_background():
+    init(
+        **get_st_init_args(
+            [session.init(claim_refetch_soft_expiry_threshold=0.5)]
+        )  # type: ignore
+    )
+    payload: Dict[str, Any] = {
+        "sessionHandle": "handle1",
+        "st-slow": {"v": "value-1", "t": get_timestamp_ms() - 200 * 1000},
+    }
+
+    result = await validate(dict(payload))
+    assert result.invalid_claims == []
+    assert result.access_token_payload_update is None
+
+    # the request didn't wait for the fetch
+    assert fetch_count == 0
+    refetcher = get_recipe_implementation().claim_refetcher
+    await asyncio.gather(*refetcher.in_flight[asyncio.get_running_loop()].values())
+    assert fetch_count == 1
+
+    applied_at = get_timestamp_ms()
+    result = await validate(dict(payload))
+    assert fetch_count == 1
+    assert result.access_token_payload_update is not None
+    assert result.access_token_payload_update["st-slow"]["v"] == "value-1"
+    # the value keeps the time it was fetched at, not the time it was applied
+    fetched_at = result.access_token_payload_update["st-slow"]["t"]
+    assert payload["st-slow"]["t"] < fetched_at <= applied_at
+
+
+async def test_expired_claims_are_not_served_from_background_fetches():
+    init(
+        **get_st_init_args(
+            [session.init(claim_refetch_soft_expiry_threshold=0.5)]
+        )  # type: ignore
+    )
+    refetcher = get_recipe_implementation().claim_refetcher
+    refetcher.fetch_in_background(("handle1", SlowClaim.key), fetch_value)
+    await asyncio.gather(*refetcher.in_flight[asyncio.get_running_loop()].values())
+    assert fetch_count == 1
+
+    # the claim has expired, so it's fetched again rather than using "value-1"
+    payload: Dict[str, Any] = {
+        "sessionHandle": "handle1",
+        "st-slow": {"v": "value-0", "t": get_timestamp_ms() - 400 * 1000},
+    }
+    result = await validate(payload)
+    assert fetch_count == 2
+    assert result.access_token_payload_update is not None
+    assert result.access_token_payload_update["st-slow"]["v"] == "value-2"
+    assert refetcher.pop_prefetched(("handle1", SlowClaim.key)) is None
+
+
+async def test_background_fetches_older_than_the_max_age_are_dropped():
+    init(**get_st_init_args([session.init()]))  # type: ignore
+    refetcher = get_recipe_implementation().claim_refetcher
+    refetcher.fetch_in_background(("handle1", SlowClaim.key), fetch_value)
+    await asyncio.gather(*refetcher.in_flight[asyncio.get_running_loop()].values())
+    await asyncio.sleep(1.1)
+
+    assert refetcher.pop_prefetched(("handle1", SlowClaim.key), 1) is None
+
+
+async def test_claims_are_not_refetched_before_the_soft_threshold():
+    init(
+        **get_st_init_args(
+            [session.init(claim_refetch_soft_expiry_threshold=0.8)]
+        )  # type: ignore
+    )
+    payload: Dict[str, Any] = {
+        "sessionHandle": "handle1",
+        "st-slow": {"v": "value-1", "t": get_timestamp_ms() - 200 * 1000},
+    }
+
+    result = await validate(payload)
+    assert result.access_token_payload_update is None
+    assert fetch_count == 0
+
+
+def test_soft_expiry_threshold_is_validated():
+    with raises(ValueError):
+        init(
+            **get_st_init_args(
+                [session.init(claim_refetch_soft_expiry_threshold=1.5)]
+            )  # type: ignore
+        )
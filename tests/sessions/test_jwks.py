@@ -1,11 +1,14 @@
+import asyncio
 import time
 import pytest
 import logging
 import threading
 import json
+import httpx
 import requests
+import respx
 
-from typing import List, Any, Callable
+from typing import List, Any, Callable, Dict
 
 from supertokens_python import init, SupertokensConfig
 from supertokens_python.recipe import session
@@ -30,13 +33,16 @@ from tests.utils import (
 from supertokens_python.recipe.session.jwks import (
     reset_jwks_cache,
     JWKSConfig,
-    get_cached_keys,
+    find_matching_cached_keys,
     get_latest_keys,
+    get_latest_keys_async,
 )
 from supertokens_python.utils import utf_base64encode
 from tests.utils import min_api_version
 
 from _pytest.logging import LogCaptureFixture
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
 
 pytestmark = pytest.mark.asyncio
 _ = setup_function  # type:ignore
@@ -269,7 +275,7 @@ async def test_jwks_cache_logic(caplog: LogCaptureFixture):
         "public", RecipeUserId("userId"), {}, {}
     )
 
-    assert get_cached_keys() is None
+    assert find_matching_cached_keys(None) is None
     assert next(jwks_refresh_count) == 0
 
     tokens = s.get_all_session_tokens_dangerously()
@@ -277,23 +283,23 @@ async def test_jwks_cache_logic(caplog: LogCaptureFixture):
         tokens.get("accessToken"), tokens.get("antiCsrfToken")
     )
 
-    assert get_cached_keys() is not None
+    assert find_matching_cached_keys(None) is not None
     assert next(jwks_refresh_count) == 1
 
     await get_session_without_request_response(
         tokens.get("accessToken"), tokens.get("antiCsrfToken")
     )
-    assert get_cached_keys() is not None
+    assert find_matching_cached_keys(None) is not None
     assert next(jwks_refresh_count) == 1  # used cache value
 
     time.sleep(3)  # Now it should expire and the next call should trigger a refresh
-    assert get_cached_keys() is None
+    assert find_matching_cached_keys(None) is None
     assert next(jwks_refresh_count) == 1
 
     await get_session_without_request_response(
         tokens.get("accessToken"), tokens.get("antiCsrfToken")
     )
-    assert get_cached_keys() is not None
+    assert find_matching_cached_keys(None) is not None
     assert next(jwks_refresh_count) == 2
 
     JWKSConfig.update(original_jwks_config)
@@ -395,7 +401,7 @@ async def test_that_jwks_returns_from_cache_correctly(caplog: LogCaptureFixture)
     s = await create_new_session_without_request_response(
         "public", RecipeUserId("userId"), {}, {}
     )
-    assert get_cached_keys() is None
+    assert find_matching_cached_keys(None) is None
     assert next(jwk_refresh_count) == 0
     assert next(returned_from_cache_count) == 0
 
@@ -578,6 +584,8 @@ async def test_that_locking_for_jwks_cache_works(caplog: LogCaptureFixture):
     )
 
     original_jwks_config = JWKSConfig.copy()
+    # This test counts the cache misses, so we turn off the background refresh
+    JWKSConfig["background_refresh_threshold"] = None
 
     set_key_value_in_config(
         "access_token_dynamic_signing_key_update_interval", "0.0014"
@@ -718,3 +726,251 @@ async def test_session_verification_of_jwt_with_dynamic_signing_key_mode_works_a
             str(e)
             == "The access token doesn't match the use_dynamic_access_token_signing_key setting"
         )
+
+
+def get_fake_jwks(kid: str) -> Dict[str, Any]:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    return {"keys": [{**jwk, "kid": kid, "alg": "RS256", "use": "sig"}]}
+
+
+async def test_that_concurrent_async_jwks_fetches_are_deduplicated():
+    init(**get_st_init_args(recipe_list=[session.init()]))
+
+    with respx.mock() as mocker:
+
+        async def delayed_response(_: httpx.Request):
+            await asyncio.sleep(0.2)
+            return httpx.Response(200, json=get_fake_jwks("s-1"))
+
+        route = mocker.get("http://localhost:3567/.well-known/jwks.json").mock(
+            side_effect=delayed_response
+        )
+
+        results = await asyncio.gather(
+            *[
+                get_latest_keys_async(SessionRecipe.get_instance().config, "s-1")
+                for _ in range(10)
+            ]
+        )
+
+        assert route.call_count == 1
+        assert all(r[0].key_id == "s-1" for r in results)  # type: ignore
+
+
+async def test_that_async_jwks_are_refreshed_in_the_background():
+    original_jwks_config = JWKSConfig.copy()
+    JWKSConfig["background_refresh_threshold"] = 0.5
+    init(**get_st_init_args(recipe_list=[session.init(jwks_refresh_interval_sec=2)]))
+
+    try:
+        with respx.mock() as mocker:
+            route = mocker.get("http://localhost:3567/.well-known/jwks.json").mock(
+                side_effect=[
+                    httpx.Response(200, json=get_fake_jwks("s-1")),
+                    httpx.Response(200, json=get_fake_jwks("s-2")),
+                ]
+            )
+            config = SessionRecipe.get_instance().config
+
+            await get_latest_keys_async(config)
+            assert route.call_count == 1
+
+            await asyncio.sleep(1.1)
+
+            # This is served from the cache, but kicks off a refresh
+            keys = await get_latest_keys_async(config)
+            assert keys[0].key_id == "s-1"  # type: ignore
+
+            await asyncio.sleep(0.1)
+            assert route.call_count == 2
+
+            keys = await get_latest_keys_async(config)
+            assert keys[0].key_id == "s-2"  # type: ignore
+            assert route.call_count == 2
+    finally:
+        JWKSConfig.update(original_jwks_config)
+
+
+async def test_that_stale_async_jwks_are_served_if_core_is_unreachable():
+    init(**get_st_init_args(recipe_list=[session.init(jwks_refresh_interval_sec=1)]))
+
+    with respx.mock() as mocker:
+        route = mocker.get("http://localhost:3567/.well-known/jwks.json").mock(
+            side_effect=[
+                httpx.Response(200, json=get_fake_jwks("s-1")),
+                httpx.ConnectError("core is down"),
+                httpx.ConnectError("core is down"),
+            ]
+        )
+        config = SessionRecipe.get_instance().config
+
+        await get_latest_keys_async(config, "s-1")
+        await asyncio.sleep(1.1)
+        assert find_matching_cached_keys(None) is None
+
+        keys = await get_latest_keys_async(config, "s-1")
+        assert keys[0].key_id == "s-1"  # type: ignore
+        assert route.call_count == 2
+
+        # Stale keys don't help with a kid we've never seen
+        with pytest.raises(httpx.ConnectError):
+            await get_latest_keys_async(config, "s-2")
+
+
+async def test_that_stale_async_jwks_are_served_without_waiting_for_a_fetch():
+    original_jwks_config = JWKSConfig.copy()
+    JWKSConfig["background_refresh_threshold"] = None
+    JWKSConfig["refresh_backoff_ms"] = 500
+    init(**get_st_init_args(recipe_list=[session.init(jwks_refresh_interval_sec=1)]))
+
+    try:
+        with respx.mock() as mocker:
+
+            async def slow_response(_: httpx.Request):
+                await asyncio.sleep(0.2)
+                return httpx.Response(200, json=get_fake_jwks("s-1"))
+
+            route = mocker.get("http://localhost:3567/.well-known/jwks.json").mock(
+                side_effect=[
+                    httpx.Response(200, json=get_fake_jwks("s-1")),
+                    httpx.ConnectError("core is down"),
+                    slow_response,
+                ]
+            )
+            config = SessionRecipe.get_instance().config
+
+            await get_latest_keys_async(config, "s-1")
+            await asyncio.sleep(1.1)
+
+            # the fetch fails, so the stale keys are served
+            await get_latest_keys_async(config, "s-1")
+            assert route.call_count == 2
+
+            # and the core isn't tried again until the backoff is over
+            start = time.time()
+            keys = await get_latest_keys_async(config, "s-1")
+            assert keys[0].key_id == "s-1"  # type: ignore
+            assert route.call_count == 2
+            assert time.time() - start < 0.1
+
+            await asyncio.sleep(0.6)
+
+            # one request waits for the fetch, the others get the stale keys
+            start = time.time()
+            fetching = asyncio.ensure_future(get_latest_keys_async(config, "s-1"))
+            await asyncio.sleep(0)
+            keys = await get_latest_keys_async(config, "s-1")
+            assert keys[0].key_id == "s-1"  # type: ignore
+            assert time.time() - start < 0.1
+
+            await fetching
+            assert route.call_count == 3
+            assert find_matching_cached_keys(None) is not None
+    finally:
+        JWKSConfig.update(original_jwks_config)
+
+
+def test_cached_keys_are_indexed_by_kid():
+    from jwt import PyJWKSet
+    from supertokens_python.recipe.session.jwks import CachedKeys
+
+    jwks = {"keys": get_fake_jwks("s-1")["keys"] + get_fake_jwks("d-2")["keys"]}
+    cached = CachedKeys(PyJWKSet.from_dict(jwks).keys, 60)  # type: ignore
+
+    matching = cached.find_matching_keys("d-2")
+    assert matching is not None and matching[0].key_id == "d-2"  # type: ignore
+    assert cached.find_matching_keys("unknown") is None
+    assert cached.find_matching_keys(None) == cached.keys
+
+
+async def test_access_token_signature_is_verified_over_raw_segments():
+    import jwt
+    from jwt import PyJWK
+    from jwt.exceptions import InvalidSignatureError
+    from supertokens_python.recipe.session.access_token import (
+        verify_access_token_signature,
+    )
+    from supertokens_python.recipe.session.jwt import (
+        parse_jwt_without_signature_verification,
+    )
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = PyJWK.from_dict(
+        {
+            **json.loads(RSAAlgorithm.to_jwk(private_key.public_key())),
+            "kid": "d-1",
+            "alg": "RS256",
+        }
+    )
+    token = jwt.encode(
+        {"sub": "user"},
+        private_key,  # type: ignore
+        algorithm="RS256",
+        headers={"kid": "d-1", "version": "5"},
+    )
+
+    verify_access_token_signature(
+        parse_jwt_without_signature_verification(token), jwk, "RS256"
+    )
+
+    header, _, signature = token.split(".")
+    tampered_payload = utf_base64encode(json.dumps({"sub": "admin"}), urlsafe=True)
+    tampered = ".".join([header, tampered_payload, signature])
+    with pytest.raises(InvalidSignatureError):
+        verify_access_token_signature(
+            parse_jwt_without_signature_verification(tampered), jwk, "RS256"
+        )
+
+
+async def test_access_tokens_with_other_algorithms_or_keys_are_rejected():
+    import jwt
+    from jwt import PyJWK
+    from jwt.algorithms import ECAlgorithm
+    from jwt.exceptions import InvalidAlgorithmError, InvalidKeyError
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from supertokens_python.recipe.session.access_token import (
+        verify_access_token_signature,
+    )
+    from supertokens_python.recipe.session.jwt import (
+        parse_jwt_without_signature_verification,
+    )
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = PyJWK.from_dict(
+        {
+            **json.loads(RSAAlgorithm.to_jwk(private_key.public_key())),
+            "kid": "d-1",
+            "alg": "RS256",
+        }
+    )
+    token = parse_jwt_without_signature_verification(
+        jwt.encode(
+            {"sub": "user"},
+            private_key,  # type: ignore
+            algorithm="RS256",
+            headers={"kid": "d-1", "version": "5"},
+        )
+    )
+    for algorithm in ["HS256", "ES256", "none"]:
+        with pytest.raises(InvalidAlgorithmError):
+            verify_access_token_signature(token, jwk, algorithm)
+
+    ec_private_key = ec.generate_private_key(ec.SECP256R1())
+    ec_jwk = PyJWK.from_dict(
+        {
+            **json.loads(ECAlgorithm.to_jwk(ec_private_key.public_key())),
+            "kid": "e-1",
+            "alg": "ES256",
+        }
+    )
+    ec_token = parse_jwt_without_signature_verification(
+        jwt.encode(
+            {"sub": "user"},
+            ec_private_key,  # type: ignore
+            algorithm="ES256",
+            headers={"kid": "e-1", "version": "5"},
+        )
+    )
+    with pytest.raises(InvalidKeyError):
+        verify_access_token_signature(ec_token, ec_jwk, "ES256")
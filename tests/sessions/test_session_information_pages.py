@@ -0,0 +1,112 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+from typing import List
+
+import httpx
+import respx
+from pytest import mark, raises
+
+from supertokens_python import init
+from supertokens_python.recipe import session
+from supertokens_python.recipe.session.asyncio import (
+    get_session_information_pages,
+    get_sessions_information,
+)
+from tests.utils import (
+    get_st_init_args,
+    CORE_URL,
+    mock_core_api_version,
+    setup_function_without_core as setup_function,
+    teardown_function_without_core as teardown_function,
+)
+
+_ = setup_function
+_ = teardown_function
+
+pytestmark = mark.asyncio
+
+
+def mock_core(mocker: respx.MockRouter):
+    state = {"running": 0, "max_running": 0}
+
+    async def session_information(request: httpx.Request):
+        state["running"] += 1
+        state["max_running"] = max(state["max_running"], state["running"])
+        await asyncio.sleep(0.01)
+        state["running"] -= 1
+        handle = request.url.params["sessionHandle"]
+        if handle == "revoked":
+            return httpx.Response(200, json={"status": "UNAUTHORISED"})
+        if handle == "broken":
+            return httpx.Response(500, text="error")
+        return httpx.Response(
+            200,
+            json={
+                "status": "OK",
+                "sessionHandle": handle,
+                "userId": "user1",
+                "recipeUserId": "user1",
+                "userDataInDatabase": {},
+                "expiry": 0,
+                "userDataInJWT": {},
+                "timeCreated": 0,
+                "tenantId": "public",
+            },
+        )
+
+    mock_core_api_version(mocker)
+    route = mocker.get(f"{CORE_URL}/recipe/session").mock(
+        side_effect=session_information
+    )
+    return route, state
+
+
+async def test_session_information_is_paged_with_bounded_concurrency():
+    init(**get_st_init_args([session.init()]))  # type: ignore
+
+    with respx.mock(assert_all_called=False) as mocker:
+        route, state = mock_core(mocker)
+        handles = [f"handle{i}" for i in range(25)]
+
+        pages: List[List[str]] = []
+        async for page in get_session_information_pages(
+            handles, page_size=10, max_concurrency=4
+        ):
+            pages.append([s.session_handle for s in page])
+
+        assert [len(page) for page in pages] == [10, 10, 5]
+        assert sum(pages, []) == handles
+        assert route.call_count == 25
+        assert state["max_running"] == 4
+
+
+async def test_missing_sessions_are_left_out():
+    init(**get_st_init_args([session.init()]))  # type: ignore
+
+    with respx.mock(assert_all_called=False) as mocker:
+        mock_core(mocker)
+
+        sessions = await get_sessions_information(["handle1", "revoked"])
+        assert [s.session_handle for s in sessions] == ["handle1"]
+
+
+async def test_core_errors_are_raised():
+    init(**get_st_init_args([session.init()]))  # type: ignore
+
+    with respx.mock(assert_all_called=False) as mocker:
+        mock_core(mocker)
+
+        with raises(Exception):
+            await get_sessions_information(["handle1", "broken"])
@@ -0,0 +1,144 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import json
+import time
+from typing import Any, Dict, Tuple
+
+import httpx
+import jwt
+import respx
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+from pytest import mark, raises
+
+from supertokens_python import init
+from supertokens_python.recipe import session
+from supertokens_python.recipe.session.access_token import get_info_from_access_token
+from supertokens_python.recipe.session.access_token_cache import (
+    VerifiedAccessTokenCache,
+)
+from supertokens_python.recipe.session.exceptions import TryRefreshTokenError
+from supertokens_python.recipe.session.jwks import reset_jwks_cache
+from supertokens_python.recipe.session.jwt import (
+    parse_jwt_without_signature_verification,
+)
+from supertokens_python.recipe.session.recipe import SessionRecipe
+from supertokens_python.utils import get_timestamp_ms
+from tests.utils import get_st_init_args, reset
+
+
+def setup_function(_: Any):
+    reset(stop_core=False)
+    reset_jwks_cache()
+
+
+def teardown_function(_: Any):
+    reset(stop_core=False)
+    reset_jwks_cache()
+
+
+def test_entries_are_evicted_in_lru_order():
+    cache = VerifiedAccessTokenCache(2)
+    expiry = get_timestamp_ms() + 60_000
+    cache.add("t1", {"a": 1}, "k", "s1", expiry)
+    cache.add("t2", {"a": 2}, "k", "s2", expiry)
+    assert cache.get("t1") is not None
+    cache.add("t3", {"a": 3}, "k", "s3", expiry)
+
+    assert cache.get("t2") is None
+    assert cache.get("t1") is not None
+    assert cache.get("t3") is not None
+    assert len(cache) == 2
+    assert cache.hits == 3
+    assert cache.misses == 1
+
+
+def test_expired_and_revoked_entries_are_not_returned():
+    cache = VerifiedAccessTokenCache(10)
+    cache.add("t1", {}, "k", "s1", get_timestamp_ms() - 1)
+    cache.add("t2", {}, "k", "s2", get_timestamp_ms() + 60_000)
+    cache.add("t3", {}, "k", "s3", get_timestamp_ms() + 60_000)
+
+    assert cache.get("t1") is None
+    cache.remove_sessions({"s2"})
+    assert cache.get("t2") is None
+    assert cache.get("t3") is not None
+    assert cache.get("t3", lambda entry: entry.kid != "k") is None
+    assert len(cache) == 0
+
+
+def test_invalid_cache_size_throws():
+    with raises(ValueError):
+        init(**get_st_init_args([session.init(verified_access_token_cache_size=0)]))
+
+
+def create_access_token(kid: str) -> Tuple[str, Dict[str, Any]]:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    now = int(time.time())
+    token = jwt.encode(
+        {
+            "sub": "user-id",
+            "rsub": "user-id",
+            "exp": now + 3600,
+            "iat": now,
+            "sessionHandle": "session-handle",
+            "refreshTokenHash1": "hash",
+            "parentRefreshTokenHash1": None,
+            "antiCsrfToken": None,
+            "tId": "public",
+        },
+        private_key,  # type: ignore
+        algorithm="RS256",
+        headers={"kid": kid, "version": "5"},
+    )
+    return token, {"keys": [{**jwk, "kid": kid, "alg": "RS256", "use": "sig"}]}
+
+
+@mark.asyncio
+async def test_verified_access_tokens_are_served_from_cache():
+    init(**get_st_init_args([session.init(verified_access_token_cache_size=100)]))
+    recipe_implementation = SessionRecipe.get_instance().recipe_implementation
+    cache = recipe_implementation.verified_access_token_cache  # type: ignore
+    assert cache is not None
+    config = SessionRecipe.get_instance().config
+
+    token, jwks = create_access_token("d-1")
+    parsed = parse_jwt_without_signature_verification(token)
+
+    with respx.mock() as mocker:
+        mocker.get("http://localhost:3567/.well-known/jwks.json").mock(
+            httpx.Response(200, json=jwks)
+        )
+
+        first = await get_info_from_access_token(config, parsed, False, cache)
+        assert (cache.hits, cache.misses) == (0, 1)
+
+        second = await get_info_from_access_token(config, parsed, False, cache)
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert first == second
+        assert second["userId"] == "user-id"
+
+        # Rotating the keys means that the token has to be verified again
+        reset_jwks_cache()
+        await get_info_from_access_token(config, parsed, False, cache)
+        assert (cache.hits, cache.misses) == (1, 2)
+
+        # A token with a tampered signature is never served from the cache
+        header, payload, _ = token.split(".")
+        tampered = parse_jwt_without_signature_verification(
+            ".".join([header, payload, "invalid"])
+        )
+        with raises(TryRefreshTokenError):
+            await get_info_from_access_token(config, tampered, False, cache)
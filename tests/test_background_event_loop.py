@@ -0,0 +1,108 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+import threading
+from typing import Any, List
+
+from pytest import raises
+
+from supertokens_python.async_to_sync_wrapper import (
+    reset_background_event_loop,
+    sync,
+    use_background_event_loop,
+)
+
+
+def teardown_function(_: Any):
+    reset_background_event_loop()
+
+
+async def get_running_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+def test_all_threads_share_the_background_event_loop():
+    use_background_event_loop()
+    loops: List[asyncio.AbstractEventLoop] = []
+
+    def run():
+        loops.append(sync(get_running_loop()))
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(loops) == 4
+    assert all(loop is loops[0] for loop in loops)
+    assert sync(get_running_loop()) is loops[0]
+
+
+def test_without_the_background_event_loop_each_thread_has_its_own_loop():
+    loops: List[asyncio.AbstractEventLoop] = []
+
+    def run():
+        loops.append(sync(get_running_loop()))
+
+    threads = [threading.Thread(target=run) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert loops[0] is not loops[1]
+
+
+def test_requests_time_out():
+    use_background_event_loop(timeout_sec=0.1)
+
+    with raises(TimeoutError):
+        sync(asyncio.sleep(1))
+
+    assert sync(asyncio.sleep(0, result="done")) == "done"
+
+
+def test_in_flight_requests_are_bounded():
+    use_background_event_loop(max_in_flight=1, timeout_sec=0.2)
+    started = threading.Event()
+
+    async def slow():
+        started.set()
+        await asyncio.sleep(0.15)
+
+    t = threading.Thread(target=lambda: sync(slow()))
+    t.start()
+    started.wait()
+
+    with raises(TimeoutError):
+        # The only slot is taken and sleep(1) would not finish within the timeout anyway
+        sync(asyncio.sleep(1))
+    t.join()
+
+
+def test_sync_from_the_background_loop_does_not_deadlock():
+    use_background_event_loop(timeout_sec=1)
+
+    async def nested():
+        # This behaves like calling sync from inside any other running loop: it
+        # either raises or (with nest_asyncio) runs, but never waits on itself.
+        co = asyncio.sleep(0)
+        try:
+            sync(co)
+        except RuntimeError:
+            co.close()
+        return "done"
+
+    assert sync(nested()) == "done"
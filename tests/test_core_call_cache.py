@@ -0,0 +1,268 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import gzip
+import json
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+import respx
+from pytest import mark, raises
+
+from supertokens_python import (
+    CoreCallCacheBackend,
+    CoreCallCachePathConfig,
+    SharedCoreCallCacheConfig,
+    SupertokensConfig,
+    init,
+)
+from supertokens_python.core_call_cache import (
+    CoreCallCacheTagVersions,
+    InMemoryCoreCallCacheBackend,
+    SharedCoreCallCache,
+    get_read_tags,
+    get_response_tags,
+    get_write_tags,
+)
+from supertokens_python.querier import Querier
+from supertokens_python.recipe import session, usermetadata
+from supertokens_python.recipe.usermetadata.asyncio import (
+    get_user_metadata,
+    update_user_metadata,
+)
+from tests.utils import (
+    get_st_init_args,
+    CORE_URL,
+    mock_core_api_version,
+    setup_function_without_core as setup_function,
+    teardown_function_without_core as teardown_function,
+)
+
+_ = setup_function
+_ = teardown_function
+
+
+def mock_core(mocker: respx.MockRouter):
+    mock_core_api_version(mocker)
+    mocker.put(f"{CORE_URL}/recipe/user/metadata").mock(
+        return_value=httpx.Response(200, json={"status": "OK", "metadata": {}})
+    )
+    return mocker.get(f"{CORE_URL}/recipe/user/metadata").mock(
+        return_value=httpx.Response(200, json={"status": "OK", "metadata": {}})
+    )
+
+
+def test_read_tags():
+    assert get_read_tags("/recipe/user/metadata", {"userId": "u1"}) == {
+        "usermetadata",
+        "usermetadata|user:u1",
+        "usermetadata|session:*",
+        "usermetadata|tenant:*",
+    }
+    assert "userroles|tenant:t1" in get_read_tags(
+        "/appid-a1/t1/recipe/user/roles", {"userId": "u1"}
+    )
+    assert "users|user:*" in get_read_tags("/public/users", {})
+    assert get_read_tags("/recipe/jwt/data", {}) == set()
+
+
+def test_write_tags():
+    assert get_write_tags("/recipe/user/metadata", {"userId": "u1"}) == {
+        "usermetadata|user:u1",
+        "usermetadata|user:*",
+    }
+    # not scoped to a resource, so the whole family is invalidated
+    assert get_write_tags("/public/recipe/signup", {"email": "a@b.com"}) == {"users"}
+    assert get_write_tags("/public/recipe/signin", {"email": "a@b.com"}) == set()
+    # a user write affects what every family returns for that user
+    tags = get_write_tags("/user/remove", {"userId": "u1"})
+    assert tags is not None
+    assert {"users|user:u1", "userroles|user:u1", "session|user:u1"} <= tags
+    assert get_write_tags("/recipe/userid/map", {"superTokensUserId": "u1"}) is None
+    # verifying an email changes the login methods of the user
+    tags = get_write_tags("/recipe/user/email/verify", {"recipeUserId": "u1"})
+    assert tags is not None
+    assert "users|user:u1" in tags
+
+
+def test_response_tags():
+    body = '{"status": "OK", "user": {"id": "u1", "loginMethods": [{"recipeUserId": "u1"}, {"recipeUserId": "u2"}]}}'
+    assert get_response_tags("/user/id", body) == {"users|user:u1", "users|user:u2"}
+    assert get_response_tags("/recipe/user/metadata", body) == set()
+    assert get_response_tags("/user/id", '{"status": "UNKNOWN_USER_ID_ERROR"}') == set()
+
+
+@mark.asyncio
+async def test_write_only_invalidates_the_affected_responses():
+    init(**get_st_init_args([session.init(), usermetadata.init()]))  # type: ignore
+
+    with respx.mock(assert_all_called=False) as mocker:
+        get_route = mock_core(mocker)
+        user_context: Dict[str, Any] = {}
+
+        await get_user_metadata("u1", user_context)
+        await get_user_metadata("u2", user_context)
+        await get_user_metadata("u1", user_context)
+        assert get_route.call_count == 2
+
+        # a write by another request only invalidates the metadata of u1
+        await update_user_metadata("u1", {"a": 1})
+        await get_user_metadata("u2", user_context)
+        assert get_route.call_count == 2
+        await get_user_metadata("u1", user_context)
+        assert get_route.call_count == 3
+
+        # writes to paths without a family still invalidate everything
+        Querier.get_instance().invalidate_core_call_cache(None)
+        await get_user_metadata("u2", user_context)
+        assert get_route.call_count == 4
+
+        assert Querier.get_core_call_cache_metrics() == {
+            "hits": 2,
+            "misses": 4,
+            "invalidations": 2,
+        }
+
+
+@mark.asyncio
+async def test_keep_cache_alive_only_invalidates_own_responses():
+    init(**get_st_init_args([session.init(), usermetadata.init()]))  # type: ignore
+
+    with respx.mock(assert_all_called=False) as mocker:
+        get_route = mock_core(mocker)
+        user_context: Dict[str, Any] = {"_default": {"keep_cache_alive": True}}
+        user_context_2: Dict[str, Any] = {}
+
+        await get_user_metadata("u1", user_context)
+        await get_user_metadata("u1", user_context_2)
+        await update_user_metadata("u1", {"a": 1}, user_context)
+
+        await get_user_metadata("u1", user_context_2)
+        assert get_route.call_count == 2
+        await get_user_metadata("u1", user_context)
+        assert get_route.call_count == 3
+
+
+class FakeRemoteBackend(CoreCallCacheBackend):
+    def __init__(self):
+        self.values: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    async def get(self, path: str, key: str) -> Optional[Dict[str, Any]]:
+        return self.values.get((path, key))
+
+    async def set(
+        self,
+        path: str,
+        key: str,
+        value: Dict[str, Any],
+        ttl_sec: int,
+        max_size: int,
+    ) -> None:
+        self.values[(path, key)] = value
+
+    async def clear(self) -> None:
+        self.values.clear()
+
+
+def init_with_shared_cache(backend: Optional[CoreCallCacheBackend] = None):
+    init(
+        **{
+            **get_st_init_args([session.init(), usermetadata.init()]),
+            "supertokens_config": SupertokensConfig(
+                CORE_URL,
+                shared_core_call_cache=SharedCoreCallCacheConfig(
+                    {"/recipe/user/metadata": CoreCallCachePathConfig(ttl_sec=60)},
+                    backend,
+                ),
+            ),
+        }
+    )
+
+
+@mark.asyncio
+async def test_shared_cache_is_used_across_requests():
+    backend = FakeRemoteBackend()
+    init_with_shared_cache(backend)
+
+    with respx.mock(assert_all_called=False) as mocker:
+        get_route = mock_core(mocker)
+
+        result = await get_user_metadata("u1", {})
+        assert (await get_user_metadata("u1", {})).metadata == result.metadata
+        await get_user_metadata("u1")
+        assert get_route.call_count == 1
+        assert len(backend.values) == 1
+        # the key is hashed, so the API key in the headers is not stored
+        assert all(len(key) == 64 for _, key in backend.values)
+
+        await get_user_metadata("u2", {})
+        assert get_route.call_count == 2
+
+        await update_user_metadata("u1", {"a": 1})
+        await get_user_metadata("u1", {})
+        await get_user_metadata("u2", {})
+        assert get_route.call_count == 3
+
+        metrics = Querier.get_core_call_cache_metrics()
+        assert metrics["shared_hits"] == 3
+        assert metrics["shared_misses"] == 3
+
+
+@mark.asyncio
+async def test_shared_cache_serves_compressed_responses_decoded():
+    cache = SharedCoreCallCache(
+        SharedCoreCallCacheConfig(
+            {"/recipe/user/metadata": CoreCallCachePathConfig(ttl_sec=60)}
+        )
+    )
+    body = gzip.compress(json.dumps({"status": "OK", "metadata": {}}).encode())
+    response = httpx.Response(
+        200,
+        headers={
+            "content-type": "application/json",
+            "content-encoding": "gzip",
+            "content-length": str(len(body)),
+        },
+        content=body,
+    )
+    await cache.set("/recipe/user/metadata", "k", response, 1)
+
+    cached = await cache.get(
+        "/recipe/user/metadata", "k", set(), CoreCallCacheTagVersions()
+    )
+    assert cached is not None
+    assert cached.json() == {"status": "OK", "metadata": {}}
+    assert "content-encoding" not in cached.headers
+    assert cached.headers["content-type"] == "application/json"
+
+
+@mark.asyncio
+async def test_in_memory_backend_evicts_least_recently_used_per_path():
+    backend = InMemoryCoreCallCacheBackend()
+    await backend.set("/a", "k1", {"v": 1}, 60, 2)
+    await backend.set("/a", "k2", {"v": 2}, 60, 2)
+    await backend.set("/b", "k1", {"v": 3}, 60, 2)
+    assert await backend.get("/a", "k1") == {"v": 1}
+    await backend.set("/a", "k3", {"v": 4}, 60, 2)
+
+    assert await backend.get("/a", "k2") is None
+    assert await backend.get("/a", "k1") == {"v": 1}
+    assert await backend.get("/b", "k1") == {"v": 3}
+
+    await backend.set("/a", "k4", {"v": 5}, 0, 2)
+    assert await backend.get("/a", "k4") is None
+
+
+def test_shared_cache_config_is_validated():
+    with raises(ValueError):
+        SharedCoreCallCacheConfig({"/recipe/roles": CoreCallCachePathConfig(0)})
@@ -0,0 +1,146 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from typing import Any, Dict, List, Optional
+
+import httpx
+import respx
+from fastapi import FastAPI
+from pytest import fixture, mark, raises
+
+from supertokens_python import (
+    CoreCallBudgetExceededError,
+    CoreCallRecord,
+    CoreCallTrace,
+    CoreCallTracingConfig,
+    init,
+)
+from supertokens_python.framework.fastapi import get_middleware
+from supertokens_python.recipe import dashboard, session, usermetadata
+from supertokens_python.recipe.usermetadata.asyncio import get_user_metadata
+from tests.testclient import TestClientWithNoCookieJar as TestClient
+from tests.utils import (
+    get_st_init_args,
+    CORE_URL,
+    mock_core_api_version,
+    setup_function_without_core as setup_function,
+    teardown_function_without_core as teardown_function,
+)
+
+_ = setup_function
+_ = teardown_function
+
+
+@fixture(scope="function")
+def app():
+    app = FastAPI()
+    app.add_middleware(get_middleware())
+
+    return TestClient(app)
+
+
+def mock_core(mocker: respx.MockRouter):
+    mock_core_api_version(mocker, pass_through_test_client=True)
+    mocker.get(url__regex=rf"{CORE_URL}/.*users/count.*").mock(
+        return_value=httpx.Response(200, json={"status": "OK", "count": 1})
+    )
+    mocker.get(f"{CORE_URL}/recipe/user/metadata").mock(
+        return_value=httpx.Response(200, json={"status": "OK", "metadata": {}})
+    )
+
+
+def init_with_tracing(tracing: CoreCallTracingConfig):
+    args = get_st_init_args([session.init(), dashboard.init(api_key="test")])
+    args["supertokens_config"].core_call_tracing = tracing
+    init(**args)
+
+
+def get_users_count(app: TestClient):
+    return app.get(
+        "/auth/dashboard/api/users/count", headers={"authorization": "Bearer test"}
+    )
+
+
+def test_core_calls_of_an_api_are_traced(app: TestClient):
+    records: List[CoreCallRecord] = []
+    traces: List[CoreCallTrace] = []
+    init_with_tracing(
+        CoreCallTracingConfig(
+            on_core_call=lambda record, _: records.append(record),
+            on_api_end=lambda trace, _: traces.append(trace),
+        )
+    )
+
+    with respx.mock(assert_all_called=False) as mocker:
+        mock_core(mocker)
+        assert get_users_count(app).status_code == 200
+
+    assert [(r.method, r.path) for r in records] == [
+        ("GET", "/apiversion"),
+        ("GET", "/public/users/count"),
+    ]
+    assert len(traces) == 1
+    assert traces[0].recipe_id == "dashboard"
+    assert traces[0].records == records
+    assert traces[0].core_call_count == 2
+    record = records[1]
+    assert record.status_code == 200
+    assert record.cache == "miss"
+    assert record.retries == 0
+    assert record.duration_ms > 0
+    assert record.api_id == traces[0].api_id
+
+
+def test_core_call_budget_is_enforced(app: TestClient):
+    with raises(ValueError):
+        CoreCallTracingConfig(core_call_budgets={"/api/users/count": -1})
+
+    init_with_tracing(
+        CoreCallTracingConfig(core_call_budgets={"dashboard./api/users/count": 1})
+    )
+
+    with respx.mock(assert_all_called=False) as mocker:
+        mock_core(mocker)
+        with raises(CoreCallBudgetExceededError) as e:
+            get_users_count(app)
+        assert e.value.budget == 1
+        assert e.value.trace.core_call_count == 2
+
+        # the api version is cached now
+        assert get_users_count(app).status_code == 200
+
+
+@mark.asyncio
+async def test_core_calls_outside_of_an_api_are_traced():
+    records: List[CoreCallRecord] = []
+
+    def on_core_call(record: CoreCallRecord, _: Optional[Dict[str, Any]]):
+        records.append(record)
+
+    args = get_st_init_args([session.init(), usermetadata.init()])
+    args["supertokens_config"].core_call_tracing = CoreCallTracingConfig(
+        on_core_call=on_core_call
+    )
+    init(**args)
+
+    with respx.mock(assert_all_called=False) as mocker:
+        mock_core(mocker)
+        user_context: Dict[str, Any] = {}
+        await get_user_metadata("user1", user_context)
+        await get_user_metadata("user1", user_context)
+
+    assert [(r.path, r.cache, r.api_id) for r in records] == [
+        ("/apiversion", None, None),
+        ("/recipe/user/metadata", "miss", None),
+        ("/recipe/user/metadata", "hit", None),
+    ]
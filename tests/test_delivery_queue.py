@@ -0,0 +1,184 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List, Tuple
+
+from pytest import mark, raises
+
+from supertokens_python.ingredients.delivery_queue import (
+    DeliveryJob,
+    DeliveryProviderLimits,
+    DeliveryQueue,
+    DeliveryQueueConfig,
+)
+from supertokens_python.ingredients.emaildelivery import (
+    EmailDeliveryIngredient,
+    QueuedEmailDelivery,
+)
+from supertokens_python.ingredients.emaildelivery.types import (
+    EmailDeliveryConfigWithService,
+    EmailDeliveryInterface,
+)
+
+pytestmark = mark.asyncio
+
+
+class FakeEmailService(EmailDeliveryInterface[str]):
+    def __init__(self, delay_sec: float = 0, failures: int = 0):
+        self.delay_sec = delay_sec
+        self.failures = failures
+        self.attempts = 0
+        self.sent: List[str] = []
+        self.threads: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    async def send_email(self, template_vars: str, user_context: Dict[str, Any]):
+        with self.lock:
+            self.attempts += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.threads.append(threading.current_thread().name)
+            fail = self.attempts <= self.failures
+        await asyncio.sleep(self.delay_sec)
+        with self.lock:
+            self.in_flight -= 1
+        if fail:
+            raise Exception("SMTP server unavailable")
+        self.sent.append(template_vars)
+
+
+async def test_emails_are_sent_after_the_api_returns():
+    service = FakeEmailService(delay_sec=0.2)
+    queue = DeliveryQueue()
+    ingredient = EmailDeliveryIngredient(
+        EmailDeliveryConfigWithService(service, queue=queue), "passwordless.email"
+    )
+    assert isinstance(ingredient.ingredient_interface_impl, QueuedEmailDelivery)
+
+    start = time.perf_counter()
+    await ingredient.ingredient_interface_impl.send_email(
+        "code1", {"_default": {"core_call_cache": {}}}
+    )
+    assert time.perf_counter() - start < 0.1
+    assert not service.sent
+    assert await queue.pending() == 1
+
+    assert await queue.close(timeout_sec=5)
+    assert service.sent == ["code1"]
+    assert service.threads == ["supertokens-delivery-queue"]
+    assert await queue.pending() == 0
+
+
+async def test_failed_deliveries_are_retried_and_then_dead_lettered():
+    dead_letters: List[Tuple[DeliveryJob, Exception]] = []
+
+    async def on_dead_letter(job: DeliveryJob, error: Exception):
+        dead_letters.append((job, error))
+
+    service = FakeEmailService(failures=2)
+    queue = DeliveryQueue(
+        DeliveryQueueConfig(
+            max_retries=2,
+            retry_base_delay_sec=0.01,
+            retry_max_delay_sec=0.02,
+            on_dead_letter=on_dead_letter,
+        )
+    )
+    queue.register_provider("emailpassword.email", service.send_email)
+
+    await queue.enqueue("emailpassword.email", "reset1", {})
+    await queue.close(timeout_sec=5)
+    assert service.attempts == 3
+    assert service.sent == ["reset1"]
+    assert not dead_letters
+
+    service = FakeEmailService(failures=10)
+    queue = DeliveryQueue(
+        DeliveryQueueConfig(
+            max_retries=1,
+            retry_base_delay_sec=0.01,
+            on_dead_letter=on_dead_letter,
+        )
+    )
+    queue.register_provider("emailpassword.email", service.send_email)
+
+    await queue.enqueue("emailpassword.email", "reset2", {})
+    await queue.close(timeout_sec=5)
+    assert service.attempts == 2
+    assert not service.sent
+    assert len(dead_letters) == 1
+    job, error = dead_letters[0]
+    assert job.template_vars == "reset2"
+    assert job.attempts == 1
+    assert str(error) == "SMTP server unavailable"
+
+
+async def test_provider_concurrency_and_rate_limits():
+    sms_service = FakeEmailService(delay_sec=0.05)
+    email_service = FakeEmailService()
+    queue = DeliveryQueue(
+        DeliveryQueueConfig(
+            workers=8,
+            provider_limits={
+                "passwordless.sms": DeliveryProviderLimits(max_concurrency=2),
+                "passwordless.email": DeliveryProviderLimits(max_per_sec=20),
+            },
+        )
+    )
+    queue.register_provider("passwordless.sms", sms_service.send_email)
+    queue.register_provider("passwordless.email", email_service.send_email)
+
+    start = time.perf_counter()
+    for i in range(6):
+        await queue.enqueue("passwordless.sms", f"sms{i}", {})
+        await queue.enqueue("passwordless.email", f"email{i}", {})
+    assert await queue.close(timeout_sec=5)
+
+    assert sorted(sms_service.sent) == [f"sms{i}" for i in range(6)]
+    assert sms_service.max_in_flight == 2
+    assert sorted(email_service.sent) == [f"email{i}" for i in range(6)]
+    # 6 emails at 20 per second
+    assert time.perf_counter() - start >= 0.25
+
+
+async def test_emails_are_sent_inline_if_the_queue_is_full_or_closed():
+    service = FakeEmailService(delay_sec=0.5)
+    queue = DeliveryQueue(DeliveryQueueConfig(max_size=1, workers=1))
+    queue.register_provider("emailverification.email", service.send_email)
+
+    await queue.enqueue("emailverification.email", "verify1", {})
+    await queue.enqueue("emailverification.email", "verify2", {})
+    # the second email didn't fit and was sent before enqueue returned
+    assert "verify2" in service.sent
+    while await queue.pending() > 0:
+        await asyncio.sleep(0.01)
+    assert sorted(service.sent) == ["verify1", "verify2"]
+
+    await queue.enqueue("emailverification.email", "verify3", {})
+    assert not await queue.close(timeout_sec=0.01)
+    await queue.enqueue("emailverification.email", "verify4", {})
+    assert service.sent[2:] == ["verify4"]
+
+
+def test_delivery_queue_config_is_validated():
+    with raises(ValueError):
+        DeliveryQueueConfig(workers=0)
+    with raises(ValueError):
+        DeliveryQueueConfig(max_retries=-1)
+    with raises(ValueError):
+        DeliveryProviderLimits(max_concurrency=0)
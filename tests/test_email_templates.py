@@ -0,0 +1,116 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from string import Template
+
+from pytest import raises
+
+from supertokens_python.ingredients.emaildelivery.templates import (
+    CompiledTemplate,
+    PrecompiledEmailTemplateLoader,
+    compile_template,
+)
+from supertokens_python.recipe.emailpassword.emaildelivery.services.smtp.password_reset import (
+    get_password_reset_email_html,
+)
+from supertokens_python.recipe.emailpassword.emaildelivery.services.smtp.password_reset_email import (
+    html_template as password_reset_template,
+)
+from supertokens_python.recipe.emailverification.emaildelivery.services.smtp.email_verify import (
+    get_email_verify_email_html,
+)
+from supertokens_python.recipe.emailverification.emaildelivery.services.smtp.email_verify_email import (
+    html_template as email_verify_template,
+)
+from supertokens_python.recipe.passwordless.emaildelivery.services.smtp.pless_login import (
+    get_pless_email_html,
+)
+from supertokens_python.recipe.passwordless.emaildelivery.services.smtp.pless_login_email import (
+    magic_link_body,
+    otp_and_magic_link_body,
+    otp_body,
+)
+
+
+def test_compiled_templates_render_like_string_templates():
+    template = "Hi $name, $$5 off at ${shop}! ${name}$name"
+    values = {"name": "Jane", "shop": "a$b"}
+    assert CompiledTemplate.compile(template).render(**values) == Template(
+        template
+    ).substitute(**values)
+
+    with raises(KeyError):
+        CompiledTemplate.compile(template).render(name="Jane")
+    with raises(ValueError):
+        CompiledTemplate.compile("price: $5")
+
+
+def test_partial_templates_are_cached_per_variant():
+    template = CompiledTemplate.compile("${appname}: $code ($time)")
+    variant = template.partial(appname="App", time="15 minutes")
+    assert variant.names == ["code"]
+    assert variant.render(code="1234") == "App: 1234 (15 minutes)"
+    assert template.partial(appname="App", time="15 minutes") is variant
+    assert template.partial(appname="App", time="1 hour") is not variant
+
+
+def test_built_in_email_templates_are_unchanged():
+    assert compile_template(otp_body) is compile_template(otp_body)
+
+    for html_template, otp, url in [
+        (otp_and_magic_link_body, "123456", "https://example.com/verify#abc"),
+        (otp_body, "123456", None),
+        (magic_link_body, None, "https://example.com/verify#abc"),
+    ]:
+        assert get_pless_email_html(
+            "My App", "15 minutes", "test@example.com", url, otp
+        ) == Template(html_template).substitute(
+            appname="My App",
+            time="15 minutes",
+            toEmail="test@example.com",
+            otp=otp,
+            urlWithLinkCode=url,
+        )
+
+    assert get_password_reset_email_html(
+        "My App", "test@example.com", "https://example.com/reset"
+    ) == Template(password_reset_template).substitute(
+        appname="My App",
+        resetLink="https://example.com/reset",
+        toEmail="test@example.com",
+    )
+    assert get_email_verify_email_html(
+        "My App", "test@example.com", "https://example.com/verify"
+    ) == Template(email_verify_template).substitute(
+        appname="My App",
+        verificationLink="https://example.com/verify",
+        toEmail="test@example.com",
+    )
+
+
+def test_templates_can_be_loaded_from_a_template_loader():
+    loader = PrecompiledEmailTemplateLoader(
+        {"passwordless.otp": "<p>${appname}: ${otp} (valid for ${time})</p>"}
+    )
+    assert (
+        get_pless_email_html(
+            "My App", "15 minutes", "test@example.com", None, "123456", loader
+        )
+        == "<p>My App: 123456 (valid for 15 minutes)</p>"
+    )
+    # templates the loader doesn't have fall back to the built in ones
+    assert get_pless_email_html(
+        "My App", "15 minutes", "test@example.com", "https://example.com", None, loader
+    ) == get_pless_email_html(
+        "My App", "15 minutes", "test@example.com", "https://example.com", None
+    )
@@ -0,0 +1,96 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+import threading
+from typing import List
+
+import httpx
+import respx
+from pytest import mark, raises
+from sniffio import AsyncLibraryNotFoundError
+
+from supertokens_python import HttpClientConfig
+from supertokens_python.async_to_sync_wrapper import sync
+from supertokens_python.http_client import HttpClientPool
+
+
+@mark.asyncio
+async def test_same_client_is_reused_within_a_loop():
+    pool = HttpClientPool()
+    client = pool.get_client()
+    assert pool.get_client() is client
+
+    with respx.mock() as mocker:
+        route = mocker.get("http://localhost:3567/hello").mock(httpx.Response(200))
+        await pool.get_client().get("http://localhost:3567/hello")
+        await pool.get_client().get("http://localhost:3567/hello")
+        assert route.call_count == 2
+
+    assert pool.get_client() is client
+    await pool.aclose()
+    assert client.is_closed
+
+
+@mark.asyncio
+async def test_closed_client_is_replaced():
+    pool = HttpClientPool()
+    client = pool.get_client()
+    await pool.aclose()
+    new_client = pool.get_client()
+    assert new_client is not client
+    assert not new_client.is_closed
+    await pool.aclose()
+
+
+def test_each_sync_thread_loop_gets_its_own_client():
+    pool = HttpClientPool()
+    clients: List[List[httpx.AsyncClient]] = [[], []]
+
+    async def get_client():
+        return pool.get_client()
+
+    def run(idx: int):
+        clients[idx].append(sync(get_client()))
+        clients[idx].append(sync(get_client()))
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert clients[0][0] is clients[0][1]
+    assert clients[1][0] is clients[1][1]
+    assert clients[0][0] is not clients[1][0]
+
+
+def test_get_client_without_running_loop_raises():
+    pool = HttpClientPool()
+    with raises(AsyncLibraryNotFoundError):
+        pool.get_client()
+
+
+def test_http_client_config_is_applied():
+    config = HttpClientConfig(
+        max_connections=5,
+        max_keepalive_connections=2,
+        keep_alive_expiry_sec=10.0,
+        connect_timeout_sec=1.0,
+        read_timeout_sec=2.0,
+        write_timeout_sec=3.0,
+        pool_timeout_sec=4.0,
+    )
+    client = config.create_client()
+    assert client.timeout == httpx.Timeout(connect=1.0, read=2.0, write=3.0, pool=4.0)
+    asyncio.run(client.aclose())
@@ -0,0 +1,81 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from pytest import raises
+
+from supertokens_python.exceptions import GeneralError
+from supertokens_python.normalised_url_domain import (
+    NormalisedURLDomain,
+    normalise_url_domain_or_throw_error,
+)
+from supertokens_python.normalised_url_path import (
+    NormalisedURLPath,
+    normalise_url_path_or_throw_error,
+)
+
+
+def simulate_request():
+    # Roughly what the middleware and querier build for a single session refresh
+    api_base_path = NormalisedURLPath("/auth")
+    path = NormalisedURLPath("/auth/session/refresh")
+    api_base_path.append(NormalisedURLPath("/session/refresh")).equals(path)
+    NormalisedURLPath("public/recipe/session/refresh")
+    NormalisedURLDomain("http://localhost:3567")
+    NormalisedURLPath("http://localhost:3567").append(
+        NormalisedURLPath("/recipe/session/refresh")
+    )
+
+
+def test_normalised_values_are_memoised():
+    normalise_url_path_or_throw_error.cache_clear()
+
+    assert NormalisedURLPath("/One/Two/").get_as_string_dangerous() == "/one/two"
+    assert NormalisedURLPath("/One/Two/").get_as_string_dangerous() == "/one/two"
+    assert normalise_url_path_or_throw_error.cache_info().hits >= 1
+
+    path = NormalisedURLPath("/auth").append(NormalisedURLPath("/signin"))
+    assert path.get_as_string_dangerous() == "/auth/signin"
+
+    assert (
+        NormalisedURLDomain("api.example.com").get_as_string_dangerous()
+        == "https://api.example.com"
+    )
+    assert normalise_url_domain_or_throw_error("api.example.com") == (
+        "https://api.example.com"
+    )
+
+
+def test_invalid_values_still_raise_every_time():
+    for _ in range(2):
+        with raises(GeneralError):
+            NormalisedURLDomain("/one/two")
+
+
+def test_each_request_after_the_first_only_hits_the_cache():
+    normalise_url_path_or_throw_error.cache_clear()
+    normalise_url_domain_or_throw_error.cache_clear()
+
+    simulate_request()
+    path_misses = normalise_url_path_or_throw_error.cache_info().misses
+    domain_misses = normalise_url_domain_or_throw_error.cache_info().misses
+    assert path_misses > 0 and domain_misses > 0
+
+    for _ in range(100):
+        simulate_request()
+
+    path_info = normalise_url_path_or_throw_error.cache_info()
+    domain_info = normalise_url_domain_or_throw_error.cache_info()
+    assert path_info.misses == path_misses
+    assert domain_info.misses == domain_misses
+    assert path_info.hits >= 100
+    assert domain_info.hits >= 100
@@ -0,0 +1,94 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import respx
+from fastapi import FastAPI
+from pytest import fixture
+
+from supertokens_python import init
+from supertokens_python.framework.fastapi import get_middleware
+from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.recipe import session
+from supertokens_python.recipe.openid.recipe_implementation import (
+    RecipeImplementation,
+)
+from supertokens_python.recipe.session.recipe import SessionRecipe
+from tests.testclient import TestClientWithNoCookieJar as TestClient
+from tests.utils import (
+    get_st_init_args,
+    mock_core_api_version,
+    setup_function_without_core as setup_function,
+    teardown_function_without_core as teardown_function,
+)
+
+_ = setup_function
+_ = teardown_function
+
+DISCOVERY_URL = "/auth/.well-known/openid-configuration"
+
+
+@fixture(scope="function")
+def app():
+    app = FastAPI()
+    app.add_middleware(get_middleware())
+
+    return TestClient(app)
+
+
+def get_openid_recipe_implementation() -> RecipeImplementation:
+    recipe_implementation = (
+        SessionRecipe.get_instance().openid_recipe.recipe_implementation
+    )
+    assert isinstance(recipe_implementation, RecipeImplementation)
+    return recipe_implementation
+
+
+def test_discovery_document_is_served_with_an_etag(app: TestClient):
+    init(**get_st_init_args([session.init()]))
+
+    with respx.mock(assert_all_called=False) as mocker:
+        mock_core_api_version(mocker, pass_through_test_client=True)
+
+        res = app.get(DISCOVERY_URL)
+        assert res.status_code == 200
+        assert res.json() == {
+            "status": "OK",
+            "issuer": "http://api.supertokens.io/auth",
+            "jwks_uri": "http://api.supertokens.io/auth/jwt/jwks.json",
+        }
+        assert res.headers["cache-control"] == "public, max-age=3600"
+        assert res.headers["access-control-allow-origin"] == "*"
+        etag = res.headers["etag"]
+
+        res = app.get(DISCOVERY_URL, headers={"If-None-Match": etag})
+        assert res.status_code == 304
+        assert res.content == b""
+
+        res = app.get(DISCOVERY_URL, headers={"If-None-Match": f'W/"x", {etag}'})
+        assert res.status_code == 304
+
+        # a different issuer is a different document
+        config = get_openid_recipe_implementation().config
+        config.issuer_path = NormalisedURLPath("/other")
+        res = app.get(DISCOVERY_URL, headers={"If-None-Match": etag})
+        assert res.status_code == 200
+        assert res.json()["issuer"] == "http://api.supertokens.io/other"
+        assert res.headers["etag"] != etag
+
+
+def test_issuer_and_jwks_uri_are_built_once():
+    init(**get_st_init_args([session.init()]))
+    recipe_implementation = get_openid_recipe_implementation()
+
+    first = recipe_implementation.get_issuer_and_jwks_uri()
+    assert recipe_implementation.get_issuer_and_jwks_uri() is first
@@ -0,0 +1,170 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from typing import Any, Dict, List, Union
+
+from pytest import mark
+
+from supertokens_python import Supertokens, init
+from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.recipe import (
+    dashboard,
+    emailpassword,
+    emailverification,
+    passwordless,
+    session,
+    thirdparty,
+    userroles,
+)
+from supertokens_python.framework.response import BaseResponse
+from supertokens_python.recipe_module import APIHandled, ApiIdWithTenantId, RecipeModule
+from tests.utils import get_st_init_args, reset
+
+
+def setup_function(_: Any):
+    reset(stop_core=False)
+
+
+def teardown_function(_: Any):
+    reset(stop_core=False)
+
+
+def init_with_recipes():
+    init(
+        **get_st_init_args(
+            [
+                session.init(),
+                emailpassword.init(),
+                emailverification.init("OPTIONAL"),
+                thirdparty.init(),
+                passwordless.init(
+                    contact_config=passwordless.ContactEmailOnlyConfig(),
+                    flow_type="USER_INPUT_CODE",
+                ),
+                userroles.init(),
+                dashboard.init(api_key="test"),
+            ]
+        )
+    )
+
+
+@mark.asyncio
+async def test_route_table_matches_recipe_lookup():
+    init_with_recipes()
+    st = Supertokens.get_instance()
+    route_table = st.get_route_table()
+
+    paths = [
+        "/auth/signin",
+        "/auth/signup",
+        "/auth/public/signin",
+        "/auth/tenant-1/signup/email/exists",
+        "/auth/session/refresh",
+        "/auth/t1/session/refresh",
+        "/auth/signinup/code",
+        "/auth/authorisationurl",
+        "/auth/user/email/verify",
+        "/auth/dashboard",
+        "/auth/dashboard/api/users",
+        "/auth/jwt/jwks.json",
+        "/auth/.well-known/openid-configuration",
+        "/auth/a/b/signin",
+        "/auth/unknown",
+        "/auth",
+        "/other/signin",
+    ]
+    for path_str in paths:
+        path = NormalisedURLPath(path_str)
+        for method in ["get", "post", "put", "delete"]:
+            expected = None
+            for recipe in st.recipe_modules:
+                result = await recipe.return_api_id_if_can_handle_request(
+                    path, method, {}
+                )
+                if result is not None:
+                    expected = (recipe, result.api_id, result.tenant_id)
+                    break
+
+            matches = await route_table.get_matching_apis(
+                path, method, {}, first_only=True
+            )
+            actual = (
+                (matches[0][0], matches[0][1].api_id, matches[0][1].tenant_id)
+                if len(matches) > 0
+                else None
+            )
+            assert actual == expected, (path_str, method)
+
+
+@mark.asyncio
+async def test_route_table_only_returns_requested_recipes():
+    init_with_recipes()
+    st = Supertokens.get_instance()
+    route_table = st.get_route_table()
+    session_recipe = [r for r in st.recipe_modules if r.get_recipe_id() == "session"]
+
+    path = NormalisedURLPath("/auth/signin")
+    assert await route_table.get_matching_apis(path, "post", {}, session_recipe) == []
+
+    matches = await route_table.get_matching_apis(path, "post", {})
+    assert [r.get_recipe_id() for r, _ in matches] == ["emailpassword"]
+
+
+class CustomMatcherRecipe(RecipeModule):
+    def is_error_from_this_recipe_based_on_instance(self, err: Exception) -> bool:
+        return False
+
+    def get_apis_handled(self) -> List[APIHandled]:
+        return []
+
+    async def return_api_id_if_can_handle_request(
+        self, path: NormalisedURLPath, method: str, user_context: Dict[str, Any]
+    ) -> Union[ApiIdWithTenantId, None]:
+        if path.get_as_string_dangerous().startswith("/auth/custom/"):
+            return ApiIdWithTenantId("custom", "public")
+        return None
+
+    async def handle_api_request(self, *_: Any) -> Union[BaseResponse, None]:
+        return None
+
+    async def handle_error(self, *_: Any) -> BaseResponse:
+        raise Exception("not implemented")
+
+    def get_all_cors_headers(self) -> List[str]:
+        return []
+
+
+@mark.asyncio
+async def test_route_table_asks_recipes_with_custom_matchers():
+    init(
+        **get_st_init_args(
+            [
+                session.init(),
+                lambda app_info: CustomMatcherRecipe("custom", app_info),
+                emailpassword.init(),
+            ]
+        )
+    )
+    route_table = Supertokens.get_instance().get_route_table()
+
+    matches = await route_table.get_matching_apis(
+        NormalisedURLPath("/auth/custom/anything"), "get", {}
+    )
+    assert [(r.get_recipe_id(), m.api_id) for r, m in matches] == [("custom", "custom")]
+
+    matches = await route_table.get_matching_apis(
+        NormalisedURLPath("/auth/signin"), "post", {}
+    )
+    assert [(r.get_recipe_id(), m.api_id) for r, m in matches] == [
+        ("emailpassword", "/signin")
+    ]
@@ -0,0 +1,171 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+from typing import List
+
+import aiosmtplib
+from pytest import mark
+
+from supertokens_python.ingredients.emaildelivery.services.smtp import (
+    Transporter,
+    get_smtp_connection_pool,
+)
+from supertokens_python.ingredients.emaildelivery.types import (
+    EmailContent,
+    SMTPSettings,
+    SMTPSettingsFrom,
+)
+
+pytestmark = mark.asyncio
+
+
+class FakeSMTPServer:
+    """
+    Just enough of SMTP (no TLS, no auth) to send emails with aiosmtplib
+    """
+
+    def __init__(self):
+        self.connections = 0
+        self.messages: List[str] = []
+        self.writers: List[asyncio.StreamWriter] = []
+        self.server: asyncio.AbstractServer
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        self.writers.append(writer)
+        writer.write(b"220 localhost ESMTP\r\n")
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            command = line.decode().strip().upper()
+            if command.startswith("EHLO"):
+                writer.write(b"250-localhost\r\n250 8BITMIME\r\n")
+            elif command == "DATA":
+                writer.write(b"354 go ahead\r\n")
+                data = await reader.readuntil(b"\r\n.\r\n")
+                self.messages.append(data.decode())
+                writer.write(b"250 OK\r\n")
+            elif command == "QUIT":
+                writer.write(b"221 bye\r\n")
+                await writer.drain()
+                break
+            else:
+                writer.write(b"250 OK\r\n")
+            await writer.drain()
+        writer.close()
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    def drop_connections(self):
+        for writer in self.writers:
+            writer.close()
+        self.writers = []
+
+    async def stop(self):
+        self.drop_connections()
+        self.server.close()
+        await self.server.wait_closed()
+        # let the connection handlers see the closed connections and return
+        await asyncio.sleep(0.05)
+
+
+def close_smtp_connection_pool(settings: SMTPSettings):
+    async def connect() -> aiosmtplib.SMTP:
+        raise AssertionError("the pool should already exist")
+
+    get_smtp_connection_pool(settings, connect).close()
+
+
+def get_email(i: int) -> EmailContent:
+    return EmailContent(f"body {i}", "subject", f"user{i}@example.com", False)
+
+
+async def test_connections_are_reused_across_emails():
+    server = FakeSMTPServer()
+    port = await server.start()
+    settings = SMTPSettings("127.0.0.1", port, SMTPSettingsFrom("ST", "st@example.com"))
+    try:
+        transporter = Transporter(settings)
+        for i in range(5):
+            await transporter.send_email(get_email(i), {})
+
+        # A second transporter with the same settings (e.g. another recipe) shares the pool
+        await Transporter(settings).send_email(get_email(5), {})
+
+        assert len(server.messages) == 6
+        assert server.connections == 1
+    finally:
+        close_smtp_connection_pool(settings)
+        await server.stop()
+
+
+async def test_concurrent_emails_are_bounded_by_the_pool_size():
+    server = FakeSMTPServer()
+    port = await server.start()
+    settings = SMTPSettings(
+        "127.0.0.1",
+        port,
+        SMTPSettingsFrom("ST", "st@example.com"),
+        max_pooled_connections=2,
+    )
+    transporter = Transporter(settings)
+    try:
+        await asyncio.gather(
+            *[transporter.send_email(get_email(i), {}) for i in range(10)]
+        )
+        assert len(server.messages) == 10
+        assert server.connections <= 2
+    finally:
+        close_smtp_connection_pool(settings)
+        await server.stop()
+
+
+async def test_dropped_connections_are_replaced():
+    server = FakeSMTPServer()
+    port = await server.start()
+    settings = SMTPSettings("127.0.0.1", port, SMTPSettingsFrom("ST", "st@example.com"))
+    transporter = Transporter(settings)
+    try:
+        await transporter.send_email(get_email(0), {})
+        server.drop_connections()
+        await asyncio.sleep(0.05)
+
+        await transporter.send_email(get_email(1), {})
+        assert len(server.messages) == 2
+        assert server.connections == 2
+    finally:
+        close_smtp_connection_pool(settings)
+        await server.stop()
+
+
+async def test_pooling_can_be_disabled():
+    server = FakeSMTPServer()
+    port = await server.start()
+    settings = SMTPSettings(
+        "127.0.0.1",
+        port,
+        SMTPSettingsFrom("ST", "st@example.com"),
+        max_pooled_connections=0,
+    )
+    try:
+        transporter = Transporter(settings)
+        for i in range(3):
+            await transporter.send_email(get_email(i), {})
+        assert len(server.messages) == 3
+        assert server.connections == 3
+    finally:
+        await server.stop()
@@ -0,0 +1,195 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Generator, Optional
+
+from pytest import fixture, mark, raises
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import ConnectTimeout
+from twilio.base.exceptions import TwilioRestException  # type: ignore
+from twilio.http.http_client import TwilioHttpClient  # type: ignore
+from twilio.rest import Client  # type: ignore
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from supertokens_python.ingredients.smsdelivery.services import twilio
+from supertokens_python.ingredients.smsdelivery.services.twilio import (
+    TwilioMessageSender,
+    is_retryable_twilio_error,
+    normalize_twilio_settings,
+)
+from supertokens_python.ingredients.smsdelivery.types import TwilioSettings
+
+pytestmark = mark.asyncio
+
+MESSAGE_SID = "SM" + "0" * 32
+
+
+class FakeTwilio:
+    """
+    A local HTTP server that answers message requests after a delay, optionally
+    rate limiting the first ones or failing all of them
+    """
+
+    def __init__(self):
+        self.delay_sec = 0.0
+        self.rate_limited_requests = 0
+        self.status_code = 201
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):  # pylint: disable=invalid-name
+                self.rfile.read(int(self.headers["Content-Length"]))
+                status_code, body = fake.handle()
+                data = json.dumps(body).encode()
+                self.send_response(status_code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *_: Any):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def handle(self):
+        with self.lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            rate_limited = self.requests <= self.rate_limited_requests
+        time.sleep(self.delay_sec)
+        with self.lock:
+            self.in_flight -= 1
+        if rate_limited:
+            return 429, {"code": 20429, "message": "Too Many Requests", "status": 429}
+        if self.status_code != 201:
+            return self.status_code, {"message": "error", "status": self.status_code}
+        return 201, {"sid": MESSAGE_SID, "status": "queued"}
+
+    def get_client(self) -> Client:  # type: ignore
+        fake_url = self.url
+
+        class FakeTwilioHttpClient(TwilioHttpClient):
+            def request(self, method: str, url: str, *args: Any, **kwargs: Any):
+                url = url.replace("https://api.twilio.com", fake_url)
+                return super().request(method, url, *args, **kwargs)
+
+        return Client(  # type: ignore
+            "ACTWILIO_ACCOUNT_SID", "test-token", http_client=FakeTwilioHttpClient()
+        )
+
+
+@fixture
+def fake_twilio() -> Generator[FakeTwilio, None, None]:
+    fake = FakeTwilio()
+    yield fake
+    fake.server.shutdown()
+    fake.server.server_close()
+
+
+async def send(sender: TwilioMessageSender, fake: FakeTwilio) -> Optional[Any]:
+    return await sender.create_message(
+        fake.get_client(), to="+1234", body="hi", from_="+1"
+    )
+
+
+async def test_messages_are_sent_from_a_bounded_thread_pool(
+    fake_twilio: FakeTwilio,
+):
+    fake_twilio.delay_sec = 0.2
+    sender = TwilioMessageSender(max_concurrent_requests=2)
+
+    await asyncio.gather(*[send(sender, fake_twilio) for _ in range(4)])
+    sender.close()
+
+    assert fake_twilio.requests == 4
+    assert fake_twilio.max_in_flight == 2
+
+
+async def test_rate_limited_messages_are_retried(
+    monkeypatch: Any, fake_twilio: FakeTwilio
+):
+    monkeypatch.setattr(twilio, "TWILIO_RETRY_BASE_DELAY_SEC", 0.01)
+    fake_twilio.rate_limited_requests = 2
+    sender = TwilioMessageSender(max_retries=2)
+
+    message = await send(sender, fake_twilio)
+    sender.close()
+
+    assert message.sid == MESSAGE_SID  # type: ignore
+    assert fake_twilio.requests == 3
+
+
+async def test_errors_are_raised_once_the_retries_run_out(
+    monkeypatch: Any, fake_twilio: FakeTwilio
+):
+    monkeypatch.setattr(twilio, "TWILIO_RETRY_BASE_DELAY_SEC", 0.01)
+    fake_twilio.rate_limited_requests = 5
+    sender = TwilioMessageSender(max_retries=1)
+
+    with raises(TwilioRestException) as e:
+        await send(sender, fake_twilio)
+    assert e.value.status == 429
+    assert fake_twilio.requests == 2
+
+    # errors other than rate limiting aren't retried
+    fake_twilio.rate_limited_requests = 0
+    fake_twilio.status_code = 500
+    with raises(TwilioRestException):
+        await send(sender, fake_twilio)
+    assert fake_twilio.requests == 3
+    sender.close()
+
+
+def test_only_connection_errors_before_the_request_was_sent_are_retried():
+    pool: Any = None
+    refused = NewConnectionError(pool, "Connection refused")
+    assert is_retryable_twilio_error(
+        RequestsConnectionError(MaxRetryError(pool, "/", refused))
+    )
+    assert is_retryable_twilio_error(ConnectTimeout())
+    aborted = ProtocolError("Connection aborted.", ConnectionResetError())
+    assert not is_retryable_twilio_error(RequestsConnectionError(aborted))
+    assert not is_retryable_twilio_error(
+        RequestsConnectionError(MaxRetryError(pool, "/", aborted))
+    )
+
+
+def test_twilio_concurrency_settings_are_validated():
+    with raises(Exception):
+        normalize_twilio_settings(
+            TwilioSettings(
+                "ACTWILIO_ACCOUNT_SID",
+                "test-token",
+                from_="+1",
+                max_concurrent_requests=0,
+            )
+        )
+    with raises(Exception):
+        normalize_twilio_settings(
+            TwilioSettings(
+                "ACTWILIO_ACCOUNT_SID", "test-token", from_="+1", max_retries=-1
+            )
+        )
@@ -0,0 +1,136 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from typing import Any, Dict, List
+
+import httpx
+import respx
+from pytest import mark
+
+from supertokens_python import init
+from supertokens_python.asyncio import get_user
+from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.querier import Querier
+from supertokens_python.recipe import session
+from supertokens_python.recipe.accountlinking.asyncio import create_primary_user
+from supertokens_python.types import RecipeUserId
+from tests.utils import (
+    get_st_init_args,
+    CORE_URL,
+    mock_core_api_version,
+    setup_function_without_core as setup_function,
+    teardown_function_without_core as teardown_function,
+)
+
+_ = setup_function
+_ = teardown_function
+
+pytestmark = mark.asyncio
+
+
+def user_json(user_id: str, recipe_user_ids: List[str]) -> Dict[str, Any]:
+    return {
+        "id": user_id,
+        "isPrimaryUser": len(recipe_user_ids) > 1,
+        "tenantIds": ["public"],
+        "emails": ["test@example.com"],
+        "phoneNumbers": [],
+        "thirdParty": [],
+        "loginMethods": [
+            {
+                "recipeId": "emailpassword",
+                "recipeUserId": recipe_user_id,
+                "tenantIds": ["public"],
+                "email": "test@example.com",
+                "timeJoined": 0,
+                "verified": False,
+            }
+            for recipe_user_id in recipe_user_ids
+        ],
+        "timeJoined": 0,
+    }
+
+
+def mock_core(mocker: respx.MockRouter):
+    mock_core_api_version(mocker)
+    mocker.post(f"{CORE_URL}/recipe/accountlinking/user/primary").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "status": "OK",
+                "user": user_json("user1", ["user1", "user2"]),
+                "wasAlreadyAPrimaryUser": False,
+            },
+        )
+    )
+    mocker.post(f"{CORE_URL}/recipe/user/email/verify").mock(
+        return_value=httpx.Response(200, json={"status": "OK"})
+    )
+    return mocker.get(f"{CORE_URL}/user/id").mock(
+        return_value=httpx.Response(
+            200, json={"status": "OK", "user": user_json("user1", ["user1", "user2"])}
+        )
+    )
+
+
+async def verify_email(recipe_user_id: str, user_context: Any):
+    await Querier.get_instance().send_post_request(
+        NormalisedURLPath("/recipe/user/email/verify"),
+        {"recipeUserId": recipe_user_id, "email": "test@example.com"},
+        user_context,
+    )
+
+
+async def test_users_returned_by_writes_are_reused_in_the_request():
+    init(**get_st_init_args([session.init()]))  # type: ignore
+
+    with respx.mock(assert_all_called=False) as mocker:
+        get_user_route = mock_core(mocker)
+        user_context: Dict[str, Any] = {}
+
+        result = await create_primary_user(RecipeUserId("user1"), user_context)
+        user = await get_user("user1", user_context)
+        linked_user = await get_user("user2", user_context)
+
+        assert get_user_route.call_count == 0
+        assert user is result.user  # type: ignore
+        assert linked_user is user
+
+        await get_user("user1", {})
+        assert get_user_route.call_count == 1
+
+
+async def test_users_are_refetched_after_writes_that_change_them():
+    init(**get_st_init_args([session.init()]))  # type: ignore
+
+    with respx.mock(assert_all_called=False) as mocker:
+        get_user_route = mock_core(mocker)
+        user_context: Dict[str, Any] = {}
+
+        await get_user("user1", user_context)
+        await get_user("user2", user_context)
+        assert get_user_route.call_count == 1
+
+        await verify_email("other-user", user_context)
+        await get_user("user1", user_context)
+        assert get_user_route.call_count == 1
+
+        # a write to a linked login method changes the primary user too
+        await verify_email("user2", user_context)
+        await get_user("user1", user_context)
+        assert get_user_route.call_count == 2
+
+        # as does a write made by another request
+        await verify_email("user1", None)
+        await get_user("user2", user_context)
+        assert get_user_route.call_count == 3
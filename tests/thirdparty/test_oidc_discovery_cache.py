@@ -0,0 +1,110 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+from typing import Any
+
+import httpx
+import respx
+from pytest import mark, raises
+
+from supertokens_python import init
+from supertokens_python.recipe import session, thirdparty
+from supertokens_python.recipe.thirdparty.providers.config_utils import (
+    OIDCDiscoveryCacheConfig,
+    get_oidc_discovery_info,
+    oidc_discovery_cache,
+)
+from supertokens_python.recipe.thirdparty.providers.response_cache import (
+    get_ttl_sec_from_headers,
+)
+from tests.utils import get_st_init_args, reset
+
+pytestmark = mark.asyncio
+
+DISCOVERY_URL = "https://accounts.example.com/.well-known/openid-configuration"
+DISCOVERY_INFO = {
+    "authorization_endpoint": "https://accounts.example.com/auth",
+    "token_endpoint": "https://accounts.example.com/token",
+    "jwks_uri": "https://accounts.example.com/certs",
+}
+
+
+def setup_function(_: Any):
+    reset(stop_core=False)
+    init(**get_st_init_args([session.init(), thirdparty.init()]))
+
+
+def teardown_function(_: Any):
+    reset(stop_core=False)
+
+
+def test_ttl_is_read_from_cache_control():
+    assert get_ttl_sec_from_headers(httpx.Headers({}), OIDCDiscoveryCacheConfig) == (
+        OIDCDiscoveryCacheConfig["default_ttl_sec"]
+    )
+    assert (
+        get_ttl_sec_from_headers(
+            httpx.Headers({"cache-control": "public, max-age=7200"}),
+            OIDCDiscoveryCacheConfig,
+        )
+        == 7200
+    )
+    assert (
+        get_ttl_sec_from_headers(
+            httpx.Headers({"cache-control": "no-cache"}), OIDCDiscoveryCacheConfig
+        )
+        == OIDCDiscoveryCacheConfig["min_ttl_sec"]
+    )
+    assert (
+        get_ttl_sec_from_headers(
+            httpx.Headers({"cache-control": "max-age=31536000"}),
+            OIDCDiscoveryCacheConfig,
+        )
+        == OIDCDiscoveryCacheConfig["max_ttl_sec"]
+    )
+
+
+async def test_discovery_info_is_cached_and_concurrent_misses_share_a_fetch():
+    with respx.mock(assert_all_mocked=False) as mocker:
+        route = mocker.get(DISCOVERY_URL).mock(
+            side_effect=lambda _: httpx.Response(
+                200, json=DISCOVERY_INFO, headers={"cache-control": "max-age=3600"}
+            )
+        )
+
+        results = await asyncio.gather(
+            *[get_oidc_discovery_info(DISCOVERY_URL) for _ in range(5)]
+        )
+        assert all(r == DISCOVERY_INFO for r in results)
+        assert route.call_count == 1
+
+        assert await get_oidc_discovery_info(DISCOVERY_URL) == DISCOVERY_INFO
+        assert route.call_count == 1
+
+
+async def test_expired_discovery_info_is_refetched_and_served_stale_on_error():
+    with respx.mock(assert_all_mocked=False) as mocker:
+        route = mocker.get(DISCOVERY_URL).mock(
+            return_value=httpx.Response(200, json=DISCOVERY_INFO)
+        )
+        assert await get_oidc_discovery_info(DISCOVERY_URL) == DISCOVERY_INFO
+
+        oidc_discovery_cache.entries[DISCOVERY_URL].expires_at = 0
+        route.mock(return_value=httpx.Response(503))
+        assert await get_oidc_discovery_info(DISCOVERY_URL) == DISCOVERY_INFO
+        assert route.call_count == 2
+
+        oidc_discovery_cache.clear()
+        with raises(httpx.HTTPStatusError):
+            await get_oidc_discovery_info(DISCOVERY_URL)
@@ -0,0 +1,108 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import json
+import time
+from typing import Any, Dict, Tuple
+
+import httpx
+import jwt
+import respx
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+from pytest import mark, raises
+
+from supertokens_python import init
+from supertokens_python.recipe import session, thirdparty
+from supertokens_python.recipe.thirdparty.providers.custom import (
+    third_party_jwks_cache,
+    verify_id_token_from_jwks_endpoint_and_get_payload,
+)
+from tests.utils import get_st_init_args, reset
+
+pytestmark = mark.asyncio
+
+JWKS_URI = "https://accounts.example.com/certs"
+CLIENT_ID = "client-id"
+
+
+def setup_function(_: Any):
+    reset(stop_core=False)
+    init(**get_st_init_args([session.init(), thirdparty.init()]))
+
+
+def teardown_function(_: Any):
+    reset(stop_core=False)
+
+
+def create_key(kid: str) -> Tuple[Any, Dict[str, Any]]:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update({"kid": kid, "alg": "RS256", "use": "sig"})
+    return private_key, jwk
+
+
+def create_id_token(private_key: Any, kid: str) -> str:
+    return jwt.encode(
+        {"sub": "user", "aud": CLIENT_ID, "exp": int(time.time()) + 60},
+        private_key,
+        algorithm="RS256",
+        headers={"kid": kid},
+    )
+
+
+async def test_jwks_is_fetched_once_for_known_kids():
+    private_key, jwk = create_key("k1")
+    id_token = create_id_token(private_key, "k1")
+
+    with respx.mock(assert_all_mocked=False) as mocker:
+        route = mocker.get(JWKS_URI).mock(
+            return_value=httpx.Response(200, json={"keys": [jwk]})
+        )
+        for _ in range(3):
+            payload = await verify_id_token_from_jwks_endpoint_and_get_payload(
+                id_token, JWKS_URI, CLIENT_ID
+            )
+            assert payload["sub"] == "user"
+
+        assert route.call_count == 1
+
+
+async def test_unknown_kid_refetches_the_jwks_at_most_once_per_interval():
+    old_private_key, old_jwk = create_key("old")
+    new_private_key, new_jwk = create_key("new")
+    unknown_private_key, _ = create_key("unknown")
+
+    with respx.mock(assert_all_mocked=False) as mocker:
+        route = mocker.get(JWKS_URI).mock(
+            return_value=httpx.Response(200, json={"keys": [old_jwk]})
+        )
+        await verify_id_token_from_jwks_endpoint_and_get_payload(
+            create_id_token(old_private_key, "old"), JWKS_URI, CLIENT_ID
+        )
+
+        # The provider rotated its keys
+        third_party_jwks_cache.entries[JWKS_URI].fetched_at = 0
+        route.mock(return_value=httpx.Response(200, json={"keys": [new_jwk]}))
+        payload = await verify_id_token_from_jwks_endpoint_and_get_payload(
+            create_id_token(new_private_key, "new"), JWKS_URI, CLIENT_ID
+        )
+        assert payload["sub"] == "user"
+        assert route.call_count == 2
+
+        # The keys were just fetched, so an unknown kid doesn't fetch them again
+        with raises(Exception):
+            await verify_id_token_from_jwks_endpoint_and_get_payload(
+                create_id_token(unknown_private_key, "unknown"), JWKS_URI, CLIENT_ID
+            )
+        assert route.call_count == 2
@@ -0,0 +1,94 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+
+import httpx
+import respx
+from pytest import mark, raises
+
+from supertokens_python import init
+from supertokens_python.recipe import dashboard, usermetadata
+from supertokens_python.recipe.usermetadata.asyncio import get_users_metadata
+from supertokens_python.utils import gather_with_concurrency_limit
+from tests.utils import (
+    get_st_init_args,
+    CORE_URL,
+    mock_core_api_version,
+    setup_function_without_core as setup_function,
+    teardown_function_without_core as teardown_function,
+)
+
+_ = setup_function
+_ = teardown_function
+
+
+@mark.asyncio
+async def test_gather_with_concurrency_limit_uses_a_sliding_window():
+    running = 0
+    max_running = 0
+
+    async def work(i: int) -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        # the slow ones don't hold back the rest of the window
+        await asyncio.sleep(0.05 if i == 0 else 0.001)
+        running -= 1
+        return i
+
+    results = await gather_with_concurrency_limit(3, [work(i) for i in range(10)])
+    assert results == list(range(10))
+    assert max_running == 3
+
+
+@mark.asyncio
+async def test_users_metadata_is_fetched_with_bounded_concurrency():
+    init(**get_st_init_args([usermetadata.init()]))
+    running = 0
+    max_running = 0
+
+    async def user_metadata(request: httpx.Request):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        user_id = request.url.params["userId"]
+        return httpx.Response(
+            200, json={"status": "OK", "metadata": {"first_name": user_id}}
+        )
+
+    with respx.mock(assert_all_called=False) as mocker:
+        mock_core_api_version(mocker)
+        route = mocker.get(f"{CORE_URL}/recipe/user/metadata").mock(
+            side_effect=user_metadata
+        )
+
+        user_ids = [f"user{i}" for i in range(8)] + ["user0"]
+        results = await get_users_metadata(user_ids, max_concurrency=2)
+
+        assert route.call_count == 8
+        assert max_running == 2
+        assert {k: v.metadata["first_name"] for k, v in results.items()} == {
+            user_id: user_id for user_id in user_ids
+        }
+
+
+def test_users_metadata_fetch_concurrency_is_validated():
+    with raises(ValueError):
+        init(
+            **get_st_init_args(
+                [dashboard.init(users_metadata_fetch_concurrency=0)]
+            )  # type: ignore
+        )
@@ -0,0 +1,187 @@
+# Copyright (c) 2024, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+from typing import Any, Dict, List
+
+import httpx
+import respx
+from pytest import mark, raises
+
+from supertokens_python import init
+from supertokens_python.recipe import session, userroles
+from supertokens_python.recipe.userroles import PermissionClaim
+from supertokens_python.recipe.userroles.asyncio import (
+    create_new_role_or_add_permissions,
+)
+from supertokens_python.recipe.userroles import recipe
+from supertokens_python.recipe.userroles.recipe import UserRolesRecipe
+from supertokens_python.types import RecipeUserId
+from tests.utils import (
+    get_st_init_args,
+    CORE_URL,
+    mock_core_api_version,
+    setup_function_without_core as setup_function,
+    teardown_function_without_core as teardown_function,
+)
+
+_ = setup_function
+_ = teardown_function
+
+pytestmark = mark.asyncio
+
+ROLE_PERMISSIONS: Dict[str, List[str]] = {
+    "admin": ["read", "write", "delete"],
+    "editor": ["read", "write"],
+    "viewer": ["read"],
+}
+
+
+def mock_core(mocker: respx.MockRouter):
+    mock_core_api_version(mocker)
+    mocker.get(f"{CORE_URL}/public/recipe/user/roles").mock(
+        return_value=httpx.Response(
+            200, json={"status": "OK", "roles": list(ROLE_PERMISSIONS.keys())}
+        )
+    )
+    mocker.get(f"{CORE_URL}/recipe/roles").mock(
+        return_value=httpx.Response(
+            200, json={"status": "OK", "roles": list(ROLE_PERMISSIONS.keys())}
+        )
+    )
+    mocker.put(f"{CORE_URL}/recipe/role").mock(
+        return_value=httpx.Response(200, json={"status": "OK", "createdNewRole": False})
+    )
+
+    def permissions_for_role(request: httpx.Request):
+        role = request.url.params["role"]
+        return httpx.Response(
+            200, json={"status": "OK", "permissions": ROLE_PERMISSIONS[role]}
+        )
+
+    return mocker.get(f"{CORE_URL}/recipe/role/permissions").mock(
+        side_effect=permissions_for_role
+    )
+
+
+async def fetch_permissions() -> List[str]:
+    return sorted(
+        await PermissionClaim.fetch_value(  # type: ignore
+            "user1", RecipeUserId("user1"), "public", {}, {}
+        )
+    )
+
+
+async def test_role_permissions_are_cached_and_deduplicated():
+    init(
+        **get_st_init_args(
+            [session.init(), userroles.init(role_permissions_cache_ttl_sec=60)]
+        )
+    )
+
+    with respx.mock(assert_all_called=False) as mocker:
+        permissions_route = mock_core(mocker)
+
+        results = await asyncio.gather(fetch_permissions(), fetch_permissions())
+        assert results == [["delete", "read", "write"]] * 2
+        assert permissions_route.call_count == 3
+
+        await fetch_permissions()
+        assert permissions_route.call_count == 3
+
+        await create_new_role_or_add_permissions("viewer", ["comment"])
+        await fetch_permissions()
+        assert permissions_route.call_count == 4
+
+
+async def test_role_permissions_are_fetched_from_the_core_without_the_cache():
+    init(**get_st_init_args([session.init(), userroles.init()]))
+
+    with respx.mock(assert_all_called=False) as mocker:
+        permissions_route = mock_core(mocker)
+
+        assert await fetch_permissions() == ["delete", "read", "write"]
+        assert await fetch_permissions() == ["delete", "read", "write"]
+        assert permissions_route.call_count == 6
+
+
+async def test_role_permissions_snapshot_is_loaded_in_the_background():
+    init(
+        **get_st_init_args(
+            [
+                session.init(),
+                userroles.init(
+                    role_permissions_cache_ttl_sec=60,
+                    role_permissions_snapshot_refresh_interval_sec=300,
+                ),
+            ]
+        )
+    )
+    recipe_implementation = UserRolesRecipe.get_instance().recipe_implementation
+
+    with respx.mock(assert_all_called=False) as mocker:
+        permissions_route = mock_core(mocker)
+
+        result = await recipe_implementation.get_permissions_for_role("viewer", {})
+        assert result.permissions == ["read"]  # type: ignore
+
+        cache = recipe_implementation.role_permissions_cache  # type: ignore
+        assert cache is not None
+        await cache.snapshot_refresh[asyncio.get_running_loop()]
+        assert not cache.should_refresh_snapshot()
+
+        call_count = permissions_route.call_count
+        await fetch_permissions()
+        assert permissions_route.call_count == call_count
+
+
+async def test_role_permissions_are_fetched_with_bounded_concurrency(
+    monkeypatch: Any,
+):
+    monkeypatch.setattr(recipe, "ROLE_PERMISSIONS_FETCH_CONCURRENCY", 2)
+    init(**get_st_init_args([session.init(), userroles.init()]))
+    roles = [f"role{i}" for i in range(6)]
+    state = {"running": 0, "max_running": 0}
+
+    async def permissions_for_role(request: httpx.Request):
+        state["running"] += 1
+        state["max_running"] = max(state["max_running"], state["running"])
+        await asyncio.sleep(0.01)
+        state["running"] -= 1
+        role = request.url.params["role"]
+        return httpx.Response(200, json={"status": "OK", "permissions": [role]})
+
+    with respx.mock(assert_all_called=False) as mocker:
+        mock_core(mocker)
+        mocker.get(f"{CORE_URL}/public/recipe/user/roles").mock(
+            return_value=httpx.Response(200, json={"status": "OK", "roles": roles})
+        )
+        permissions_route = mocker.get(f"{CORE_URL}/recipe/role/permissions").mock(
+            side_effect=permissions_for_role
+        )
+
+        assert await fetch_permissions() == roles
+        assert permissions_route.call_count == 6
+        assert state["max_running"] == 2
+
+
+def test_snapshot_requires_the_cache():
+    with raises(ValueError):
+        init(
+            **get_st_init_args(
+                [
+                    session.init(),
+                    userroles.init(role_permissions_snapshot_refresh_interval_sec=60),
+                ]
+            )
+        )
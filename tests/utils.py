@@ -24,12 +24,14 @@ from time import sleep
 from typing import Any, Dict, List, Union, cast, Optional
 from urllib.parse import unquote
 
+import respx
 from fastapi.testclient import TestClient
 from requests.models import Response as RequestsResponse
 from httpx import Response as HTTPXResponse
 from yaml import FullLoader, dump, load
 
 from supertokens_python import InputAppInfo, Supertokens, SupertokensConfig
+from supertokens_python.constants import SUPPORTED_CDI_VERSIONS
 from supertokens_python.process_state import ProcessState
 from supertokens_python.recipe.dashboard import DashboardRecipe
 from supertokens_python.recipe.emailpassword import EmailPasswordRecipe
@@ -537,8 +539,10 @@ else:
             return super().__call__(*args, **kwargs)
 
 
+CORE_URL = "http://localhost:3567"
+
 st_init_common_args = {
-    "supertokens_config": SupertokensConfig("http://localhost:3567"),
+    "supertokens_config": SupertokensConfig(CORE_URL),
     "app_info": InputAppInfo(
         app_name="ST",
         api_domain="http://api.supertokens.io",
@@ -554,6 +558,29 @@ def get_st_init_args(recipe_list: List[Any]) -> Dict[str, Any]:
     return {**st_init_common_args, "recipe_list": recipe_list}
 
 
+def setup_function_without_core(_: Any) -> None:
+    reset(stop_core=False)
+
+
+def teardown_function_without_core(_: Any) -> None:
+    reset(stop_core=False)
+
+
+def mock_core_api_version(
+    mocker: respx.MockRouter, pass_through_test_client: bool = False
+) -> None:
+    """
+    Mocks the core routes that every test which mocks the core (at CORE_URL) with
+    respx needs, so the test only has to add the endpoints of its recipes. Set
+    pass_through_test_client if the test also calls the app through a TestClient.
+    """
+    if pass_through_test_client:
+        mocker.route(host="testserver").pass_through()
+    mocker.get(f"{CORE_URL}/apiversion").mock(
+        return_value=HTTPXResponse(200, json={"versions": SUPPORTED_CDI_VERSIONS})
+    )
+
+
 def is_subset(dict1: Any, dict2: Any) -> bool:
     """Check if dict2 is subset of dict1 in a nested manner
     Iteratively compares list items with recursion if key's value is a list